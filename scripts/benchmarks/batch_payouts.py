@@ -0,0 +1,71 @@
+"""Sending many transfers: sequential `autofill().sign().inject()` per group (legacy) versus BatchSender.
+
+The node is simulated by a fixed per-request latency, no network access is needed.
+Both variants inject every group without waiting for inclusion.
+
+    python scripts/benchmarks/batch_payouts.py [num_transfers] [group_size] [latency_ms]
+"""
+import sys
+from time import perf_counter, sleep
+from unittest.mock import MagicMock
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.batch import BatchSender
+from pytezos.operation.content import ContentMixin
+from pytezos.operation.fees import DEFAULT_CONSTANTS
+from pytezos.operation.group import OperationGroup
+
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+DESTINATION = 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'
+
+
+def make_context(latency: float) -> ExecutionContext:
+    def delayed(fn):
+        def wrapper(*args, **kwargs):
+            sleep(latency)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    def run_operation(payload):
+        return {'contents': [{**content, 'metadata': {'operation_result': {'status': 'applied', 'consumed_gas': '1427'}}}
+                             for content in payload['operation']['contents']]}
+
+    shell = MagicMock()
+    block = shell.blocks.__getitem__.return_value
+    block.hash.side_effect = delayed(lambda: BRANCH)
+    block.helpers.scripts.run_operation.post.side_effect = delayed(run_operation)
+    block.context.constants.side_effect = delayed(lambda: DEFAULT_CONSTANTS)
+    shell.head.header.side_effect = delayed(lambda: {'hash': BRANCH, 'level': 100, 'proto': 1, 'predecessor': BRANCH})
+    shell.blocks.side_effect = delayed(lambda length, head: [[BRANCH] * length])
+    shell.contracts.__getitem__.return_value.side_effect = delayed(lambda: {'counter': '10'})
+    shell.mempool.pending_operations.side_effect = delayed(lambda: {})
+    shell.injection.operation.post.side_effect = delayed(lambda operation, _async: 'oo')
+    context = ExecutionContext(shell=shell, key=Key.generate(export=False), chain_id='NetXxkAx4woPLyu',
+                               protocol='PsFLorenaUUuikDWvMDr6fGBRG8kt3e3D3fHoXK1j1BFRxeSH4i')
+    context._sandboxed = False
+    return context
+
+
+def main(num_transfers: int = 2000, group_size: int = 100, latency_ms: int = 20):
+    contents = [ContentMixin().transaction(destination=DESTINATION, amount=i + 1) for i in range(num_transfers)]
+    groups = [contents[i:i + group_size] for i in range(0, num_transfers, group_size)]
+
+    context = make_context(latency_ms / 1000)
+    start = perf_counter()
+    for group in groups:
+        OperationGroup(context=context, contents=group).autofill().sign().inject()
+    legacy = perf_counter() - start
+
+    context = make_context(latency_ms / 1000)
+    start = perf_counter()
+    results = BatchSender(context, max_contents=group_size, max_pending=len(groups)).send(contents)
+    batch = perf_counter() - start
+    assert all(result.status == 'injected' for result in results)
+
+    print(f'{num_transfers} transfers in {len(groups)} groups, {latency_ms} ms per request: '
+          f'sequential {legacy:.2f} s, batch {batch:.2f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
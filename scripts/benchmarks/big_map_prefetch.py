@@ -0,0 +1,41 @@
+"""Reading many big_map entries: one RPC per key (legacy `get` loop) versus concurrent `get_many`.
+
+The node is simulated by a fixed per-request latency, no network access is needed.
+
+    python scripts/benchmarks/big_map_prefetch.py [num_keys] [latency_ms] [concurrency]
+"""
+import sys
+from time import perf_counter, sleep
+from unittest.mock import patch
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.types import BigMapType, NatType
+from pytezos.rpc.query import RpcQuery
+from pytezos.rpc.shell import ShellQuery
+
+
+def main(num_keys: int = 500, latency_ms: int = 20, concurrency: int = 8):
+    def fake_call(query, **params):
+        sleep(latency_ms / 1000)
+        return {'int': '1'}
+
+    keys = [NatType.from_value(i) for i in range(num_keys)]
+    timings = []
+    with patch.object(RpcQuery, '__call__', autospec=True, side_effect=fake_call):
+        for batch in [False, True]:
+            context = ExecutionContext(shell=ShellQuery(None))
+            big_map = BigMapType.create_type(args=[NatType, NatType]).from_python_object(0)
+            big_map.attach_context(context)
+            start = perf_counter()
+            if batch:
+                values = big_map.get_many(keys, concurrency=concurrency)
+            else:
+                values = [big_map.get(key, dup=False) for key in keys]
+            timings.append(perf_counter() - start)
+            assert all(values)
+    print(f'{num_keys} keys, {latency_ms} ms per request: sequential {timings[0]:.2f} s, '
+          f'get_many (concurrency {concurrency}) {timings[1]:.2f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
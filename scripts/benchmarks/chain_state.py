@@ -0,0 +1,83 @@
+"""Building operation groups: branch/chain_id/protocol/constants fetched on every `fill` (legacy) versus ChainState.
+
+The node is simulated by a fixed per-request latency, no network access is needed.
+
+    python scripts/benchmarks/chain_state.py [num_groups] [latency_ms]
+"""
+import sys
+from time import perf_counter, sleep
+from unittest.mock import MagicMock, patch
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.content import ContentMixin
+from pytezos.operation.fees import DEFAULT_CONSTANTS
+from pytezos.operation.group import OperationGroup
+
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+DESTINATION = 'KT1V4jijVy1HfVWde6HBVD1cCygZDtFJK4Xz'
+
+
+@property  # type: ignore
+def legacy_constants(self):
+    return self.shell.block.context.constants()
+
+
+def legacy_get_branch(self, offset: int = 0) -> str:
+    return self.shell.blocks[f'head~{offset}'].hash()
+
+
+def legacy_get_chain_id(self) -> str:
+    return self.chain_id or self.shell.chains.main.chain_id()
+
+
+def legacy_get_protocol(self) -> str:
+    return self.protocol or self.shell.head.header()['protocol']
+
+
+def make_context(latency: float):
+    calls = []
+
+    def delayed(value):
+        def wrapper(*args, **kwargs):
+            calls.append(1)
+            sleep(latency)
+            return value(*args, **kwargs) if callable(value) else value
+        return wrapper
+
+    header = {'hash': BRANCH, 'level': 100, 'proto': 1, 'predecessor': BRANCH, 'protocol': 'PsFLorena', 'chain_id': 'NetXxkAx4woPLyu'}
+    shell = MagicMock()
+    block = shell.blocks.__getitem__.return_value
+    block.hash.side_effect = delayed(BRANCH)
+    block.context.constants.side_effect = delayed(DEFAULT_CONSTANTS)
+    shell.block.context.constants.side_effect = delayed(DEFAULT_CONSTANTS)
+    shell.head.header.side_effect = delayed(header)
+    shell.chains.main.chain_id.side_effect = delayed('NetXxkAx4woPLyu')
+    shell.blocks.side_effect = delayed(lambda length, head: [[BRANCH] * length])
+    context = ExecutionContext(shell=shell, key=Key.generate(export=False))
+    context._sandboxed = False
+    return context, calls
+
+
+def run(num_groups: int, latency: float):
+    context, calls = make_context(latency)
+    content = ContentMixin().transaction(destination=DESTINATION, amount=1)
+    start = perf_counter()
+    for i in range(num_groups):
+        OperationGroup(context=context, contents=[content, content]).fill(counter=i * 2 + 1)
+    return perf_counter() - start, len(calls)
+
+
+def main(num_groups: int = 100, latency_ms: int = 20):
+    with patch.object(ExecutionContext, 'constants', legacy_constants), \
+            patch.object(ExecutionContext, 'get_branch', legacy_get_branch), \
+            patch.object(ExecutionContext, 'get_chain_id', legacy_get_chain_id), \
+            patch.object(ExecutionContext, 'get_protocol', legacy_get_protocol):
+        legacy, legacy_calls = run(num_groups, latency_ms / 1000)
+    current, current_calls = run(num_groups, latency_ms / 1000)
+    print(f'{num_groups} groups, {latency_ms} ms per request: legacy {legacy:.2f} s ({legacy_calls} requests), '
+          f'chain state {current:.2f} s ({current_calls} requests)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""Tree-walking interpreter (tracing disabled) versus code compiled into closures, for repeated execution of the same script.
+
+Program is loaded once, then begin/execute/end is run `num_runs` times, as a simulation service would do.
+
+    python scripts/benchmarks/compiled_code.py [num_runs] [size]
+"""
+import sys
+from os.path import dirname, join
+from time import perf_counter
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.compiler import get_compiled
+from pytezos.michelson.micheline import tracing
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.stack import MichelsonStack
+
+OPCODES_DIR = join(dirname(__file__), '..', '..', 'tests', 'unit_tests', 'test_michelson', 'test_repl', 'opcodes')
+
+
+def make_cases(size: int):
+    return [
+        ('dig_eq.tz', 'Unit', '(Pair 17 16 15 14 13 12 11 10 9 8 7 6 5 4 3 2 1)'),
+        ('dipn.tz', '0', '(Pair (Pair (Pair (Pair 1 2) 3) 4) 5)'),
+        ('list_iter.tz', '0', '{ ' + ' ; '.join(['1'] * size) + ' }'),
+        ('reverse_loop.tz', '{}', '{ ' + ' ; '.join(f'"{i}"' for i in range(size)) + ' }'),
+        ('loop_left.tz', '{}', '{ ' + ' ; '.join(f'"{i}"' for i in range(size)) + ' }'),
+    ]
+
+
+def run_interpreted(program: MichelsonProgram, stack, stdout, context):
+    with tracing(False):
+        program.code.args[0].execute(stack, stdout, context)
+
+
+def run_compiled(program: MichelsonProgram, stack, stdout, context):
+    with tracing(False):
+        get_compiled(program.code.args[0])(stack, stdout, context)
+
+
+def main(num_runs: int = 200, size: int = 100):
+    for filename, storage, parameter in make_cases(size):
+        with open(join(OPCODES_DIR, filename)) as f:
+            script = michelson_to_micheline(f.read())
+        context = ExecutionContext(script=dict(code=script))
+        program = MichelsonProgram.load(context, with_code=True).instantiate(
+            entrypoint='default',
+            parameter=michelson_to_micheline(parameter),
+            storage=michelson_to_micheline(storage),
+        )
+
+        timings = []
+        results = []
+        for execute in [run_interpreted, run_compiled]:
+            elapsed = 0.0
+            for _ in range(num_runs):
+                stack, stdout = MichelsonStack(), []  # type: ignore
+                program.begin(stack, stdout, context)
+                start = perf_counter()
+                execute(program, stack, stdout, context)
+                elapsed += perf_counter() - start
+                _, res, _, _ = program.end(stack, stdout)
+            timings.append(elapsed / num_runs * 1e6)
+            results.append(res)
+
+        assert results[0] == results[1], results
+        print(f'{filename:>16}: interpreted {timings[0]:.0f} us, compiled {timings[1]:.0f} us ({timings[0] / timings[1]:.1f}x)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Counters for concurrent senders sharing one key: head counter + full mempool scan (legacy) versus CounterManager.
+
+Reports duplicate counters handed out and the amount of mempool JSON downloaded; the node is simulated
+(`num_pending` foreign operations in the mempool, 5 ms per request), no network access is needed.
+
+    python scripts/benchmarks/counter_manager.py [num_threads] [num_operations] [num_pending]
+"""
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+
+from pytezos.context.counter import CounterManager
+from pytezos.rpc.shell import ShellQuery
+
+SOURCE = 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'
+
+
+class FakeNode:
+    def __init__(self, num_pending: int):
+        self.uri = ['fake']
+        self.counter = 10
+        self.mempool = {'applied': [{'hash': f'oo{i}', 'contents': [{'kind': 'transaction', 'source': f'tz1{i:033}', 'counter': '1'}]}
+                                    for i in range(num_pending)]}
+        self.downloaded = 0
+        self.lock = Lock()
+
+    def get(self, path, params=None, timeout=None):
+        sleep(0.005)
+        if path.endswith('/counter') or '/contracts/' in path:
+            res = {'counter': str(self.counter)}
+        elif params and params.get('source'):
+            res = {k: [op for op in v if op['contents'][0]['source'] == params['source']] for k, v in self.mempool.items()}
+        else:
+            res = self.mempool
+        with self.lock:
+            self.downloaded += len(json.dumps(res))
+        return res
+
+    def inject(self, counter):
+        with self.lock:
+            self.mempool['applied'].append({'hash': 'oo', 'contents': [{'kind': 'transaction', 'source': SOURCE, 'counter': str(counter)}]})
+
+
+def legacy_counter(shell: ShellQuery) -> int:
+    counter = int(shell.contracts[SOURCE]()['counter']) + 1
+    offset = sum(1 for op in shell.mempool.pending_operations.flatten() for c in op['contents'] if c.get('source') == SOURCE)
+    return counter + offset
+
+
+def run(num_threads: int, num_operations: int, num_pending: int, legacy: bool):
+    node = FakeNode(num_pending)
+    shell = ShellQuery(node)
+    manager = CounterManager(shell, SOURCE)
+
+    def send(_):
+        counter = legacy_counter(shell) if legacy else manager.reserve()
+        node.inject(counter)
+        if not legacy:
+            manager.confirm(counter)
+        return counter
+
+    with ThreadPoolExecutor(num_threads) as executor:
+        counters = list(executor.map(send, range(num_operations)))
+    return len(counters) - len(set(counters)), node.downloaded
+
+
+def main(num_threads: int = 8, num_operations: int = 200, num_pending: int = 2000):
+    for legacy in [True, False]:
+        duplicates, downloaded = run(num_threads, num_operations, num_pending, legacy)
+        print(f'{"legacy" if legacy else "manager":>8}: {duplicates} duplicate counters of {num_operations}, '
+              f'{downloaded / 2 ** 20:.1f} MiB downloaded')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
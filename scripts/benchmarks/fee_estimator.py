@@ -0,0 +1,74 @@
+"""Repeated calls of the same contract entrypoint: `autofill()` with `run_operation` every time (legacy) versus HistoryEstimator.
+
+The node is simulated by a fixed per-request latency, no network access is needed.
+Reports time and number of simulations, and checks that estimated limits cover the actual consumption.
+
+    python scripts/benchmarks/fee_estimator.py [num_calls] [latency_ms]
+"""
+import sys
+from random import randint
+from time import perf_counter, sleep
+from typing import Optional
+from unittest.mock import MagicMock
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.content import ContentMixin
+from pytezos.operation.estimator import HistoryEstimator
+from pytezos.operation.fees import DEFAULT_CONSTANTS
+from pytezos.operation.group import OperationGroup
+
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+CONTRACT = 'KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL'
+
+
+def consumed_gas(content) -> int:
+    return 2500 + int(content['parameters']['value']['int']) % 100  # slightly depends on the argument
+
+
+def make_context(latency: float) -> ExecutionContext:
+    def delayed(fn):
+        def wrapper(*args, **kwargs):
+            sleep(latency)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    def run_operation(payload):
+        return {'contents': [{**content, 'metadata': {'operation_result': {'status': 'applied', 'consumed_gas': str(consumed_gas(content)),
+                                                                           'paid_storage_size_diff': '67'}}}
+                             for content in payload['operation']['contents']]}
+
+    shell = MagicMock()
+    block = shell.blocks.__getitem__.return_value
+    block.helpers.scripts.run_operation.post.side_effect = delayed(run_operation)
+    block.context.constants.side_effect = delayed(lambda: DEFAULT_CONSTANTS)
+    shell.head.header.side_effect = delayed(lambda: {'hash': BRANCH, 'level': 100, 'proto': 1, 'predecessor': BRANCH})
+    shell.blocks.side_effect = delayed(lambda length, head: [[BRANCH] * length])
+    shell.contracts.__getitem__.return_value.side_effect = delayed(lambda: {'counter': '10'})
+    shell.mempool.pending_operations.by_source.side_effect = delayed(lambda source, statuses: [])
+    context = ExecutionContext(shell=shell, key=Key.generate(export=False), chain_id='NetXxkAx4woPLyu',
+                               protocol='PsFLorenaUUuikDWvMDr6fGBRG8kt3e3D3fHoXK1j1BFRxeSH4i')
+    context._sandboxed = False
+    return context
+
+
+def run(num_calls: int, latency: float, estimator: Optional[HistoryEstimator]):
+    context = make_context(latency)
+    start = perf_counter()
+    for _ in range(num_calls):
+        content = ContentMixin().transaction(destination=CONTRACT, amount=0,
+                                             parameters={'entrypoint': 'mint', 'value': {'int': str(randint(1000, 9999))}})
+        opg = OperationGroup(context=context, contents=[content]).autofill(gas_reserve=0, estimator=estimator)
+        assert int(opg.contents[0]['gas_limit']) >= consumed_gas(opg.contents[0])
+    run_operation = context.shell.blocks.__getitem__.return_value.helpers.scripts.run_operation.post
+    return perf_counter() - start, run_operation.call_count
+
+
+def main(num_calls: int = 500, latency_ms: int = 20):
+    for estimator in [None, HistoryEstimator()]:
+        duration, simulations = run(num_calls, latency_ms / 1000, estimator)
+        print(f'{"estimator" if estimator else "legacy":>9}: {num_calls} calls in {duration:.2f} s, {simulations} simulations')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Throughput of forge_micheline / forge_script on the mainnet scripts from `tests/contract_tests`.
+
+Compares the current bytearray encoder against the former implementation joining per-node byte strings,
+and checks that both produce identical output.
+
+    python scripts/benchmarks/forge_micheline.py [num_rounds]
+"""
+import json
+import sys
+from glob import glob
+from os.path import dirname, join
+from timeit import timeit
+from typing import Dict, List, Union
+
+from pytezos.michelson.forge import forge_array, forge_int, forge_script, get_tag
+from pytezos.michelson.tags import prim_tags
+
+CONTRACTS_DIR = join(dirname(__file__), '..', '..', 'tests', 'contract_tests')
+
+
+def legacy_forge_micheline(data: Union[List, Dict]) -> bytes:
+    """Reproduces the previous implementation for comparison."""
+    res = []
+
+    if isinstance(data, list):
+        res.append(b'\x02')
+        res.append(forge_array(b''.join(map(legacy_forge_micheline, data))))
+
+    elif isinstance(data, dict):
+        if data.get('prim'):
+            args_len = len(data.get('args', []))
+            annots_len = len(data.get('annots', []))
+
+            res.append(get_tag(args_len, annots_len))
+            res.append(prim_tags[data['prim']])
+
+            if args_len > 0:
+                args = b''.join(map(legacy_forge_micheline, data['args']))
+                if args_len < 3:
+                    res.append(args)
+                else:
+                    res.append(forge_array(args))
+
+            if annots_len > 0:
+                res.append(forge_array(' '.join(data['annots']).encode()))
+            elif args_len >= 3:
+                res.append(b'\x00' * 4)
+
+        elif data.get('bytes') is not None:
+            res.append(b'\x0A')
+            res.append(forge_array(bytes.fromhex(data['bytes'])))
+
+        elif data.get('int') is not None:
+            res.append(b'\x00')
+            res.append(forge_int(int(data['int'])))
+
+        elif data.get('string') is not None:
+            res.append(b'\x01')
+            res.append(forge_array(data['string'].encode()))
+
+    return b''.join(res)
+
+
+def legacy_forge_script(script) -> bytes:
+    return forge_array(legacy_forge_micheline(script['code'])) + forge_array(legacy_forge_micheline(script['storage']))
+
+
+def load_scripts():
+    scripts = []
+    for filename in sorted(glob(join(CONTRACTS_DIR, '*', '__script__.json'))):
+        with open(filename) as f:
+            scripts.append(json.load(f))
+    return scripts
+
+
+def main(num_rounds: int = 5):
+    scripts = load_scripts()
+    size = sum(len(forge_script(script)) for script in scripts)
+    assert all(forge_script(x) == legacy_forge_script(x) for x in scripts), 'output mismatch'
+    print(f'{len(scripts)} scripts, {size / 1024 / 1024:.2f} MiB forged')
+    for name, fn in [('legacy', legacy_forge_script), ('buffer', forge_script)]:
+        elapsed = timeit(lambda: [fn(script) for script in scripts], number=num_rounds)
+        print(f'{name:>8}: {size * num_rounds / elapsed / 1024 / 1024:.2f} MiB/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
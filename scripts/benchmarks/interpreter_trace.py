@@ -0,0 +1,45 @@
+"""Interpreter.run_code with the execution trace (default, used by the REPL and Jupyter kernel) versus without it.
+
+Runs a few repl opcode scripts on large collections, where formatting stdout means repr() of whole maps and lists.
+
+    python scripts/benchmarks/interpreter_trace.py [num_rounds] [size]
+"""
+import sys
+from os.path import dirname, join
+from timeit import timeit
+
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.repl import Interpreter
+
+OPCODES_DIR = join(dirname(__file__), '..', '..', 'tests', 'unit_tests', 'test_michelson', 'test_repl', 'opcodes')
+
+
+def make_cases(size: int):
+    return [
+        ('map_map.tz', '{ ' + ' ; '.join(f'Elt "{i:08}" {i}' for i in range(size)) + ' }', '10'),
+        ('list_iter.tz', '0', '{ ' + ' ; '.join(['1'] * size) + ' }'),
+        ('set_iter.tz', '0', '{ ' + ' ; '.join(str(i) for i in range(size)) + ' }'),
+        ('reverse_loop.tz', '{}', '{ ' + ' ; '.join(f'"{i}"' for i in range(size)) + ' }'),
+    ]
+
+
+def main(num_rounds: int = 3, size: int = 500):
+    cases = []
+    for filename, storage, parameter in make_cases(size):
+        with open(join(OPCODES_DIR, filename)) as f:
+            cases.append((filename, michelson_to_micheline(f.read()), michelson_to_micheline(storage), michelson_to_micheline(parameter)))
+
+    for filename, script, storage, parameter in cases:
+        timings = []
+        for trace in [True, False]:
+            def run():
+                _, _, _, _, error = Interpreter.run_code(parameter=parameter, storage=storage, script=script, trace=trace)
+                assert error is None, error
+
+            run()  # warm up type cache
+            timings.append(timeit(run, number=num_rounds) / num_rounds * 1000)
+        print(f'{filename:>16} ({size} items): trace {timings[0]:.1f} ms, no trace {timings[1]:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,38 @@
+"""Cost of parsing Michelson source with a fresh parser per call versus the shared per-thread parser.
+
+Parses every script in `tests/unit_tests/test_michelson/test_repl/opcodes` and a handful of small expressions.
+
+    python scripts/benchmarks/michelson_parser.py [num_rounds]
+"""
+import sys
+from glob import glob
+from os.path import dirname, join
+from timeit import timeit
+
+from pytezos.michelson.parse import MichelsonParser, michelson_to_micheline
+
+OPCODES_DIR = join(dirname(__file__), '..', '..', 'tests', 'unit_tests', 'test_michelson', 'test_repl', 'opcodes')
+EXPRESSIONS = ['Unit', '(Pair 1 "foo")', '{ Elt "a" 0x00 ; Elt "b" 0x01 }', 'pair (nat %amount) (address %to)', 'Left (Some 42)']
+
+
+def load_scripts():
+    scripts = []
+    for filename in sorted(glob(join(OPCODES_DIR, '*.tz'))):
+        with open(filename) as f:
+            scripts.append(f.read())
+    return scripts
+
+
+def main(num_rounds: int = 3):
+    for name, sources in [('opcodes', load_scripts()), ('small', EXPRESSIONS * 20)]:
+        print(f'{name}: {len(sources)} sources')
+        for mode, parse in [
+            ('fresh', lambda x: michelson_to_micheline(x, parser=MichelsonParser())),
+            ('cached', michelson_to_micheline),
+        ]:
+            elapsed = timeit(lambda: [parse(source) for source in sources], number=num_rounds)
+            print(f'{mode:>8}: {elapsed / num_rounds / len(sources) * 1e6:.1f} us per source')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,112 @@
+"""MichelsonStack on DIG/DUG/DIP-heavy code: the repl opcode tests, a synthetic script with a deep stack,
+and raw stack operations under DIP protection (interpreter overhead excluded).
+
+Compares the current stack (top at the end of the list, protected items in separate frames) against the former
+implementation (top at the front, every push/pop shifting the whole list).
+
+    python scripts/benchmarks/michelson_stack.py [num_rounds] [depth]
+"""
+import sys
+from os.path import dirname, join
+from timeit import timeit
+from typing import List, Optional
+from unittest.mock import patch
+
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.stack import MichelsonStack
+
+OPCODES_DIR = join(dirname(__file__), '..', '..', 'tests', 'unit_tests', 'test_michelson', 'test_repl', 'opcodes')
+OPCODES = [
+    ('dign.tz', '0', '(Pair (Pair (Pair (Pair 1 2) 3) 4) 5)'),
+    ('dugn.tz', '0', '(Pair (Pair (Pair (Pair 1 2) 3) 4) 5)'),
+    ('dipn.tz', '0', '(Pair (Pair (Pair (Pair 1 2) 3) 4) 5)'),
+    ('dig_eq.tz', 'Unit', '(Pair 17 16 15 14 13 12 11 10 9 8 7 6 5 4 3 2 1)'),
+]
+
+
+class LegacyMichelsonStack:
+    """Reproduces the previous implementation for comparison."""
+
+    def __init__(self, items: Optional[List] = None) -> None:
+        self.items = items or []
+        self.protected = 0
+
+    @classmethod
+    def from_items(cls, items: List) -> 'LegacyMichelsonStack':
+        return cls(items)
+
+    def protect(self, count: int) -> None:
+        self.protected += count
+
+    def restore(self, count: int) -> None:
+        self.protected -= count
+
+    def push(self, item):
+        self.items.insert(self.protected, item)
+
+    def peek(self):
+        return self.items[self.protected]
+
+    def pop(self, count: int) -> List:
+        return [self.items.pop(self.protected) for _ in range(count)]
+
+    def pop1(self):
+        (a,) = self.pop(count=1)
+        return a
+
+    def pop2(self):
+        a, b = self.pop(count=2)
+        return a, b
+
+    def pop3(self):
+        a, b, c = self.pop(count=3)
+        return a, b, c
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def make_deep_script(depth: int) -> str:
+    dig_dug = ' '.join(f'DIG {i} ; DUG {i} ;' for i in range(0, depth, 7))
+    dip = ' '.join(f'DIP {i} {{ PUSH nat {i} ; DROP }} ;' for i in range(1, depth, 7))
+    return f'''parameter unit; storage nat;
+    code {{ CDR ; {"DUP ; " * depth} {dig_dug} {dip} DROP {depth} ; NIL operation ; PAIR }}'''
+
+
+def run_stack_ops(stack_class, depth: int, num_ops: int = 10000):
+    stack = stack_class([None] * depth)
+    stack.protect(depth // 2)
+    for _ in range(num_ops):
+        stack.push(stack.peek())
+        a, b = stack.pop2()
+        stack.push(a)
+    stack.restore(depth // 2)
+
+
+def run_all(scripts):
+    for script, storage, parameter in scripts:
+        _, _, _, _, error = Interpreter.run_code(parameter=parameter, storage=storage, script=script)
+        assert error is None, error
+
+
+def main(num_rounds: int = 20, depth: int = 500):
+    scripts = []
+    for filename, storage, parameter in OPCODES:
+        with open(join(OPCODES_DIR, filename)) as f:
+            scripts.append((michelson_to_micheline(f.read()), michelson_to_micheline(storage), michelson_to_micheline(parameter)))
+    deep = [(michelson_to_micheline(make_deep_script(depth)), {'int': '42'}, {'prim': 'Unit'})]
+
+    for name, stack_class in [('legacy', LegacyMichelsonStack), ('current', MichelsonStack)]:
+        with patch('pytezos.michelson.repl.MichelsonStack', stack_class):
+            run_all(scripts + deep)  # warm up type cache
+            opcodes = timeit(lambda: run_all(scripts), number=num_rounds)
+            deep_stack = timeit(lambda: run_all(deep), number=num_rounds)
+        stack_ops = timeit(lambda: run_stack_ops(stack_class, depth * 10), number=num_rounds)
+        print(f'{name:>8}: opcodes {opcodes / num_rounds * 1000:.2f} ms, '
+              f'script at depth {depth} {deep_stack / num_rounds * 1000:.2f} ms, '
+              f'10k ops at depth {depth * 10} {stack_ops / num_rounds * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
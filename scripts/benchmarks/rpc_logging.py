@@ -0,0 +1,57 @@
+"""Per-call overhead of RpcNode request/response handling with DEBUG logging disabled.
+
+Compares current lazy logging against the former eager `json.dumps(..., indent=4)` calls on a synthetic
+multi-megabyte response, without touching the network.
+
+    python scripts/benchmarks/rpc_logging.py [num_calls]
+"""
+import json
+import sys
+from pprint import pformat
+from timeit import timeit
+
+import requests
+
+from pytezos.logging import logger
+from pytezos.rpc.node import RpcNode
+
+
+def make_payload(size=20000):
+    return [{'key': {'int': str(i)}, 'value': {'prim': 'Pair', 'args': [{'string': f'tz1{i:033}'}, {'int': str(i * 10)}]}} for i in range(size)]
+
+
+class FakeSession:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def request(self, method, url, **kwargs):
+        res = requests.Response()
+        res.status_code = 200
+        res._content = self.body
+        res.headers['content-type'] = 'application/json'
+        return res
+
+
+class EagerRpcNode(RpcNode):
+    """Reproduces the previous implementation for comparison."""
+
+    def get(self, path, params=None, timeout=None):
+        logger.debug('>>>>> %s %s\n%s', 'GET', path, json.dumps(dict(params=params, timeout=timeout), indent=4))
+        res = self.session.request(method='GET', url=path, params=params, timeout=timeout)
+        if res.status_code != 200:
+            logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
+        logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
+        return res.json()
+
+
+def main(num_calls: int = 20):
+    body = json.dumps(make_payload()).encode()
+    print(f'Response size: {len(body) / 1024 / 1024:.2f} MiB, DEBUG enabled: {logger.isEnabledFor(10)}')
+    for name, node_class in [('eager', EagerRpcNode), ('lazy', RpcNode)]:
+        node = node_class('http://localhost', session=FakeSession(body))
+        elapsed = timeit(lambda: node.get('chains/main/blocks/head/context/big_maps/0'), number=num_calls)
+        print(f'{name:>6}: {elapsed / num_calls * 1000:.2f} ms per call')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
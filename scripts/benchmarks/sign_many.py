@@ -0,0 +1,33 @@
+"""Signing many operation-sized messages per curve: `Key.sign` in a loop without cached key objects (legacy)
+versus `Key.sign_many` (cached key objects, threads or process pool depending on the curve and batch size).
+
+    python scripts/benchmarks/sign_many.py [num_messages] [message_size] [max_workers]
+"""
+import os
+import sys
+from time import perf_counter
+
+from pytezos.crypto.key import Key
+
+
+def main(num_messages: int = 2000, message_size: int = 200, max_workers: int = 0):
+    messages = [os.urandom(message_size) for _ in range(num_messages)]
+    print(f'{num_messages} messages of {message_size} bytes, {max_workers or os.cpu_count()} workers')
+    for curve in [b'ed', b'sp', b'p2']:
+        key = Key.generate(curve=curve, export=False)
+
+        start = perf_counter()
+        for message in messages:
+            Key(public_point=key.public_point, secret_exponent=key.secret_exponent, curve=curve).sign(message)
+        legacy = perf_counter() - start
+
+        start = perf_counter()
+        key.sign_many(messages, max_workers=max_workers or None)
+        batch = perf_counter() - start
+
+        print(f'{curve.decode()}: loop {legacy:.2f} s ({num_messages / legacy:.0f}/s), '
+              f'sign_many {batch:.2f} s ({num_messages / batch:.0f}/s)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
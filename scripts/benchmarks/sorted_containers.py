@@ -0,0 +1,116 @@
+"""Michelson map/set/big_map updates: legacy sorted lists versus persistent sorted trees.
+
+Inserts `size` keys one by one (as a contract doing UPDATE inside ITER would), then looks every key up.
+
+    python scripts/benchmarks/sorted_containers.py [size]
+"""
+import sys
+from copy import copy
+from time import perf_counter
+from unittest.mock import patch
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.types import BigMapType, MapType, NatType, SetType
+from pytezos.michelson.types.base import Undefined
+
+
+def legacy_map_update(self, key, val):
+    prev_val = self.get(key, dup=False)
+    if prev_val is not None:
+        if val is not None:
+            items = [(k, v if k != key else val) for k, v in self.items]
+        else:
+            items = [(k, v) for k, v in self.items if k != key]
+    else:
+        if val is not None:
+            items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
+        else:
+            items = self.items
+    return prev_val, type(self)(items)
+
+
+def legacy_map_get(self, key, dup=True):
+    return next((v for k, v in self.items if k == key), None)
+
+
+def legacy_big_map_get(self, key, dup=True):
+    val = next((v for k, v in self if k == key), Undefined)
+    if val is Undefined:
+        val_expr = self.context.get_big_map_value(self.ptr, forge_script_expr(key.pack(legacy=True)))
+        return None if val_expr is None else self.args[1].from_micheline_value(val_expr)
+    return val
+
+
+def legacy_big_map_update(self, key, val):
+    removed_keys = set(self.removed_keys)
+    prev_val = self.get(key, dup=False)
+    if prev_val is not None:
+        if val is not None:
+            items = [(k, v if k != key else val) for k, v in self]
+        else:
+            items = [(k, v) for k, v in self if k != key]
+            removed_keys.add(key)
+    else:
+        if val is not None:
+            items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
+            if key in removed_keys:
+                removed_keys.remove(key)
+        else:
+            items = self.items
+    res = type(self)(items=items, ptr=self.ptr, removed_keys=list(removed_keys))
+    res.context = self.context
+    return prev_val, res
+
+
+def legacy_set_add(self, item):
+    if item in self.items:
+        return copy(self)
+    return type(self)(list(sorted([item] + self.items)))
+
+
+def legacy_set_contains(self, item):
+    return item in self.items
+
+
+def run(size: int):
+    keys = [NatType.from_value((i * 7919) % size) for i in range(size)]
+    val = NatType.from_value(1)
+    res = {}
+
+    start = perf_counter()
+    map_ = MapType.create_type(args=[NatType, NatType])([])
+    for key in keys:
+        _, map_ = map_.update(key, val)
+    assert all(map_.get(key, dup=False) is not None for key in keys)
+    res['map'] = perf_counter() - start
+
+    start = perf_counter()
+    big_map = BigMapType.create_type(args=[NatType, NatType])([])
+    big_map.attach_context(ExecutionContext())
+    for key in keys:
+        _, big_map = big_map.update(key, val)
+    assert all(big_map.get(key, dup=False) is not None for key in keys)
+    res['big_map'] = perf_counter() - start
+
+    start = perf_counter()
+    set_ = SetType.create_type(args=[NatType])([])
+    for key in keys:
+        set_ = set_.add(key)
+    assert all(set_.contains(key) for key in keys)
+    res['set'] = perf_counter() - start
+    return res
+
+
+def main(size: int = 2000):
+    current = run(size)
+    with patch.object(MapType, 'update', legacy_map_update), patch.object(MapType, 'get', legacy_map_get), \
+            patch.object(BigMapType, 'update', legacy_big_map_update), patch.object(BigMapType, 'get', legacy_big_map_get), \
+            patch.object(SetType, 'add', legacy_set_add), patch.object(SetType, 'contains', legacy_set_contains):
+        legacy = run(size)
+    for name in current:
+        print(f'{name:>8} ({size} keys): legacy {legacy[name] * 1000:.0f} ms, persistent {current[name] * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
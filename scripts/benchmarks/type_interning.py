@@ -0,0 +1,47 @@
+"""Time and memory spent on building Michelson type classes for every script in `tests/contract_tests`.
+
+Each script is loaded several times, as happens when the same contract is called repeatedly.
+
+    python scripts/benchmarks/type_interning.py [num_rounds]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+from glob import glob
+from os.path import dirname, join
+from time import perf_counter
+
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.types.base import MichelsonType
+
+CONTRACTS_DIR = join(dirname(__file__), '..', '..', 'tests', 'contract_tests')
+
+
+def count_type_classes(root=MichelsonType) -> int:
+    return sum(1 + count_type_classes(sub) for sub in root.__subclasses__())
+
+
+def main(num_rounds: int = 5):
+    scripts = []
+    for filename in sorted(glob(join(CONTRACTS_DIR, '*', '__script__.json'))):
+        with open(filename) as f:
+            scripts.append(json.load(f)['code'])
+
+    gc.collect()
+    classes_before = count_type_classes()
+    tracemalloc.start()
+    started_at = perf_counter()
+    programs = [MichelsonProgram.match(code) for _ in range(num_rounds) for code in scripts]
+    elapsed = perf_counter() - started_at
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{len(scripts)} scripts x {num_rounds} rounds: {elapsed:.2f} s')
+    print(f'memory retained: {current / 1024 / 1024:.1f} MiB, peak: {peak / 1024 / 1024:.1f} MiB')
+    print(f'type classes created: {count_type_classes() - classes_before}')
+    return programs
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
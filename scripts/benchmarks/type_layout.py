@@ -0,0 +1,51 @@
+"""Field access by name on a nested pair: layout rebuilt on every call (legacy) versus cached per type class.
+
+    python scripts/benchmarks/type_layout.py [num_fields] [num_lookups]
+"""
+import sys
+from time import perf_counter
+from unittest.mock import patch
+
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types.adt import ADTMixin, get_type_layout
+
+
+@classmethod  # type: ignore
+def legacy_get_type_layout(cls, infer_names: bool = False, entrypoints: bool = False):
+    flat_args = list(cls.iter_type_args(entrypoints=entrypoints))
+    return get_type_layout(flat_args, infer_names=infer_names, entrypoints=entrypoints)
+
+
+def legacy_get_value(self, key):
+    path_to_key, key_to_path, idx_to_path = self.get_type_layout()
+    path = key_to_path[key] if isinstance(key, str) else idx_to_path[key]
+    return next(v for p, v in self.iter_values() if p == path)
+
+
+def make_type(num_fields: int):
+    fields = [{'prim': 'nat', 'annots': [f'%f{i}']} for i in range(num_fields)]
+    expr = fields[-1]
+    for field in reversed(fields[:-1]):
+        expr = {'prim': 'pair', 'args': [field, expr]}
+    return MichelsonType.match(expr)
+
+
+def run(value, names) -> float:
+    start = perf_counter()
+    for name in names:
+        value[name]
+    return perf_counter() - start
+
+
+def main(num_fields: int = 20, num_lookups: int = 20000):
+    ty = make_type(num_fields)
+    value = ty.from_python_object({f'f{i}': i for i in range(num_fields)})
+    names = [f'f{i % num_fields}' for i in range(num_lookups)]
+    current = run(value, names)
+    with patch.object(ADTMixin, 'get_type_layout', legacy_get_type_layout), patch.object(ADTMixin, 'get_value', legacy_get_value):
+        legacy = run(value, names)
+    print(f'{num_lookups} lookups on {num_fields}-field pair: legacy {legacy * 1000:.0f} ms, cached {current * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
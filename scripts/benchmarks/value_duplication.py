@@ -0,0 +1,78 @@
+"""DUP via deepcopy (legacy) versus structural sharing, on mainnet operations from tests/contract_tests.
+
+Each operation is re-executed with Interpreter.run_code starting from the storage recorded after it was applied,
+so most of the time is spent on the storage-heavy contracts; operations failing in either mode
+(e.g. those needing big_map values from the network) are skipped.
+
+    python scripts/benchmarks/value_duplication.py [num_rounds] [num_contracts (largest first, 0 for all)]
+"""
+import json
+import sys
+from copy import deepcopy
+from glob import glob
+from os.path import dirname, getsize, join
+from time import perf_counter
+from unittest.mock import patch
+
+from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.michelson.types.big_map import BigMapType
+
+CONTRACTS_DIR = join(dirname(__file__), '..', '..', 'tests', 'contract_tests')
+
+
+def legacy_duplicate(self):
+    assert self.is_duplicable(), f'{self.prim} is not duplicable'
+    return deepcopy(self)
+
+
+def legacy_big_map_duplicate(self):
+    res = type(self)(items=deepcopy(self.items), ptr=self.ptr, removed_keys=deepcopy(self.removed_keys))
+    res.context = self.context
+    return res
+
+
+def load_operations(num_contracts: int):
+    scripts = sorted(glob(join(CONTRACTS_DIR, '*', '__script__.json')), key=getsize, reverse=True)
+    for path in scripts[:num_contracts or None]:
+        with open(path) as f:
+            code = json.load(f)['code']
+        for op_path in glob(join(dirname(path), '*.json')):
+            if op_path.endswith('__.json'):
+                continue
+            with open(op_path) as f:
+                operation = json.load(f)
+            yield dirname(path)[-36:], code, operation
+
+
+def run(code, operation) -> bool:
+    parameters = operation.get('parameters', {})
+    try:
+        *_, error = Interpreter.run_code(
+            parameter=parameters.get('value', {'prim': 'Unit'}),
+            entrypoint=parameters.get('entrypoint', 'default'),
+            storage=operation['storage'],
+            script=code,
+            trace=False,
+        )
+    except Exception as e:
+        error = e
+    return error is None
+
+
+def main(num_rounds: int = 3, num_contracts: int = 0):
+    operations = [x for x in load_operations(num_contracts) if run(x[1], x[2])]
+    timings = []
+    for legacy in [True, False]:
+        with patch.object(MichelsonType, 'duplicate', legacy_duplicate) if legacy else patch.dict({}), \
+                patch.object(BigMapType, 'duplicate', legacy_big_map_duplicate) if legacy else patch.dict({}):
+            start = perf_counter()
+            for _ in range(num_rounds):
+                for _, code, operation in operations:
+                    assert run(code, operation)
+            timings.append((perf_counter() - start) / num_rounds * 1000)
+    print(f'{len(operations)} operations: deepcopy {timings[0]:.0f} ms, shared {timings[1]:.0f} ms')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,40 @@
+"""Memory held by a decoded `map nat (pair nat bytes)` storage, e.g. a token ledger.
+
+Reports the size of the decoded value as measured by tracemalloc (the Micheline expression is freed before).
+
+    python scripts/benchmarks/value_memory.py [num_entries]
+"""
+import sys
+import tracemalloc
+from time import perf_counter
+
+from pytezos.michelson.types import MichelsonType
+
+
+def make_storage(size: int):
+    return [
+        {'prim': 'Elt', 'args': [{'int': str(i)}, {'prim': 'Pair', 'args': [{'int': str(i * 1000)}, {'bytes': f'{i:08x}'}]}]}
+        for i in range(size)
+    ]
+
+
+def main(size: int = 1_000_000):
+    ty = MichelsonType.match({'prim': 'map', 'args': [{'prim': 'nat'}, {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'bytes'}]}]})
+    ty.from_micheline_value(make_storage(1))  # warm up type caches
+
+    tracemalloc.start()
+    val_expr = make_storage(size)
+    start = perf_counter()
+    value = ty.from_micheline_value(val_expr)
+    elapsed = perf_counter() - start
+    del val_expr
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(value) == size
+    print(f'{size} entries: {current / 2 ** 20:.0f} MiB ({current / size:.0f} bytes per entry), '
+          f'peak {peak / 2 ** 20:.0f} MiB, decoded in {elapsed:.1f} s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
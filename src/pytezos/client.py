@@ -9,6 +9,7 @@ from pytezos.contract.interface import ContractInterface
 from pytezos.crypto.key import Key
 from pytezos.jupyter import get_class_docstring, is_interactive
 from pytezos.logging import logger
+from pytezos.operation.batch import BatchSender
 from pytezos.operation.content import ContentMixin
 from pytezos.operation.group import OperationGroup
 from pytezos.operation.result import OperationResult
@@ -88,6 +89,21 @@ class PyTezosClient(ContextMixin, ContentMixin):
                 contents.append({k: reset_fields.get(k, v) for k, v in content.items()})
         return OperationGroup(context=self._spawn_context(), contents=contents)
 
+    def batch_sender(self, **kwargs) -> BatchSender:
+        """Create a sender for a large number of operations (e.g. payouts) that do not fit in a single operation group.
+
+        .. code-block:: python
+
+            results = pytezos.batch_sender(max_contents=200).send([
+                pytezos.transaction(destination=address, amount=amount)
+                for address, amount in payouts
+            ])
+
+        :param kwargs: see :class:`pytezos.operation.batch.BatchSender`
+        :rtype: BatchSender
+        """
+        return BatchSender(context=self._spawn_context(), **kwargs)
+
     def account(self, account_id=None) -> dict:
         """Shortcut for RPC contract request.
 
@@ -203,6 +219,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         time_between_blocks: Optional[int] = None,
         prev_hash: Optional[str] = None,
         block_timeout: Optional[int] = None,
+        stream: bool = False,
     ) -> List[dict]:
         """Wait for multiple injected operations get enough confirmations
 
@@ -211,6 +228,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         :param time_between_blocks: override the corresponding parameter from constants
         :param prev_hash: Current block hash (optional). If not set, current head is used.
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param stream: subscribe to new heads instead of polling (one stream is shared by all waiters)
         """
         if len(operation_groups) == 0:
             raise ValueError('At least one operation group has to be passed to the args')
@@ -228,6 +246,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
             current_block_hash=prev_hash,
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
+            stream=stream,
         )
 
     def sleep(self, num_blocks: int, time_between_blocks: Optional[int] = None, block_timeout: Optional[int] = None) -> List[str]:
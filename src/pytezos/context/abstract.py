@@ -1,4 +1,4 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from pyblake2 import blake2b  # type: ignore
 
@@ -144,6 +144,9 @@ class AbstractContext:
     def get_big_map_value(self, ptr: int, key_hash: str):
         raise NotImplementedError
 
+    def get_big_map_values(self, ptr: int, key_hashes: List[str], concurrency: Optional[int] = None) -> List[Optional[dict]]:
+        raise NotImplementedError
+
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
 
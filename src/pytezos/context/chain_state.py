@@ -0,0 +1,139 @@
+from threading import Lock, RLock
+from time import monotonic
+from typing import Any, Dict, Optional
+
+from pytezos.logging import logger
+from pytezos.operation import MAX_OPERATIONS_TTL
+from pytezos.rpc.shell import HeadMonitor, ShellQuery
+
+CHAIN_STATE_TTL = 5
+
+
+class ChainState:
+    """Head-related data shared by all contexts using the same node: chain ID, protocol, constants,
+    and hashes of the recent blocks (branch candidates).
+
+    The head is re-read at most once per `ttl` seconds, or on every new head received by the shared head monitor
+    if subscribed. Protocol and constants are re-fetched only when the protocol changes.
+    """
+
+    _instances: Dict[str, 'ChainState'] = {}
+    _instances_lock = Lock()
+
+    def __init__(self, shell: ShellQuery, ttl: float = CHAIN_STATE_TTL) -> None:
+        """
+        :param shell: shell query for the node
+        :param ttl: seconds between head polls (when not subscribed to the head monitor)
+        """
+        self.shell = shell
+        self.ttl = ttl
+        self._lock = RLock()
+        self._monitor: Optional[HeadMonitor] = None
+        self._head: Optional[Dict[str, Any]] = None  # shell header with hash
+        self._synced_at = 0.0
+        self._hashes: Dict[int, str] = {}  # level -> block hash, for the current branch only
+        self._chain_id: Optional[str] = None
+        self._protocol: Optional[str] = None
+        self._constants: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def get(cls, shell: ShellQuery) -> 'ChainState':
+        """Get chain state shared by all contexts using the same node (address).
+
+        :param shell: shell query for the node
+        """
+        key = str(shell.node.uri)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(shell)
+            return cls._instances[key]
+
+    def subscribe(self) -> None:
+        """Follow new heads through the shared `/monitor/heads` stream instead of polling."""
+        with self._lock:
+            if self._monitor is None:
+                self._monitor = HeadMonitor.get(self.shell.node)
+                self._monitor.subscribe()
+
+    def unsubscribe(self) -> None:
+        with self._lock:
+            if self._monitor is not None:
+                self._monitor.unsubscribe()
+                self._monitor = None
+
+    def invalidate(self) -> None:
+        """Drop everything, next access will re-fetch the state."""
+        with self._lock:
+            self._head = None
+            self._hashes.clear()
+            self._protocol = None
+            self._constants = None
+
+    @property
+    def head(self) -> Dict[str, Any]:
+        """Current head (shell header with hash), refreshed if outdated."""
+        with self._lock:
+            if self._monitor is not None and self._monitor.head is not None:
+                if self._head is None or self._monitor.head['hash'] != self._head['hash']:
+                    self._set_head(self._monitor.head)
+            elif self._head is None or monotonic() - self._synced_at > self.ttl:
+                self._set_head(self.shell.head.header())
+                self._synced_at = monotonic()
+            return self._head  # type: ignore
+
+    def _set_head(self, head: Dict[str, Any]) -> None:
+        if self._head is not None and head['hash'] == self._head['hash']:
+            return
+        level = int(head['level'])
+        if self._head is None or head['predecessor'] != self._head['hash']:
+            self._hashes.clear()  # missed blocks or reorganization
+        if self._head is not None and head['proto'] != self._head['proto']:
+            logger.info('Protocol changed at level %d', level)
+            self._protocol = None
+            self._constants = None
+        if head.get('protocol'):
+            if head['protocol'] != self._protocol:
+                self._constants = None
+            self._protocol = head['protocol']
+        if head.get('chain_id'):
+            self._chain_id = head['chain_id']
+
+        self._hashes[level] = head['hash']
+        for prev_level in [x for x in self._hashes if x < level - MAX_OPERATIONS_TTL]:
+            del self._hashes[prev_level]
+        self._head = head
+
+    def get_branch(self, offset: int = 0) -> str:
+        """Get hash of the block `head~offset`.
+
+        :param offset: number of blocks before the head
+        """
+        with self._lock:
+            head = self.head
+            level = int(head['level']) - offset
+            if level not in self._hashes:
+                hashes = self.shell.blocks(length=MAX_OPERATIONS_TTL + 1, head=head['hash'])[0]
+                self._hashes.update({int(head['level']) - i: block_hash for i, block_hash in enumerate(hashes)})
+            if level not in self._hashes:
+                self._hashes[level] = self.shell.blocks[f'{head["hash"]}~{offset}'].hash()
+            return self._hashes[level]
+
+    def get_chain_id(self) -> str:
+        with self._lock:
+            if self._chain_id is None:
+                self._chain_id = self.shell.chains.main.chain_id()
+            return self._chain_id  # type: ignore
+
+    def get_protocol(self) -> str:
+        with self._lock:
+            head = self.head
+            if self._protocol is None:
+                self._protocol = self.shell.blocks[head['hash']].header()['protocol']
+            return self._protocol  # type: ignore
+
+    def get_constants(self) -> Dict[str, Any]:
+        with self._lock:
+            head = self.head
+            if self._constants is None:
+                self._constants = self.shell.blocks[head['hash']].context.constants()
+            return self._constants  # type: ignore
@@ -0,0 +1,148 @@
+from threading import Lock, RLock
+from time import monotonic
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from pytezos.logging import logger
+from pytezos.rpc.shell import ShellQuery
+
+PENDING_STATUSES = ['applied', 'branch_delayed']
+RESERVATION_TIMEOUT = 60
+
+
+class CounterManager:
+    """Thread-safe source of operation counters for a single account on a single node.
+
+    Counters are reserved atomically, so that concurrent senders sharing a key never get the same value.
+    The next counter is reconciled against the head counter and operations pending in the mempool on first use,
+    whenever it falls behind the head counter known to the caller (e.g. operation was dropped from the mempool
+    or the key is used by another client), whenever a reservation is released (e.g. after a refused injection),
+    and whenever a reservation is neither confirmed nor released in time (e.g. operation was autofilled but never injected).
+    """
+
+    _instances: Dict[Tuple[str, str], 'CounterManager'] = {}
+    _instances_lock = Lock()
+
+    def __init__(self, shell: ShellQuery, pkh: str, reservation_timeout: float = RESERVATION_TIMEOUT) -> None:
+        """
+        :param shell: shell query for the node
+        :param pkh: public key hash of the account
+        :param reservation_timeout: seconds after which unconfirmed reservations are dropped
+        """
+        self.shell = shell
+        self.pkh = pkh
+        self.reservation_timeout = reservation_timeout
+        self._lock = RLock()
+        self._next: Optional[int] = None
+        self._reserved: Dict[int, Tuple[int, float]] = {}  # first counter -> (number of counters, reservation time)
+        self._pending: Set[int] = set()  # counters of pending operations as of the last reconciliation
+        self._owners: Dict[Hashable, int] = {}  # reservation owner -> first counter
+
+    @classmethod
+    def get(cls, shell: ShellQuery, pkh: str) -> 'CounterManager':
+        """Get counter manager shared by all senders using the same node (address) and account.
+
+        :param shell: shell query for the node
+        :param pkh: public key hash of the account
+        """
+        key = (str(shell.node.uri), pkh)
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(shell, pkh)
+            return cls._instances[key]
+
+    def get_head_counter(self) -> int:
+        """Get account counter at the head block."""
+        return int(self.shell.contracts[self.pkh]()['counter'])
+
+    def get_pending_counters(self) -> List[int]:
+        """Get counters of the account operations waiting in the mempool (applied or branch delayed)."""
+        operations = self.shell.mempool.pending_operations.by_source(self.pkh, statuses=PENDING_STATUSES)
+        return [
+            int(content['counter'])
+            for operation in operations
+            for content in operation.get('contents', [])
+            if content.get('source') == self.pkh and 'counter' in content
+        ]
+
+    def reconcile(self) -> int:
+        """Reset the next counter according to the chain state: the first counter after the head one
+        that is neither pending in the mempool nor reserved (so that gaps left by refused operations are filled).
+
+        :returns: next counter
+        """
+        with self._lock:
+            head_counter = self.get_head_counter()
+            for first in [first for first, (count, _) in self._reserved.items() if first + count - 1 <= head_counter]:
+                self._drop(first)  # already included
+            self._pending = {counter for counter in self.get_pending_counters() if counter > head_counter}
+            self._next = head_counter + 1
+            self._next = self._find_free(1)
+            logger.debug('%s: next counter is %d', self.pkh, self._next)
+            return self._next
+
+    def _is_used(self, counter: int) -> bool:
+        return counter in self._pending or any(first <= counter < first + count for first, (count, _) in self._reserved.items())
+
+    def _find_free(self, count: int) -> int:
+        first = self._next
+        while any(self._is_used(counter) for counter in range(first, first + count)):  # type: ignore
+            first += 1  # type: ignore
+        return first  # type: ignore
+
+    def _drop(self, first: int) -> None:
+        self._reserved.pop(first, None)
+        for owner in [owner for owner, owned in self._owners.items() if owned == first]:
+            del self._owners[owner]
+
+    def reserve(self, count: int = 1, min_counter: Optional[int] = None, owner: Optional[Hashable] = None) -> int:
+        """Reserve a range of consecutive counters.
+
+        :param count: number of counters (manager operations)
+        :param min_counter: lowest counter acceptable, i.e. head counter + 1 as seen by the caller; \
+        if the next counter is below, the manager is reconciled with the chain state
+        :param owner: reservation owner (e.g. operation group), a new reservation replaces the previous one of the same owner
+        :returns: first counter of the range
+        """
+        with self._lock:
+            if owner is not None and owner in self._owners:
+                self._give_back(self._owners[owner])
+            expired = [first for first, (_, ts) in self._reserved.items() if monotonic() - ts > self.reservation_timeout]
+            if expired:
+                logger.debug('%s: dropping expired reservations %s', self.pkh, expired)
+                for first in expired:
+                    self._drop(first)
+                self._next = None
+            if self._next is None or (min_counter is not None and self._next < min_counter):
+                self.reconcile()
+            first = self._find_free(count)
+            self._reserved[first] = (count, monotonic())
+            if owner is not None:
+                self._owners[owner] = first
+            self._next = first + count
+            return first
+
+    def _give_back(self, first: int) -> None:
+        count, _ = self._reserved[first]
+        self._drop(first)
+        if first + count == self._next:
+            self._next = first
+        else:
+            self._next = None  # there is a gap, reconcile on next reservation
+
+    def confirm(self, first: int) -> None:
+        """Mark reserved counters as used (operation is injected).
+
+        :param first: first counter of the range
+        """
+        with self._lock:
+            self._drop(first)
+
+    def release(self, first: int) -> None:
+        """Give reserved counters back (operation is refused or not going to be injected).
+        The manager is reconciled with the chain state on next reservation.
+
+        :param first: first counter of the range
+        """
+        with self._lock:
+            self._drop(first)
+            self._next = None
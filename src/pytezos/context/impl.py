@@ -1,13 +1,16 @@
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from pytezos.context.abstract import AbstractContext, get_originated_address  # type: ignore
+from pytezos.context.chain_state import ChainState
+from pytezos.context.counter import CounterManager
 from pytezos.crypto.encoding import base58_encode
 from pytezos.crypto.key import Key
 from pytezos.logging import logger
 from pytezos.michelson.micheline import get_script_section
 from pytezos.operation import DEFAULT_OPERATIONS_TTL, MAX_OPERATIONS_TTL
 from pytezos.rpc.errors import RpcError
+from pytezos.rpc.search import DEFAULT_CONCURRENCY, prefetch
 from pytezos.rpc.shell import ShellQuery
 
 DEFAULT_IPFS_GATEWAY = 'https://ipfs.io/ipfs'
@@ -16,7 +19,8 @@ class ExecutionContext(AbstractContext):
 
     def __init__(self, amount=None, chain_id=None, protocol=None, source=None, sender=None, balance=None,
                  block_id=None, now=None, level=None, voting_power=None, total_voting_power=None,
-                 key=None, shell=None, address=None, counter=None, script=None, tzt=False, mode=None, ipfs_gateway=None):
+                 key=None, shell=None, address=None, counter=None, script=None, tzt=False, mode=None, ipfs_gateway=None,
+                 big_map_values: Optional[Dict[Tuple[int, str], Optional[dict]]] = None):
         self.key: Optional[Key] = key
         self.shell: Optional[ShellQuery] = shell
         self.counter = counter
@@ -34,27 +38,29 @@ class ExecutionContext(AbstractContext):
         self.voting_power = voting_power
         self.total_voting_power = total_voting_power
         self.tzt = tzt
-        self.parameter_expr = get_script_section(script, name='parameter') if script and not tzt else None
-        self.storage_expr = get_script_section(script,  name='storage') if script and not tzt else None
-        self.code_expr = get_script_section(script, name='code') if script else None
-        self.input_expr = get_script_section(script, name='input') if script and tzt else None
-        self.output_expr = get_script_section(script,  name='output') if script and tzt else None
-        self.sender_expr = get_script_section(script, name='sender') if script and tzt else None
-        self.balance_expr = get_script_section(script, name='balance') if script and tzt else None
-        self.amount_expr = get_script_section(script, name='amount') if script and tzt else None
-        self.self_expr = get_script_section(script,  name='self') if script and tzt else None
-        self.now_expr = get_script_section(script, name='now') if script and tzt else None
-        self.source_expr = get_script_section(script, name='source') if script and tzt else None
-        self.chain_id_expr = get_script_section(script, name='chain_id') if script and tzt else None
-        self.big_maps_expr = get_script_section(script, name='big_maps') if script and tzt else None
+        self.parameter_expr = get_script_section(script, cls=None, name='parameter', required=False) if script and not tzt else None
+        self.storage_expr = get_script_section(script, cls=None, name='storage', required=False) if script and not tzt else None
+        self.code_expr = get_script_section(script, cls=None, name='code', required=False) if script else None
+        self.input_expr = get_script_section(script, cls=None, name='input', required=False) if script and tzt else None
+        self.output_expr = get_script_section(script, cls=None, name='output', required=False) if script and tzt else None
+        self.sender_expr = get_script_section(script, cls=None, name='sender', required=False) if script and tzt else None
+        self.balance_expr = get_script_section(script, cls=None, name='balance', required=False) if script and tzt else None
+        self.amount_expr = get_script_section(script, cls=None, name='amount', required=False) if script and tzt else None
+        self.self_expr = get_script_section(script, cls=None, name='self', required=False) if script and tzt else None
+        self.now_expr = get_script_section(script, cls=None, name='now', required=False) if script and tzt else None
+        self.source_expr = get_script_section(script, cls=None, name='source', required=False) if script and tzt else None
+        self.chain_id_expr = get_script_section(script, cls=None, name='chain_id', required=False) if script and tzt else None
+        self.big_maps_expr = get_script_section(script, cls=None, name='big_maps', required=False) if script and tzt else None
         self.origination_index = 1
         self.tmp_big_map_index = 0
         self.tmp_sapling_index = 0
         self.alloc_big_map_index = 0
         self.alloc_sapling_index = 0
         self.balance_update = 0
-        self.big_maps = {}
-        self.tzt_big_maps = {}
+        self.big_maps: Dict[int, Tuple[int, bool]] = {}  # pointer -> (source big_map pointer, copy)
+        self.tzt_big_maps: Dict[int, Any] = {}
+        # NOTE: pre-fetched values (None for missing keys) of on-chain big_maps, keyed by (big_map id, key hash)
+        self.big_map_values: Dict[Tuple[int, str], Optional[dict]] = big_map_values or {}
         self.debug = False
         self._sandboxed: Optional[bool] = None
         self.ipfs_gateway = (ipfs_gateway or DEFAULT_IPFS_GATEWAY).rstrip('/')
@@ -64,10 +70,21 @@ class ExecutionContext(AbstractContext):
 
     @property
     def constants(self):
+        return self.chain_state.get_constants()
+
+    @property
+    def chain_state(self) -> ChainState:
+        """Chain state (head, chain ID, protocol, constants) shared by all contexts using the same node."""
         if self.shell is None:
             raise Exception('`shell` is not set')
-        # FIXME: Cached, can be an issue when switching between protocols
-        return self.shell.block.context.constants()
+        return ChainState.get(self.shell)
+
+    def get_branch(self, offset: int = 0) -> str:
+        """Get hash of the block `head~offset` (cached until the next head).
+
+        :param offset: number of blocks before the head
+        """
+        return self.chain_state.get_branch(offset)
 
     @property
     def script(self) -> Optional[dict]:
@@ -120,22 +137,26 @@ class ExecutionContext(AbstractContext):
         if self.shell is None:
             raise Exception('`shell` is not set')
 
-        counter_offset = 0
         key_hash = self.key.public_key_hash()
-        mempool = self.shell.mempool.pending_operations()
-
-        for operations in mempool.values():
-            for operation in operations:
-                if isinstance(operation, list):
-                    operation = operation[1]
-                for content in operation.get('contents', []):
-                    if content.get('source') == key_hash:
-                        logger.debug("pending transaction in mempool: %s", content)
-                        counter_offset += 1
+        counter_offset = 0
+        for operation in self.shell.mempool.pending_operations.by_source(key_hash):
+            for content in operation.get('contents', []):
+                if content.get('source') == key_hash:
+                    logger.debug("pending transaction in mempool: %s", content)
+                    counter_offset += 1
 
         logger.debug("counter offset: %s", counter_offset)
         return counter_offset
 
+    @property
+    def counter_manager(self) -> CounterManager:
+        """Counter manager shared by all contexts using the same node and key."""
+        if self.key is None:
+            raise Exception('`key` is not set')
+        if self.shell is None:
+            raise Exception('`shell` is not set')
+        return CounterManager.get(self.shell, self.key.public_key_hash())
+
     def register_big_map(self, ptr: int, copy=False) -> int:
         if copy:
             tmp_ptr = self.get_tmp_big_map_id()
@@ -243,17 +264,43 @@ class ExecutionContext(AbstractContext):
         self.big_maps_expr = expr
 
     def get_big_map_value(self, ptr: int, key_hash: str):
+        return self.get_big_map_values(ptr, [key_hash])[0]
+
+    def get_big_map_values(self, ptr: int, key_hashes: List[str], concurrency: Optional[int] = None) -> List[Optional[dict]]:
         if self.tzt or (ptr not in self.big_maps):
-            return None
+            return [None] * len(key_hashes)
         ptr, _ = self.big_maps[ptr]
         if ptr < 0:
-            return None
-        if self.shell is None:
-            raise ValueError(f'Shell is undefined, cannot connect to network')
-        try:
-            return self.shell.blocks[self.block_id].context.big_maps[ptr][key_hash]()
-        except RpcError:
-            return None  # TODO: special exception/value | Key does not exist
+            return [None] * len(key_hashes)
+        return self._fetch_big_map_values(ptr, key_hashes, concurrency)
+
+    def prefetch_big_map_values(self, ptr: int, key_hashes: List[str], concurrency: Optional[int] = None):
+        """Fetch big_map values concurrently and keep them in the context, so that the interpreter
+        does not have to query them one by one. Values are bound to `block_id`.
+
+        :param ptr: on-chain big_map id
+        :param key_hashes: list of script expression hashes of the keys
+        :param concurrency: maximum number of simultaneous RPC requests (default is `DEFAULT_CONCURRENCY`)
+        """
+        values = self._fetch_big_map_values(ptr, key_hashes, concurrency)
+        self.big_map_values.update(((ptr, key_hash), value) for key_hash, value in zip(key_hashes, values))
+
+    def _fetch_big_map_values(self, ptr: int, key_hashes: List[str], concurrency: Optional[int]) -> List[Optional[dict]]:
+        missing = [key_hash for key_hash in dict.fromkeys(key_hashes) if (ptr, key_hash) not in self.big_map_values]
+        fetched: Dict[str, Optional[dict]] = {}
+        if missing:
+            if self.shell is None:
+                raise ValueError(f'Shell is undefined, cannot connect to network')
+            big_map = self.shell.blocks[self.block_id].context.big_maps[ptr]
+
+            def fetch(key_hash: str) -> Optional[dict]:
+                try:
+                    return big_map[key_hash]()
+                except RpcError:
+                    return None  # TODO: special exception/value | Key does not exist
+
+            fetched = dict(zip(missing, prefetch(fetch, missing, concurrency or DEFAULT_CONCURRENCY)))
+        return [fetched[key_hash] if key_hash in fetched else self.big_map_values[(ptr, key_hash)] for key_hash in key_hashes]
 
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
@@ -329,7 +376,7 @@ class ExecutionContext(AbstractContext):
         if self.chain_id:
             return self.chain_id
         elif self.shell:
-            return self.shell.chains.main.chain_id()
+            return self.chain_state.get_chain_id()
         else:
             return self.get_dummy_chain_id()
 
@@ -337,7 +384,7 @@ class ExecutionContext(AbstractContext):
         if self.protocol:
             return self.protocol
         elif self.shell:
-            return self.shell.head.header()['protocol']
+            return self.chain_state.get_protocol()
         else:
             raise NotImplementedError
 
@@ -1,3 +1,4 @@
+import logging
 from decimal import Decimal
 from pprint import pformat
 from typing import Optional, Union
@@ -9,6 +10,7 @@ from pytezos.context.mixin import ContextMixin  # type: ignore
 from pytezos.contract.result import ContractCallResult
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
+from pytezos.michelson.cache import type_cache
 from pytezos.michelson.format import micheline_to_michelson
 from pytezos.michelson.repl import Interpreter
 from pytezos.michelson.sections.storage import StorageSection
@@ -157,7 +159,7 @@ class ContractCall(ContextMixin):
         :param self_address: patch SELF/SELF_ADDRESS
         :rtype: pytezos.contract.result.ContractCallResult
         """
-        storage_ty = StorageSection.match(self.context.storage_expr)
+        storage_ty = type_cache.match(StorageSection, self.context.storage_expr)
         if storage is None:
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
         else:
@@ -176,6 +178,7 @@ class ContractCall(ContextMixin):
             level=level,
             now=now,
             address=self_address,
+            trace=logger.isEnabledFor(logging.DEBUG),
         )
         if error:
             logger.debug('\n'.join(stdout))
@@ -212,7 +215,7 @@ class ContractCall(ContextMixin):
         :param gas_limit: restrict max consumed gas
         :rtype: ContractCallResult
         """
-        storage_ty = StorageSection.match(self.context.storage_expr)
+        storage_ty = type_cache.match(StorageSection, self.context.storage_expr)
         if storage is None:
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
         else:
@@ -282,7 +285,7 @@ class ContractCall(ContextMixin):
         if self.address:
             initial_storage = self.shell.blocks[self.context.block_id].context.contracts[self.address].storage()
         else:
-            storage_ty = StorageSection.match(self.context.storage_expr)
+            storage_ty = type_cache.match(StorageSection, self.context.storage_expr)
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
 
         operations, _, stdout, error = Interpreter.run_view(
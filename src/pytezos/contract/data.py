@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Any, List, Optional, Union
 
 from deprecation import deprecated  # type: ignore
 
@@ -8,6 +8,8 @@ from pytezos.jupyter import get_class_docstring
 from pytezos.michelson.format import micheline_to_michelson
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.types.base import MichelsonType, generate_pydoc
+from pytezos.michelson.types.big_map import BigMapType
+from pytezos.michelson.types.map import MapType
 
 
 class ContractData(ContextMixin):
@@ -40,6 +42,23 @@ class ContractData(ContextMixin):
             raise KeyError(item)
         return ContractData(self.context, res, path=f'{self.path}/{item}')
 
+    def get_many(self, keys: List[Any], try_unpack=False, concurrency: Optional[int] = None) -> List[Any]:
+        """Get multiple map/big_map values as Python objects, big_map values are fetched concurrently
+
+        :param keys: list of keys (Python objects)
+        :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+        :param concurrency: maximum number of simultaneous RPC requests (default is `DEFAULT_CONCURRENCY`)
+        :return: list of values (None for missing keys)
+        """
+        assert isinstance(self.data, MapType), f'expected map or big_map, got {self.data.prim}'
+        key_type = self.data.args[0]
+        keys = [key_type.from_python_object(key) for key in keys]
+        if isinstance(self.data, BigMapType):
+            values = self.data.get_many(keys, concurrency=concurrency)
+        else:
+            values = self.data.get_many(keys)
+        return [None if val is None else val.to_python_object(try_unpack=try_unpack) for val in values]
+
     def __call__(self, try_unpack=False):
         """Get Michelson value as a Python object
 
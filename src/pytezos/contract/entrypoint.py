@@ -6,6 +6,7 @@ from pytezos.context.mixin import ExecutionContext
 from pytezos.contract.call import ContractCall
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
+from pytezos.michelson.cache import type_cache
 from pytezos.michelson.micheline import MichelsonRuntimeError
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.sections.parameter import ParameterSection
@@ -62,7 +63,7 @@ class ContractEntrypoint(ContextMixin):
             value = michelson_to_micheline(value)
         if entrypoint is None:
             entrypoint = self.entrypoint
-        param_ty = ParameterSection.match(self.context.parameter_expr)
+        param_ty = type_cache.match(ParameterSection, self.context.parameter_expr)
         parameters = {'entrypoint': entrypoint, 'value': value}
         py_obj = param_ty.from_parameters(parameters).to_python_object()
         return py_obj
@@ -75,7 +76,7 @@ class ContractEntrypoint(ContextMixin):
         :return: {entrypoint, value}
         """
         try:
-            param_ty = ParameterSection.match(self.context.parameter_expr)
+            param_ty = type_cache.match(ParameterSection, self.context.parameter_expr)
             return param_ty.from_python_object({self.entrypoint: py_obj}).to_parameters(mode=mode or self.context.mode)
         except MichelsonRuntimeError as e:
             logger.info(self.__doc__)
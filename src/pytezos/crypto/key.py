@@ -1,10 +1,12 @@
 import binascii
 import hashlib
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from getpass import getpass
+from os import cpu_count
 from os import environ as env
 from os.path import abspath, expanduser, join
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 from mnemonic import Mnemonic  # type: ignore
 from pyblake2 import blake2b  # type: ignore
@@ -15,6 +17,8 @@ from pytezos.jupyter import InlineDocstring, get_class_docstring
 VALID_MNEMONIC_LENGTHS = [12, 15, 18, 21, 24]
 DEFAULT_LANGUAGE = 'english'
 DEFAULT_TEZOS_DIR = '~/.tezos-client'
+PROCESS_POOL_THRESHOLD = 256  # batch size starting from which signing is spread across processes
+GIL_RELEASING_CURVES = [b'ed', b'sp']  # pysodium (ctypes) and secp256k1 (cffi) release GIL, fastecdsa does not
 
 PassphraseInput = Optional[Union[str, bytes]]
 
@@ -71,6 +75,11 @@ def blake2b_32(v=b''):
     return blake2b(scrub_input(v), digest_size=32)
 
 
+def _sign_chunk(curve: bytes, secret_exponent: bytes, messages: List[bytes], generic: bool) -> List[str]:
+    key = Key(public_point=b'', secret_exponent=secret_exponent, curve=curve)
+    return [key.sign(message, generic=generic) for message in messages]
+
+
 def validate_mnemonic(mnemonic: str, language: str = DEFAULT_LANGUAGE) -> None:
     m = Mnemonic(language)
     mnemonic_words = m.normalize_string(mnemonic).split(' ')
@@ -105,6 +114,7 @@ class Key(metaclass=InlineDocstring):
         self.secret_exponent = secret_exponent
         self.curve = curve
         self.activation_code = activation_code
+        self._signing_key: Any = None  # curve-specific private key object, created on first use
 
     def __repr__(self) -> str:
         res = [
@@ -427,20 +437,7 @@ class Key(metaclass=InlineDocstring):
         if not self.secret_exponent:
             raise ValueError("Cannot sign without a secret key.")
 
-        # Ed25519
-        if self.curve == b"ed":
-            digest = pysodium.crypto_generichash(encoded_message)
-            signature = pysodium.crypto_sign_detached(digest, self.secret_exponent)
-        # Secp256k1
-        elif self.curve == b"sp":
-            pk = secp256k1.PrivateKey(self.secret_exponent)
-            signature = pk.ecdsa_serialize_compact(pk.ecdsa_sign(encoded_message, digest=blake2b_32))
-        # P256
-        elif self.curve == b"p2":
-            r, s = fastecdsa.ecdsa.sign(msg=encoded_message, d=bytes_to_int(self.secret_exponent), hashfunc=blake2b_32)
-            signature = r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
-        else:
-            assert False
+        signature = self._sign_raw(encoded_message)
 
         if generic:
             prefix = b'sig'
@@ -449,6 +446,72 @@ class Key(metaclass=InlineDocstring):
 
         return base58_encode(signature, prefix).decode()
 
+    def _get_signing_key(self) -> Any:
+        if self._signing_key is None:
+            # Ed25519
+            if self.curve == b"ed":
+                self._signing_key = self.secret_exponent
+            # Secp256k1
+            elif self.curve == b"sp":
+                self._signing_key = secp256k1.PrivateKey(self.secret_exponent)
+            # P256
+            elif self.curve == b"p2":
+                self._signing_key = bytes_to_int(self.secret_exponent)
+            else:
+                assert False
+        return self._signing_key
+
+    def _sign_raw(self, encoded_message: bytes) -> bytes:
+        signing_key = self._get_signing_key()
+        # Ed25519
+        if self.curve == b"ed":
+            digest = pysodium.crypto_generichash(encoded_message)
+            return pysodium.crypto_sign_detached(digest, signing_key)
+        # Secp256k1
+        if self.curve == b"sp":
+            return signing_key.ecdsa_serialize_compact(signing_key.ecdsa_sign(encoded_message, digest=blake2b_32))
+        # P256
+        r, s = fastecdsa.ecdsa.sign(msg=encoded_message, d=signing_key, hashfunc=blake2b_32)
+        return r.to_bytes(32, 'big') + s.to_bytes(32, 'big')
+
+    def sign_many(
+        self,
+        messages: Sequence[Union[str, bytes]],
+        generic: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[str]:
+        """Sign multiple raw sequences of bytes at once.
+
+        Small batches are signed in threads (for curves whose backends release GIL), large ones are split into chunks
+        signed by a pool of processes.
+
+        :param messages: sequences of bytes, raw format or hexadecimal notation
+        :param generic: do not specify elliptic curve if set to True
+        :param max_workers: number of threads/processes (default is number of CPUs)
+        :returns: signatures in base58 encoding, in order
+        """
+        encoded_messages = [scrub_input(message) for message in messages]
+        if not self.secret_exponent:
+            raise ValueError("Cannot sign without a secret key.")
+
+        max_workers = max_workers or cpu_count() or 1
+        if max_workers == 1 or len(encoded_messages) < 2:
+            return [self.sign(message, generic=generic) for message in encoded_messages]
+
+        if len(encoded_messages) >= PROCESS_POOL_THRESHOLD:
+            chunk_size = -(-len(encoded_messages) // max_workers)
+            chunks = [encoded_messages[i:i + chunk_size] for i in range(0, len(encoded_messages), chunk_size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as process_pool:
+                futures = [process_pool.submit(_sign_chunk, self.curve, self.secret_exponent, chunk, generic) for chunk in chunks]
+                return [signature for future in futures for signature in future.result()]
+
+        if self.curve in GIL_RELEASING_CURVES:
+            self._get_signing_key()
+            with ThreadPoolExecutor(max_workers=max_workers) as thread_pool:
+                return list(thread_pool.map(lambda x: self.sign(x, generic=generic), encoded_messages))
+
+        return [self.sign(message, generic=generic) for message in encoded_messages]
+
     def verify(self, signature: Union[str, bytes], message: Union[str, bytes]) -> None:
         """Verify signature, raise exception if it is not valid.
 
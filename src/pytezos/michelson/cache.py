@@ -0,0 +1,155 @@
+import copyreg
+import io
+import pickle
+from collections import OrderedDict
+from os.path import exists, expanduser
+from sys import modules
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from pytezos.crypto.key import blake2b_32
+from pytezos.logging import logger
+from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.micheline import ErrorTrace, Micheline
+
+DEFAULT_MAXSIZE = 1024
+
+MichelineT = TypeVar('MichelineT', bound=Micheline)
+
+
+def reduce_type(cls: ErrorTrace):
+    """Pickle classes produced by `create_type` by value (name, bases, and public data attributes), other by reference."""
+    module = modules.get(cls.__module__)
+    if getattr(module, cls.__qualname__, None) is cls:
+        return cls.__qualname__
+    attrs = {k: v for k, v in cls.__dict__.items() if not k.startswith('_')}
+    if '__slots__' in cls.__dict__:
+        attrs['__slots__'] = cls.__slots__
+    return ErrorTrace, (cls.__name__, cls.__bases__, attrs)
+
+
+class TypePickler(pickle.Pickler):
+    dispatch_table = copyreg.dispatch_table.copy()  # type: ignore
+    dispatch_table[ErrorTrace] = reduce_type
+
+
+class TypeCache:
+    """Process-wide LRU cache of compiled script sections (parameter, storage, code), keyed by hash of the forged
+    expression. Can be persisted to disk, so that warm workers skip type construction entirely.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        :param maxsize: maximum number of compiled sections kept in memory
+        """
+        self.maxsize = maxsize
+        self._items: 'OrderedDict[Tuple[str, bytes], Type[Micheline]]' = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nStats',
+            *[f'.{k}\t{v}' for k, v in self.stats.items()],
+        ]
+        return '\n'.join(res)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters."""
+        total = self.hits + self.misses
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / total if total else 0.0,
+            size=len(self._items),
+        )
+
+    @staticmethod
+    def get_key(cls: Type[Micheline], expr) -> Optional[Tuple[str, bytes]]:
+        """Get cache key for the expression, or None if it cannot be forged (e.g. contains unknown primitives).
+
+        :param cls: section class
+        :param expr: Micheline expression
+        """
+        try:
+            return cls.__name__, blake2b_32(forge_micheline(expr)).digest()
+        except (KeyError, AssertionError, ValueError, TypeError, AttributeError):
+            return None
+
+    def match(self, cls: Type[MichelineT], expr) -> Type[MichelineT]:
+        """Get compiled type for the expression, building it if not cached.
+
+        :param cls: section class, e.g. `ParameterSection`
+        :param expr: Micheline expression
+        """
+        key = self.get_key(cls, expr)
+        if key is not None:
+            with self._lock:
+                res = self._items.get(key)
+                if res is not None:
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return res  # type: ignore
+                self.misses += 1
+
+        res = cls.match(expr)
+        if key is not None:
+            with self._lock:
+                self._items[key] = res
+                while len(self._items) > self.maxsize:
+                    self._items.popitem(last=False)
+        return res  # type: ignore
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def save(self, path: str) -> None:
+        """Dump compiled types to a file. Entries that cannot be serialized are skipped.
+
+        :param path: path to the pickle file
+        """
+        with self._lock:
+            items = list(self._items.items())
+        entries = []
+        for key, value in items:
+            buf = io.BytesIO()
+            try:
+                TypePickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+            except (pickle.PicklingError, RecursionError, TypeError, AttributeError) as e:
+                logger.debug('Failed to serialize %s: %s', key[0], e)
+                continue
+            entries.append((key, buf.getvalue()))
+        with open(expanduser(path), 'wb') as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load(self, path: str) -> None:
+        """Load compiled types previously dumped with `save`, does nothing if the file does not exist.
+
+        :param path: path to the pickle file
+        """
+        path = expanduser(path)
+        if not exists(path):
+            return
+        with open(path, 'rb') as f:
+            entries = pickle.load(f)
+        with self._lock:
+            for key, data in entries[-self.maxsize:]:
+                self._items[key] = pickle.loads(data)
+                self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+type_cache = TypeCache()
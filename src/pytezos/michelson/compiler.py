@@ -0,0 +1,319 @@
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple, Type, cast
+
+from pytezos.context.abstract import AbstractContext  # type: ignore
+from pytezos.michelson.instructions.control import (DipInstruction, DipnInstruction, ExecInstruction, IfConsInstruction, IfInstruction,
+                                                    IfLeftInstruction, IfNoneInstruction, IterInstruction, LoopInstruction,
+                                                    LoopLeftInstruction, MapInstruction)
+from pytezos.michelson.instructions.stack import (DigInstruction, DropInstruction, DropnInstruction, DugInstruction, DupInstruction,
+                                                  DupnInstruction, PushInstruction, SwapInstruction)
+from pytezos.michelson.micheline import Micheline, MichelineLiteral, MichelineSequence, MichelsonRuntimeError
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import BoolType, LambdaType, ListType, MapType, OptionType, OrType, PairType
+from pytezos.michelson.types.base import MichelsonType
+
+CompiledCode = Callable[[MichelsonStack, List[str], AbstractContext], None]
+
+# Values of these types are never mutated in place, so PUSH can reuse a single instance
+IMMUTABLE_PRIMS = {
+    'int', 'nat', 'string', 'bytes', 'bool', 'unit', 'mutez', 'timestamp', 'address', 'key_hash', 'key', 'signature', 'chain_id',
+}
+
+
+def get_execute(cls: Type[Micheline]) -> Tuple[Callable, Optional[str]]:
+    """Get the original (not wrapped by `catch`) `execute` implementation and the prim used to report its errors."""
+    for base in cls.__mro__:
+        if 'execute' in base.__dict__:
+            func = base.__dict__['execute'].__func__
+            return getattr(func, '__wrapped__', func), base.__dict__.get('prim')
+    assert False, f'`execute` is not defined for {cls}'
+
+
+def compile_dip(cls: Type[Micheline]) -> CompiledCode:
+    depth = 1 if issubclass(cls, DipInstruction) else cast(Type[MichelineLiteral], cls.args[0]).get_int()
+    body = compile_code(cls.args[-1])
+
+    def dip(stack, stdout, context):
+        stack.protect(count=depth)
+        body(stack, stdout, context)
+        stack.restore(count=depth)
+    return dip
+
+
+def compile_if(cls: Type[Micheline]) -> CompiledCode:
+    then_, else_ = map(compile_code, cls.args)
+
+    def if_(stack, stdout, context):
+        cond = stack.pop1()
+        cond.assert_type_equal(BoolType)
+        (then_ if bool(cond) else else_)(stack, stdout, context)
+    return if_
+
+
+def compile_if_cons(cls: Type[Micheline]) -> CompiledCode:
+    then_, else_ = map(compile_code, cls.args)
+
+    def if_cons(stack, stdout, context):
+        lst = stack.pop1()
+        lst.assert_type_in(ListType)
+        if len(lst) > 0:
+            head, tail = lst.split_head()
+            stack.push(tail)
+            stack.push(head)
+            then_(stack, stdout, context)
+        else:
+            else_(stack, stdout, context)
+    return if_cons
+
+
+def compile_if_left(cls: Type[Micheline]) -> CompiledCode:
+    left, right = map(compile_code, cls.args)
+
+    def if_left(stack, stdout, context):
+        or_ = stack.pop1()
+        or_.assert_type_in(OrType)
+        branch = left if or_.is_left() else right
+        stack.push(or_.resolve())
+        branch(stack, stdout, context)
+    return if_left
+
+
+def compile_if_none(cls: Type[Micheline]) -> CompiledCode:
+    none, some = map(compile_code, cls.args)
+
+    def if_none(stack, stdout, context):
+        opt = stack.pop1()
+        opt.assert_type_in(OptionType)
+        if opt.is_none():
+            none(stack, stdout, context)
+        else:
+            stack.push(opt.get_some())
+            some(stack, stdout, context)
+    return if_none
+
+
+def compile_loop(cls: Type[Micheline]) -> CompiledCode:
+    body = compile_code(cls.args[0])
+
+    def loop(stack, stdout, context):
+        while True:
+            cond = stack.pop1()
+            cond.assert_type_equal(BoolType)
+            if not bool(cond):
+                break
+            body(stack, stdout, context)
+    return loop
+
+
+def compile_loop_left(cls: Type[Micheline]) -> CompiledCode:
+    body = compile_code(cls.args[0])
+
+    def loop_left(stack, stdout, context):
+        while True:
+            or_ = stack.pop1()
+            or_.assert_type_in(OrType)
+            stack.push(or_.resolve())
+            if not or_.is_left():
+                break
+            body(stack, stdout, context)
+    return loop_left
+
+
+def compile_iter(cls: Type[Micheline]) -> CompiledCode:
+    body = compile_code(cls.args[0])
+
+    def iter_(stack, stdout, context):
+        src = stack.pop1()
+        is_map = isinstance(src, MapType)
+        for elt in src:
+            stack.push(PairType.from_comb(list(elt)) if is_map else elt)
+            body(stack, stdout, context)
+    return iter_
+
+
+def compile_map(cls: Type[Micheline]) -> CompiledCode:
+    body = compile_code(cls.args[0])
+
+    def map_(stack, stdout, context):
+        src = stack.pop1()
+        is_map = isinstance(src, MapType)
+        items = []
+        for elt in src:
+            if is_map:
+                elt = PairType.from_comb(list(elt))
+            stack.push(elt)
+            body(stack, stdout, context)
+            new_elt = stack.pop1()
+            items.append((elt[0], new_elt) if is_map else new_elt)
+        stack.push(type(src).from_items(items) if items else src)  # type: ignore
+    return map_
+
+
+def compile_exec(cls: Type[Micheline]) -> CompiledCode:
+    def exec_(stack, stdout, context):
+        param, lambda_ = stack.pop2()
+        assert isinstance(lambda_, LambdaType), f'expected lambda, got {lambda_.prim}'
+        param.assert_type_equal(lambda_.args[0])
+        lambda_stack = MichelsonStack.from_items([param])
+        get_compiled(lambda_.value)(lambda_stack, stdout, context)
+        res = lambda_stack.pop1()
+        res.assert_type_equal(lambda_.args[1])
+        assert len(lambda_stack) == 0, f'lambda stack is not empty {lambda_stack}'
+        stack.push(res)
+    return exec_
+
+
+def compile_push(cls: Type[Micheline]) -> Optional[CompiledCode]:
+    res_type, literal = cast(Type[MichelsonType], cls.args[0]), cls.args[1]
+    if not res_type.is_pushable() or res_type.prim not in IMMUTABLE_PRIMS:
+        return None
+    const = res_type.from_literal(literal)
+
+    def push(stack, stdout, context):
+        stack.push(const)
+    return push
+
+
+def compile_drop(cls: Type[Micheline]) -> CompiledCode:
+    count = 1 if issubclass(cls, DropInstruction) else cast(Type[MichelineLiteral], cls.args[0]).get_int()
+
+    def drop(stack, stdout, context):
+        stack.pop(count=count)
+    return drop
+
+
+def compile_dup(cls: Type[Micheline]) -> CompiledCode:
+    if issubclass(cls, DupInstruction):
+        def dup(stack, stdout, context):
+            stack.push(stack.peek().duplicate())
+        return dup
+
+    depth = cast(Type[MichelineLiteral], cls.args[0]).get_int() - 1
+
+    def dup_n(stack, stdout, context):
+        stack.protect(count=depth)
+        res = stack.peek().duplicate()
+        stack.restore(count=depth)
+        stack.push(res)
+    return dup_n
+
+
+def compile_swap(cls: Type[Micheline]) -> CompiledCode:
+    def swap(stack, stdout, context):
+        a, b = stack.pop2()
+        stack.push(a)
+        stack.push(b)
+    return swap
+
+
+def compile_dig(cls: Type[Micheline]) -> CompiledCode:
+    depth = cast(Type[MichelineLiteral], cls.args[0]).get_int()
+
+    def dig(stack, stdout, context):
+        stack.protect(count=depth)
+        res = stack.pop1()
+        stack.restore(count=depth)
+        stack.push(res)
+    return dig
+
+
+def compile_dug(cls: Type[Micheline]) -> CompiledCode:
+    depth = cast(Type[MichelineLiteral], cls.args[0]).get_int()
+
+    def dug(stack, stdout, context):
+        res = stack.pop1()
+        stack.protect(count=depth)
+        stack.push(res)
+        stack.restore(count=depth)
+    return dug
+
+
+# Instruction prim -> function building a specialized closure (or returning None to fall back to `execute`)
+instruction_compilers: Dict[str, Callable[[Type[Micheline]], Optional[CompiledCode]]] = {
+    'DIP': compile_dip,
+    'IF': compile_if,
+    'IF_CONS': compile_if_cons,
+    'IF_LEFT': compile_if_left,
+    'IF_NONE': compile_if_none,
+    'LOOP': compile_loop,
+    'LOOP_LEFT': compile_loop_left,
+    'ITER': compile_iter,
+    'MAP': compile_map,
+    'EXEC': compile_exec,
+    'PUSH': compile_push,
+    'DROP': compile_drop,
+    'DUP': compile_dup,
+    'SWAP': compile_swap,
+    'DIG': compile_dig,
+    'DUG': compile_dug,
+}
+instruction_classes = (
+    DipInstruction, DipnInstruction, IfInstruction, IfConsInstruction, IfLeftInstruction, IfNoneInstruction, LoopInstruction,
+    LoopLeftInstruction, IterInstruction, MapInstruction, ExecInstruction, PushInstruction, DropInstruction, DropnInstruction,
+    DupInstruction, DupnInstruction, SwapInstruction, DigInstruction, DugInstruction,
+)
+
+
+def compile_instruction(cls: Type[Micheline]) -> CompiledCode:
+    """Build a closure equivalent to `cls.execute` with tracing disabled.
+    The returned function raises original exceptions, the caller is responsible for adding the instruction path.
+
+    :param cls: instruction class
+    """
+    if issubclass(cls, MichelineSequence):
+        return compile_code(cls)
+
+    if issubclass(cls, instruction_classes):
+        res = instruction_compilers[cast(str, cls.prim)](cls)
+        if res is not None:
+            return res
+
+    func, _ = get_execute(cls)
+    return cast(CompiledCode, partial(func, cls))
+
+
+def compile_code(code: Type[Micheline]) -> CompiledCode:
+    """Compile a Michelson code block into a tree of Python closures.
+    Stack depths, argument counts and pushed constants are resolved once, instructions are executed without tracing.
+    Errors are reported with the same instruction path as in the interpreter.
+
+    :param code: `MichelineSequence` of instructions (or a single instruction)
+    :returns: function (stack, stdout, context) -> None
+    """
+    args = code.args if issubclass(code, MichelineSequence) else [code]
+    ops = []
+    for arg in args:
+        try:
+            op = compile_instruction(arg)
+        except Exception:
+            # malformed instruction, let the interpreter fail at runtime (if ever executed)
+            op = partial(get_execute(arg)[0], arg)
+        ops.append(op)
+    prims = [get_execute(arg)[1] for arg in args]
+
+    def sequence(stack, stdout, context):
+        i = 0
+        try:
+            for i, op in enumerate(ops):
+                op(stack, stdout, context)
+        except Exception as e:
+            if not e.args:
+                e.args = (type(e).__name__,)
+            if prims[i]:
+                e.args = (prims[i], *e.args)
+            raise MichelsonRuntimeError(*e.args) from e
+
+    return sequence
+
+
+def get_compiled(code: Type[Micheline]) -> CompiledCode:
+    """Get compiled code block, compile on first use.
+    The result is stored on the class itself, so that it shares its lifetime with the (possibly cached) type.
+
+    :param code: `MichelineSequence` of instructions
+    """
+    res = code.__dict__.get('_compiled')
+    if res is None:
+        res = compile_code(code)
+        code._compiled = res  # type: ignore
+    return res
@@ -1,5 +1,5 @@
 from contextlib import suppress
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterator, List, Tuple, Union
 
 import base58  # type: ignore
 import strict_rfc3339  # type: ignore
@@ -48,26 +48,27 @@ def forge_int32(value: int) -> bytes:
     return value.to_bytes(4, 'big')
 
 
-def unforge_int(data: bytes) -> (int, int):  # type: ignore
+def unforge_int(data: bytes, offset: int = 0) -> (int, int):  # type: ignore
     """Decode signed unbounded integer from bytes.
 
     :param data: Encoded integer
+    :param offset: position of the first byte in data
     :returns: tuple(parsed integer, length in bytes)
     """
     value = 0
     length = 1
 
-    while data[length - 1] & 0b10000000 != 0:
+    while data[offset + length - 1] & 0b10000000 != 0:
         length += 1
 
-    for i in range(length - 1, 0, -1):
+    for i in range(offset + length - 1, offset, -1):
         value <<= 7
         value |= data[i] & 0b01111111
 
     value <<= 6
-    value |= data[0] & 0b00111111
+    value |= data[offset] & 0b00111111
 
-    if (data[0] & 0b01000000) != 0:
+    if (data[offset] & 0b01000000) != 0:
         value = -value
 
     return value, length
@@ -253,148 +254,184 @@ def forge_array(data: bytes, len_bytes=4) -> bytes:
     return len(data).to_bytes(len_bytes, 'big') + data
 
 
-def unforge_array(data: bytes, len_bytes=4) -> tuple:
+def unforge_array(data: bytes, len_bytes=4, offset: int = 0) -> tuple:
     """Decode array of bytes.
 
     :param data: encoded array
     :param len_bytes: number of bytes to store array length
+    :param offset: position of the array length in data
     :returns: Tuple[list of bytes, array length]
     """
-    assert len(data) >= len_bytes, f'not enough bytes to parse array length, wanted {len_bytes}'
-    length = int.from_bytes(data[:len_bytes], 'big')
-    assert len(data) >= len_bytes + length, f'not enough bytes to parse array body, wanted {length}'
-    return data[len_bytes : len_bytes + length], len_bytes + length
+    start = offset + len_bytes
+    assert len(data) >= start, f'not enough bytes to parse array length, wanted {len_bytes}'
+    length = int.from_bytes(data[offset:start], 'big')
+    assert len(data) >= start + length, f'not enough bytes to parse array body, wanted {length}'
+    return data[start : start + length], len_bytes + length
 
 
-def forge_micheline(data: Union[List, Dict]) -> bytes:
-    """Encode a Micheline expression into the byte form.
+def _write_array(buf: bytearray, data: bytes) -> None:
+    buf += len(data).to_bytes(4, 'big')
+    buf += data
+
+
+def write_micheline(buf: bytearray, data: Union[List, Dict]) -> None:
+    """Encode a Micheline expression into the byte form, appending to the buffer.
 
+    Length prefixes of sequences are back-patched, so that no intermediate bytes objects are created.
+
+    :param buf: output buffer
     :param data: Micheline expression
     """
-    res = []
-
     if isinstance(data, list):
-        res.append(b'\x02')
-        res.append(forge_array(b''.join(map(forge_micheline, data))))
+        buf.append(0x02)
+        start = len(buf)
+        buf += b'\x00' * 4
+        for item in data:
+            write_micheline(buf, item)
+        buf[start : start + 4] = (len(buf) - start - 4).to_bytes(4, 'big')
 
     elif isinstance(data, dict):
         if data.get('prim'):
-            args_len = len(data.get('args', []))
-            annots_len = len(data.get('annots', []))
+            args = data.get('args', [])
+            annots = data.get('annots', [])
+            args_len, annots_len = len(args), len(annots)
 
-            res.append(get_tag(args_len, annots_len))
-            res.append(prim_tags[data['prim']])
+            buf.append(min(args_len * 2 + 3 + (1 if annots_len > 0 else 0), 9))
+            buf += prim_tags[data['prim']]
 
-            if args_len > 0:
-                args = b''.join(map(forge_micheline, data['args']))
-                if args_len < 3:
-                    res.append(args)
-                else:
-                    res.append(forge_array(args))
+            if 0 < args_len < 3:
+                for arg in args:
+                    write_micheline(buf, arg)
+            elif args_len >= 3:
+                start = len(buf)
+                buf += b'\x00' * 4
+                for arg in args:
+                    write_micheline(buf, arg)
+                buf[start : start + 4] = (len(buf) - start - 4).to_bytes(4, 'big')
 
             if annots_len > 0:
-                res.append(forge_array(' '.join(data['annots']).encode()))
+                _write_array(buf, ' '.join(annots).encode())
             elif args_len >= 3:
-                res.append(b'\x00' * 4)
+                buf += b'\x00' * 4
 
         elif data.get('bytes') is not None:
-            res.append(b'\x0A')
-            res.append(forge_array(bytes.fromhex(data['bytes'])))
+            buf.append(0x0A)
+            _write_array(buf, bytes.fromhex(data['bytes']))
 
         elif data.get('int') is not None:
-            res.append(b'\x00')
-            res.append(forge_int(int(data['int'])))
+            buf.append(0x00)
+            buf += forge_int(int(data['int']))
 
         elif data.get('string') is not None:
-            res.append(b'\x01')
-            res.append(forge_array(data['string'].encode()))
+            buf.append(0x01)
+            _write_array(buf, data['string'].encode())
         else:
             assert False, data
     else:
         assert False, data
 
-    return b''.join(res)
+
+def forge_micheline(data: Union[List, Dict]) -> bytes:
+    """Encode a Micheline expression into the byte form.
+
+    :param data: Micheline expression
+    """
+    buf = bytearray()
+    write_micheline(buf, data)
+    return bytes(buf)
+
+
+def _unforge_sequence(data: bytes, ptr: int) -> Tuple[List, int]:
+    value, offset = unforge_array(data, offset=ptr)
+    end, res = ptr + offset, []
+    ptr += 4
+    while ptr < end:
+        item, ptr = _unforge_expr(data, ptr)
+        res.append(item)
+    assert ptr == end, f'out of sequence boundaries'
+    return res, ptr
+
+
+def _unforge_expr(data: bytes, ptr: int) -> Tuple[Union[List, Dict], int]:
+    tag = data[ptr]
+    ptr += 1
+    if tag == 0:
+        value, offset = unforge_int(data, ptr)
+        return {'int': str(value)}, ptr + offset
+    elif tag == 1:
+        value, offset = unforge_array(data, offset=ptr)
+        return {'string': str(value, 'utf-8')}, ptr + offset
+    elif tag == 2:
+        return _unforge_sequence(data, ptr)
+    elif tag == 10:
+        value, offset = unforge_array(data, offset=ptr)
+        return {'bytes': value.hex()}, ptr + offset
+
+    assert 2 < tag < 10, f'unkonwn tag {tag} at position {ptr}'
+    args_len, annots = read_tag(tag)
+    expr: Dict[str, Any] = {'prim': prim_int[data[ptr]]}
+    ptr += 1
+
+    if args_len == 3:
+        expr['args'], ptr = _unforge_sequence(data, ptr)
+        annots = True  # generic application always has annotations field
+    elif args_len > 0:
+        args = []
+        for _ in range(args_len):
+            arg, ptr = _unforge_expr(data, ptr)
+            args.append(arg)
+        expr['args'] = args
+
+    if annots:
+        value, offset = unforge_array(data, offset=ptr)
+        ptr += offset
+        if len(value) > 0:
+            expr['annots'] = str(value, 'utf-8').split(' ')
+
+    return expr, ptr
 
 
 def unforge_micheline(data: bytes) -> Union[List, Dict]:
     """Parse Micheline JSON from bytes.
 
-    :param data: Forged Micheline expression
+    :param data: Forged Micheline expression (bytes, bytearray, or memoryview)
     :returns: Micheline JSON
     """
-    ptr = 0
-
-    def unforge_sequence():
-        nonlocal ptr
-        _, offset = unforge_array(data[ptr:])
-        end, res = ptr + offset, []
-        ptr += 4
-        while ptr < end:
-            res.append(unforge())
-        assert ptr == end, f'out of sequence boundaries'
-        return res
-
-    def unforge_prim_expr(args_len=0, annots=False):
-        nonlocal ptr
-        prim_tag = data[ptr]
-        ptr += 1
-        expr = {'prim': prim_int[prim_tag]}
-
-        if 0 < args_len < 3:
-            expr['args'] = [unforge() for _ in range(args_len)]
-        elif args_len == 3:
-            expr['args'] = unforge_sequence()
-        else:
-            assert args_len == 0, f'unexpected args len {args_len}'
-
-        if annots:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            if len(value) > 0:
-                expr['annots'] = value.decode().split(' ')
-
-        if args_len == 3:
-            ptr += 4
-
-        return expr
-
-    def unforge():
-        nonlocal ptr
-        tag = data[ptr]
-        ptr += 1
-        if tag == 0:
-            value, offset = unforge_int(data[ptr:])
-            ptr += offset
-            return {'int': str(value)}
-        elif tag == 1:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'string': value.decode()}
-        elif tag == 2:
-            return unforge_sequence()
-        elif 2 < tag < 10:
-            args_len, annots = read_tag(tag)
-            return unforge_prim_expr(args_len, annots)
-        elif tag == 10:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'bytes': value.hex()}
-        else:
-            assert False, f'unkonwn tag {tag} at position {ptr}'
-
-    result = unforge()
+    data = memoryview(data)
+    result, ptr = _unforge_expr(data, 0)
     assert ptr == len(data), f'have not reach EOS (pos {ptr}/{len(data)})'
     return result
 
 
+def iter_unforge_micheline(data: bytes, packed: bool = False) -> Iterator[Union[List, Dict]]:
+    """Parse a concatenation of forged Micheline expressions, e.g. a dump of big_map keys or values.
+
+    :param data: Forged Micheline expressions (bytes, bytearray, or memoryview)
+    :param packed: expressions are packed, i.e. each one is prefixed with `0x05`
+    :returns: generator of Micheline JSON
+    """
+    data = memoryview(data)
+    ptr = 0
+    while ptr < len(data):
+        if packed:
+            assert data[ptr] == 5, f'packed value expected at position {ptr}'
+            ptr += 1
+        expr, ptr = _unforge_expr(data, ptr)
+        yield expr
+
+
 def forge_script(script: Dict[str, Any]) -> bytes:
     """Encode an origination script into the byte form.
 
     :param script: {"code": "$Micheline_expression", "storage": "$Micheline_expression"}
     """
-    code = forge_micheline(script['code'])
-    storage = forge_micheline(script['storage'])
-    return forge_array(code) + forge_array(storage)
+    buf = bytearray()
+    for section in [script['code'], script['storage']]:
+        start = len(buf)
+        buf += b'\x00' * 4
+        write_micheline(buf, section)
+        buf[start : start + 4] = (len(buf) - start - 4).to_bytes(4, 'big')
+    return bytes(buf)
 
 
 def forge_script_expr(packed_key: bytes) -> str:
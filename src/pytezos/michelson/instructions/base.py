@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import Micheline, trace_enabled
 from pytezos.michelson.stack import MichelsonStack
 
 
@@ -9,6 +9,8 @@ class Wildcard:
 
     @staticmethod
     def n(count: int) -> List['Wildcard']:
+        if not trace_enabled.get():
+            return []
         return [Wildcard() for _ in range(count)]
 
     def __repr__(self):
@@ -16,6 +18,8 @@ class Wildcard:
 
 
 def format_stdout(prim: str, inputs: list, outputs: list, arg=None):
+    if not trace_enabled.get():
+        return ''
     arg = f' {arg}' if arg else ''
     pop = " : ".join(map(repr, inputs)) if inputs else '_'
     push = " : ".join(map(repr, outputs)) if outputs else '_'
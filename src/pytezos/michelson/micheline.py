@@ -1,6 +1,9 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import wraps
 from pprint import pformat
-from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar, Union, cast, overload
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar, Union, cast, overload
+from weakref import WeakValueDictionary
 
 from typing_extensions import Literal
 
@@ -8,6 +11,20 @@ from pytezos.michelson.forge import unforge_address, unforge_chain_id, unforge_m
 from pytezos.michelson.format import micheline_to_michelson
 
 
+# NOTE: when disabled, instructions skip formatting stdout and sequences do not collect results
+trace_enabled: ContextVar[bool] = ContextVar('trace_enabled', default=True)
+
+
+@contextmanager
+def tracing(enabled: bool) -> Iterator[None]:
+    """Enable or disable execution trace (stdout and tree of executed instructions) within the block."""
+    token = trace_enabled.set(enabled)
+    try:
+        yield
+    finally:
+        trace_enabled.reset(token)
+
+
 class MichelsonRuntimeError(Exception):
 
     def format_stdout(self):
@@ -132,7 +149,7 @@ def blind_unpack(data: bytes):
 
     if len(data) > 0 and data.startswith(b'\x05'):
         try:
-            res = unforge_micheline(data[1:])
+            res = unforge_micheline(memoryview(data)[1:])
             return micheline_value_to_python_object(res)
         except (ValueError, AssertionError):
             pass
@@ -146,6 +163,8 @@ def blind_unpack(data: bytes):
 
 
 class Micheline(metaclass=ErrorTrace):
+    __slots__ = ()
+
     prim: Optional[str] = None
     args: List[Type['Micheline']] = []
     literal: Optional[Union[int, str, bytes]] = None
@@ -211,6 +230,8 @@ class Micheline(metaclass=ErrorTrace):
 
     @classmethod
     def assert_type_equal(cls, other: Type['Micheline'], path='', message=''):
+        if cls is other:
+            return
         comment = f' [{message}]' if message else ''
         assert cls.prim == other.prim, f'expected {other.prim}, got {cls.prim} at `{path}`{comment}'
         assert len(cls.args) == len(other.args), \
@@ -252,14 +273,25 @@ class MichelineSequence(Micheline):
 
     @classmethod
     def execute(cls, stack, stdout, context) -> Micheline:
+        if not trace_enabled.get():
+            for arg in cls.args:
+                arg.execute(stack, stdout, context)
+            return cls([])
         return cls([arg.execute(stack, stdout, context) for arg in cls.args])
 
 
+interned_literals: 'WeakValueDictionary[tuple, Type[MichelineLiteral]]' = WeakValueDictionary()
+
+
 class MichelineLiteral(Micheline):
 
     @classmethod
     def create(cls, literal: Union[int, str, bytes]):
-        return cls.create_type(args=[], annots=[], literal=literal)
+        key = (type(literal), literal)
+        res = interned_literals.get(key)
+        if res is None:
+            res = interned_literals[key] = cast(Type[MichelineLiteral], cls.create_type(args=[], annots=[], literal=literal))
+        return res
 
     @classmethod
     def as_micheline_expr(cls) -> dict:
@@ -1,6 +1,7 @@
 # Inspired by https://github.com/jansorg/tezos-intellij/blob/master/grammar/michelson.bnf
 import json
 import re
+import threading
 from typing import List, Optional
 
 from ply.lex import Lexer  # type: ignore
@@ -212,7 +213,21 @@ class MichelsonParser(object):
         """
         if len(code) > 0 and code[0] == '(' and code[-1] == ')':
             code = code[1:-1]
-        return self.parser.parse(code)
+        return self.parser.parse(code, lexer=self.lexer.lexer)
+
+
+_local = threading.local()
+
+
+def get_parser() -> MichelsonParser:
+    """ Get Michelson parser with default settings, built once per thread (PLY parsers are stateful).
+
+    :returns: MichelsonParser instance
+    """
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = MichelsonParser()
+    return parser
 
 
 def michelson_to_micheline(data, parser=None):
@@ -223,5 +238,5 @@ def michelson_to_micheline(data, parser=None):
     :returns: Micheline expression
     """
     if parser is None:
-        parser = MichelsonParser()
+        parser = get_parser()
     return parser.parse(data)
@@ -0,0 +1,188 @@
+from operator import itemgetter
+from typing import Any, Generator, Iterable, List, Optional, Tuple
+
+class Node:
+    """AVL tree node, never modified once created (shared between map versions)."""
+    __slots__ = ('key', 'value', 'left', 'right', 'height')
+
+    def __init__(self, key, value, left: Optional['Node'], right: Optional['Node'], height: int) -> None:
+        self.key = key
+        self.value = value
+        self.left = left
+        self.right = right
+        self.height = height
+
+
+missing = object()
+
+
+def _height(node: Optional[Node]) -> int:
+    return node.height if node else 0
+
+
+def _make(key, value, left: Optional[Node], right: Optional[Node]) -> Node:
+    return Node(key, value, left, right, max(_height(left), _height(right)) + 1)
+
+
+def _balance(key, value, left: Optional[Node], right: Optional[Node]) -> Node:
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:
+        assert left is not None
+        ll, lr = left.left, left.right
+        if _height(ll) >= _height(lr):
+            return _make(left.key, left.value, ll, _make(key, value, lr, right))
+        assert lr is not None
+        return _make(lr.key, lr.value, _make(left.key, left.value, ll, lr.left), _make(key, value, lr.right, right))
+    if hr > hl + 1:
+        assert right is not None
+        rl, rr = right.left, right.right
+        if _height(rr) >= _height(rl):
+            return _make(right.key, right.value, _make(key, value, left, rl), rr)
+        assert rl is not None
+        return _make(rl.key, rl.value, _make(key, value, left, rl.left), _make(right.key, right.value, rl.right, rr))
+    return Node(key, value, left, right, max(hl, hr) + 1)
+
+
+def _lookup(node: Optional[Node], key, default):
+    while node is not None:
+        k = node.key
+        if key < k:
+            node = node.left
+        elif k < key:
+            node = node.right
+        else:
+            return node.value
+    return default
+
+
+def _insert(node: Optional[Node], key, value) -> Node:
+    if node is None:
+        return Node(key, value, None, None, 1)
+    k = node.key
+    if key < k:
+        return _balance(k, node.value, _insert(node.left, key, value), node.right)
+    if k < key:
+        return _balance(k, node.value, node.left, _insert(node.right, key, value))
+    return Node(k, value, node.left, node.right, node.height)  # keep the original key object
+
+
+def _pop_min(node: Node) -> Tuple[Tuple[Any, Any], Optional[Node]]:
+    if node.left is None:
+        return (node.key, node.value), node.right
+    res, rest = _pop_min(node.left)
+    return res, _balance(node.key, node.value, rest, node.right)
+
+
+def _remove(node: Optional[Node], key) -> Optional[Node]:
+    if node is None:
+        return None
+    k, left, right = node.key, node.left, node.right
+    if key < k:
+        return _balance(k, node.value, _remove(left, key), right)
+    if k < key:
+        return _balance(k, node.value, left, _remove(right, key))
+    if left is None:
+        return right
+    if right is None:
+        return left
+    (min_k, min_v), rest = _pop_min(right)
+    return _balance(min_k, min_v, left, rest)
+
+
+def _build(items: List[Tuple[Any, Any]], lo: int, hi: int) -> Optional[Node]:
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    left, right = _build(items, lo, mid), _build(items, mid + 1, hi)
+    key, value = items[mid]
+    return Node(key, value, left, right, max(_height(left), _height(right)) + 1)
+
+
+def _iterate(node: Optional[Node]) -> Generator[Tuple[Any, Any], None, None]:
+    path: List[Node] = []
+    while path or node is not None:
+        if node is not None:
+            path.append(node)
+            node = node.left
+        else:
+            node = path.pop()
+            yield node.key, node.value
+            node = node.right
+
+
+class PersistentSortedMap:
+    """Immutable map ordered by keys (`__lt__`), implemented as an AVL tree with path copying.
+    Updates cost O(log n) and return a new map that shares all untouched nodes with the old one,
+    so previous versions stay valid (e.g. after Michelson `DUP`).
+    """
+    __slots__ = ('_root', '_len', '_items')
+
+    def __init__(self, root: Optional[Node] = None, length: int = 0) -> None:
+        self._root = root
+        self._len = length
+        self._items: Optional[List[Tuple[Any, Any]]] = None
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[Any, Any]]) -> 'PersistentSortedMap':
+        """Build balanced tree in O(n) if items are already sorted, otherwise sort them first (last duplicate wins).
+
+        :param items: iterable of (key, value) pairs
+        """
+        items = list(items)
+        if any(not a[0] < b[0] for a, b in zip(items, items[1:])):
+            res: List[Tuple[Any, Any]] = []
+            for item in sorted(items, key=itemgetter(0)):
+                if res and not res[-1][0] < item[0]:
+                    res[-1] = item
+                else:
+                    res.append(item)
+            items = res
+        return cls(_build(items, 0, len(items)), len(items))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        for key, _ in self.items():
+            yield key
+
+    def __contains__(self, key) -> bool:
+        return _lookup(self._root, key, missing) is not missing
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.items()!r})'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PersistentSortedMap):
+            return False
+        return self.items() == other.items()
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """Get sorted list of (key, value) pairs (computed once per map version)."""
+        if self._items is None:
+            self._items = list(_iterate(self._root))
+        return self._items
+
+    def keys(self) -> List[Any]:
+        return [key for key, _ in self.items()]
+
+    def get(self, key, default=None):
+        return _lookup(self._root, key, default)
+
+    def set(self, key, value) -> 'PersistentSortedMap':
+        """Get a new map with the key added or replaced.
+
+        :param key: key
+        :param value: value
+        """
+        length = self._len if key in self else self._len + 1
+        return type(self)(_insert(self._root, key, value), length)
+
+    def remove(self, key) -> 'PersistentSortedMap':
+        """Get a new map without the key (the same map if the key is not present).
+
+        :param key: key
+        """
+        if key not in self:
+            return self
+        return type(self)(_remove(self._root, key), self._len - 1)
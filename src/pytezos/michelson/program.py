@@ -2,9 +2,11 @@ from typing import Any, Dict, List, Optional, Tuple, Type, cast
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.crypto.encoding import base58_encode
+from pytezos.michelson.cache import type_cache
+from pytezos.michelson.compiler import get_compiled
 from pytezos.michelson.instructions.base import MichelsonInstruction, format_stdout
 from pytezos.michelson.instructions.tzt import BigMapInstruction, StackEltInstruction
-from pytezos.michelson.micheline import MichelineSequence, get_script_section, try_catch, validate_sections
+from pytezos.michelson.micheline import MichelineSequence, get_script_section, tracing, try_catch, validate_sections
 from pytezos.michelson.sections.code import CodeSection
 from pytezos.michelson.sections.parameter import ParameterSection
 from pytezos.michelson.sections.storage import StorageSection
@@ -43,9 +45,9 @@ class MichelsonProgram:
             MichelsonProgram.__name__,
             (MichelsonProgram,),
             dict(
-                parameter=ParameterSection.match(context.get_parameter_expr()),
-                storage=StorageSection.match(context.get_storage_expr()),
-                code=CodeSection.match(context.get_code_expr() if with_code else []),
+                parameter=type_cache.match(ParameterSection, context.get_parameter_expr()),
+                storage=type_cache.match(StorageSection, context.get_storage_expr()),
+                code=type_cache.match(CodeSection, context.get_code_expr() if with_code else []),
             ),
         )
         return cast(Type['MichelsonProgram'], cls)
@@ -67,7 +69,7 @@ class MichelsonProgram:
 
     @staticmethod
     def match(expr) -> Type['MichelsonProgram']:
-        seq = cast(Type[MichelineSequence], MichelineSequence.match(expr))
+        seq = cast(Type[MichelineSequence], type_cache.match(MichelineSequence, expr))
         if not issubclass(seq, MichelineSequence):
             raise Exception(f'Expected sequence, got {seq.prim}')
         return MichelsonProgram.create(seq)
@@ -95,9 +97,19 @@ class MichelsonProgram:
         stack.push(res)
         stdout.append(format_stdout(f'BEGIN %{self.entrypoint}', [], [res]))
 
-    def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> MichelsonInstruction:
-        """Execute contract in interpreter"""
-        return cast(MichelsonInstruction, self.code.args[0].execute(stack, stdout, context))
+    def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext, trace: bool = True) -> MichelsonInstruction:
+        """Execute contract in interpreter
+
+        :param trace: format stdout and collect executed instructions (slower), disable for batch processing
+            (code is then compiled into Python closures once and reused)
+        """
+        code = cast(Type[MichelineSequence], self.code.args[0])
+        if trace:
+            with tracing(True):
+                return cast(MichelsonInstruction, code.execute(stack, stdout, context))
+        with tracing(False):
+            get_compiled(code)(stack, stdout, context)
+        return cast(MichelsonInstruction, code([]))
 
     @try_catch('END')
     def end(self, stack: MichelsonStack, stdout: List[str], output_mode='readable') -> Tuple[List[dict], Any, List[dict], PairType]:
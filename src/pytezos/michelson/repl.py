@@ -4,7 +4,7 @@ from typing import Any, List, Optional, Tuple, cast
 from attr import dataclass
 
 from pytezos.context.impl import ExecutionContext
-from pytezos.michelson.micheline import MichelineSequence, MichelsonRuntimeError
+from pytezos.michelson.micheline import MichelineSequence, MichelsonRuntimeError, tracing
 from pytezos.michelson.parse import MichelsonParser, MichelsonParserError, michelson_to_micheline
 from pytezos.michelson.program import MichelsonProgram, TztMichelsonProgram
 from pytezos.michelson.sections import CodeSection
@@ -50,7 +50,7 @@ class Interpreter:
         context_backup = deepcopy(self.context)
 
         try:
-            code_section = CodeSection.match(michelson_to_micheline(code))
+            code_section = CodeSection.match(michelson_to_micheline(code, parser=self.parser))
             instructions = code_section.args[0].execute(self.stack, result.stdout, self.context)
             result.instructions = MichelineSequence([instructions])
             result.stack = self.stack
@@ -83,6 +83,7 @@ class Interpreter:
         sender=None,
         balance=None,
         block_id=None,
+        trace=True,
         **kwargs,
     ) -> Tuple[List[dict], Any, List[dict], List[str], Optional[Exception]]:
         """Execute contract in interpreter
@@ -98,6 +99,7 @@ class Interpreter:
         :param sender: patch SENDER
         :param balance: patch BALANCE
         :param block_id: set block ID
+        :param trace: collect execution trace in stdout, disable to run faster (stdout will contain errors only)
         """
         context = ExecutionContext(
             amount=amount,
@@ -118,11 +120,14 @@ class Interpreter:
                 parameter=parameter,
                 storage=storage,
             )
-            res.begin(stack, stdout, context)
-            res.execute(stack, stdout, context)
-            operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
-            return operations, storage, lazy_diff, stdout, None
+            with tracing(trace):
+                res.begin(stack, stdout, context)
+                res.execute(stack, stdout, context, trace=trace)
+                operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
+            return operations, storage, lazy_diff, stdout if trace else [], None
         except MichelsonRuntimeError as e:
+            if not trace:
+                stdout.clear()
             stdout.append(e.format_stdout())
             return [], None, [], stdout, e
 
@@ -132,6 +137,7 @@ class Interpreter:
         parameter,
         storage,
         context: ExecutionContext,
+        trace: bool = True,
     ) -> Tuple[Any, Any, List[str], Optional[Exception]]:
         """Execute view of contract loaded in context
 
@@ -139,6 +145,7 @@ class Interpreter:
         :param parameter: parameter section
         :param storage: storage section
         :param context: execution context
+        :param trace: collect execution trace in stdout, disable to run faster (stdout will contain errors only)
         :returns: [operations, storage, stdout, error]
         """
         ctx = ExecutionContext(
@@ -153,9 +160,10 @@ class Interpreter:
         try:
             program = MichelsonProgram.load(ctx, with_code=True)
             res = program.instantiate(entrypoint=entrypoint, parameter=parameter, storage=storage)
-            res.begin(stack, stdout, context)
-            res.execute(stack, stdout, context)
-            _, _, _, pair = res.end(stack, stdout)
+            with tracing(trace):
+                res.begin(stack, stdout, context)
+                res.execute(stack, stdout, context, trace=trace)
+                _, _, _, pair = res.end(stack, stdout)
             operations = cast(List[OperationType], list(pair.items[0]))
             storage = pair.items[1]
             # Note: the `storage` returned by the Michelson interpreter above is not
@@ -165,8 +173,10 @@ class Interpreter:
             # as if you called ContractInterface.storage() directly.
             # Re-parsing using the contract's storage section here to recover the annotations.
             storage = program.storage.from_micheline_value(storage.to_micheline_value())
-            return [op.to_python_object() for op in operations], storage.to_python_object(), stdout, None
+            return [op.to_python_object() for op in operations], storage.to_python_object(), stdout if trace else [], None
         except MichelsonRuntimeError as e:
+            if not trace:
+                stdout.clear()
             stdout.append(e.format_stdout())
             return None, None, stdout, e
 
@@ -5,40 +5,75 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class MichelsonStack:
+    """Michelson stack, `items` are ordered from top to bottom.
+
+    Internally the top is at the end of the list, so that push/pop are O(1); items protected by `protect`
+    (e.g. under DIP) are moved to separate frames and do not slow down operations on the rest of the stack.
+    """
+
     def __init__(self, items: Optional[List[MichelsonType]] = None) -> None:
-        self.items = items or []
+        self._items: List[MichelsonType] = list(reversed(items)) if items else []
+        self._frames: List[List[MichelsonType]] = []
         self.protected = 0
 
     @classmethod
     def from_items(cls, items: List[MichelsonType]) -> 'MichelsonStack':
         return cls(items)
 
+    @property
+    def items(self) -> List[MichelsonType]:
+        res: List[MichelsonType] = []
+        for frame in self._frames:
+            res.extend(reversed(frame))
+        res.extend(reversed(self._items))
+        return res
+
+    @items.setter
+    def items(self, items: List[MichelsonType]) -> None:
+        self._items = list(reversed(items))
+        self._frames = []
+        self.protected = 0
+
     def protect(self, count: int) -> None:
-        if len(self.items) < count:
-            raise Exception(f'got {len(self.items)} items on the stack, want to protect {count}')
-        self.protected += count
+        if len(self._items) < count:
+            raise Exception(f'got {len(self._items)} items on the stack, want to protect {count}')
+        if count > 0:
+            self._frames.append(self._items[-count:])
+            del self._items[-count:]
+            self.protected += count
 
     def restore(self, count: int) -> None:
         if self.protected < count:
             raise Exception(f'want to restore {count} items, but only {self.protected} are protected')
         self.protected -= count
+        while count > 0:
+            frame = self._frames[-1]
+            if len(frame) <= count:
+                self._frames.pop()
+                self._items.extend(frame)
+                count -= len(frame)
+            else:
+                self._items.extend(frame[:count])
+                del frame[:count]
+                count = 0
 
     def push(self, item: MichelsonType):
-        self.items.insert(self.protected, item)
+        self._items.append(item)
 
     def peek(self) -> MichelsonType:
-        if not self.items:
+        if not self._items:
             raise Exception('stack is empty')
-        return self.items[self.protected]
+        return self._items[-1]
 
     def pop(self, count: int) -> List[MichelsonType]:
-        if len(self.items) - self.protected < count:
-            raise Exception(f'got {len(self.items) - self.protected} items on the stack, want to pop {count}')
-        return [self.items.pop(self.protected) for _ in range(count)]
+        if len(self._items) < count:
+            raise Exception(f'got {len(self._items)} items on the stack, want to pop {count}')
+        return [self._items.pop() for _ in range(count)]
 
     def pop1(self) -> MichelsonType:
-        (a,) = self.pop(count=1)
-        return a
+        if not self._items:
+            raise Exception('got 0 items on the stack, want to pop 1')
+        return self._items.pop()
 
     def pop2(self) -> Tuple[MichelsonType, MichelsonType]:
         a, b = self.pop(count=2)
@@ -49,17 +84,18 @@ class MichelsonStack:
         return a, b, c
 
     def clear(self) -> None:
-        self.items.clear()
+        self._items.clear()
+        self._frames.clear()
         self.protected = 0
 
     def dump(self, count: int) -> Optional[List[MichelsonType]]:
-        if not self.items:
+        if not len(self):
             return None
-        count = min(count, len(self.items))
+        count = min(count, len(self))
         return self.items[:count]
 
     def __len__(self) -> int:
-        return len(self.items)
+        return len(self._items) + self.protected
 
     def __repr__(self) -> str:
         return pformat(self.items)
@@ -73,16 +73,36 @@ def wrap_parameters(expr, path):
 
 class ADTMixin:
 
+    __slots__ = ()
+
     @classmethod
     def iter_type_args(cls, entrypoints: bool = False, path='') -> Generator[Tuple[str, Type[MichelsonType]], None, None]:
         raise NotImplementedError
 
+    @classmethod
+    def get_flat_type_args(cls, entrypoints: bool = False) -> List[Tuple[str, Type[MichelsonType]]]:
+        """Get flattened (path, type) list, computed once per type class. Do not modify the result."""
+        key = ('flat_args', entrypoints)
+        layouts = cls._get_layout_cache()
+        if key not in layouts:
+            layouts[key] = list(cls.iter_type_args(entrypoints=entrypoints))
+        return layouts[key]
+
+    @classmethod
+    def _get_layout_cache(cls) -> dict:
+        # NOTE: type classes are immutable, so it's safe to store derived data on the class itself
+        res = cls.__dict__.get('_layouts')
+        if res is None:
+            res = {}
+            cls._layouts = res  # type: ignore
+        return res
+
     @classmethod
     def get_flat_args(cls, infer_names: bool = False, force_tuple: bool = False, entrypoints: bool = False) \
             -> Union[Dict[str, Type[MichelsonType]], List[Type[MichelsonType]]]:
-        flat_args = list(cls.iter_type_args(entrypoints=entrypoints))
+        flat_args = cls.get_flat_type_args(entrypoints=entrypoints)
         if force_tuple is False:
-            path_to_key, _, _ = get_type_layout(flat_args, infer_names=infer_names, entrypoints=entrypoints)
+            path_to_key, _, _ = cls.get_type_layout(infer_names=infer_names, entrypoints=entrypoints)
             if isinstance(path_to_key, dict):
                 return {path_to_key[path]: arg for path, arg in flat_args}
         return [arg for _, arg in flat_args]
@@ -90,8 +110,17 @@ class ADTMixin:
     @classmethod
     def get_type_layout(cls, infer_names: bool = False, entrypoints: bool = False) \
             -> Tuple[Optional[Dict[str, str]], Optional[Dict[str, str]], Dict[int, str]]:
-        flat_args = list(cls.iter_type_args(entrypoints=entrypoints))
-        return get_type_layout(flat_args, infer_names=infer_names, entrypoints=entrypoints)
+        """Get (path_to_key, key_to_path, idx_to_path) mappings, computed once per type class. Do not modify the result.
+
+        :param infer_names: generate names for unnamed fields
+        :param entrypoints: only take entrypoints into account
+        """
+        key = ('layout', infer_names, entrypoints)
+        layouts = cls._get_layout_cache()
+        if key not in layouts:
+            flat_args = cls.get_flat_type_args(entrypoints=entrypoints)
+            layouts[key] = get_type_layout(flat_args, infer_names=infer_names, entrypoints=entrypoints)
+        return layouts[key]
 
     def iter_values(self, path='') -> Generator[Tuple[str, MichelsonType], None, None]:
         raise NotImplementedError
@@ -114,4 +143,8 @@ class ADTMixin:
             path = idx_to_path[key]
         else:
             assert False, f'expected string or int, got {key}'
-        return next(v for p, v in self.iter_values() if p == path)
+        res = self
+        for i in path:
+            res = res.items[int(i)]  # type: ignore
+            assert res is not Undefined, f'`{key}` is not set'
+        return res
@@ -1,8 +1,9 @@
-from copy import copy, deepcopy
+from copy import copy
 from typing import Any, List, Optional, Tuple, Type, Union, cast
+from weakref import WeakValueDictionary
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
-from pytezos.michelson.forge import forge_micheline, unforge_micheline
+from pytezos.michelson.forge import forge_micheline, unforge_micheline, write_micheline
 from pytezos.michelson.micheline import Micheline
 
 type_mappings = {
@@ -51,7 +52,13 @@ def parse_name(annots: List[str], prefix: str) -> Optional[str]:
     return sub_annots[0] if sub_annots else None
 
 
+# NOTE: structurally identical types (including annotations) resolve to the same class
+interned_types: 'WeakValueDictionary[tuple, Type[MichelsonType]]' = WeakValueDictionary()
+
+
 class MichelsonType(Micheline):
+    __slots__ = ()
+
     field_name: Optional[str] = None
     type_name: Optional[str] = None
     args: List[Union[Type['MichelsonType'], Any]] = []
@@ -76,6 +83,16 @@ class MichelsonType(Micheline):
                     args: List[Type['Micheline']],
                     annots: Optional[list] = None,
                     **kwargs) -> Type['MichelsonType']:
+        field_name, type_name = parse_name(annots, '%'), parse_name(annots, ':')  # type: ignore
+        key = (cls, tuple(args), field_name, type_name, tuple(sorted(kwargs.items())))
+        hashable = True
+        try:
+            res = interned_types.get(key)
+        except TypeError:  # unhashable arguments
+            hashable, res = False, None
+        if res is not None:
+            return res
+
         type_args = [arg for arg in args if issubclass(arg, MichelsonType)]
         if cls.prim in ['list', 'set', 'map', 'big_map', 'option', 'contract', 'lambda']:
             for arg in type_args:
@@ -84,10 +101,13 @@ class MichelsonType(Micheline):
             assert type_args[0].is_comparable(), f'{cls.prim} key type has to be comparable (not {type_args[0].prim})'
         if cls.prim == 'big_map':
             assert type_args[0].is_big_map_friendly(), f'impossible big_map value type'
-        res = type(cls.__name__, (cls,), dict(field_name=parse_name(annots, '%'),  # type: ignore
-                                              type_name=parse_name(annots, ':'),  # type: ignore
+        res = type(cls.__name__, (cls,), dict(field_name=field_name,
+                                              type_name=type_name,
                                               args=args,
+                                              __slots__=(),
                                               **kwargs))
+        if hashable:
+            interned_types[key] = res
         return cast(Type['MichelsonType'], res)
 
     @classmethod
@@ -174,7 +194,7 @@ class MichelsonType(Micheline):
     def unpack(cls, data: bytes) -> 'MichelsonType':
         assert cls.is_packable(), f'{cls.prim} cannot be packed'
         assert data.startswith(b'\x05'), f'packed data should start with 05'
-        val_expr = unforge_micheline(data[1:])
+        val_expr = unforge_micheline(memoryview(data)[1:])
         return cls.from_micheline_value(val_expr)
 
     @classmethod
@@ -220,12 +240,18 @@ class MichelsonType(Micheline):
 
     def pack(self, legacy=False) -> bytes:
         assert self.is_packable(), f'{self.prim} cannot be packed'
-        data = self.forge(mode='legacy_optimized' if legacy else 'optimized')
-        return b'\x05' + data
+        buf = bytearray(b'\x05')
+        write_micheline(buf, self.to_micheline_value(mode='legacy_optimized' if legacy else 'optimized'))
+        return bytes(buf)
 
     def duplicate(self):
-        assert self.is_duplicable(), f'{self.prim} is not duplicable'
-        return deepcopy(self)
+        """Values are never mutated once created (operations return new values sharing structure with the old ones),
+        so the duplicate is the value itself. Only linear types (tickets) are checked."""
+        cls = type(self)
+        if not cls.__dict__.get('_duplicable'):
+            assert self.is_duplicable(), f'{self.prim} is not duplicable'
+            cls._duplicable = True
+        return self
 
 
 def generate_pydoc(ty: Type[MichelsonType], title=None):
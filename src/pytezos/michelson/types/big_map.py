@@ -1,9 +1,10 @@
-from copy import copy, deepcopy
+from copy import copy
 from typing import Dict, Generator, List, Optional, Tuple, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.forge import forge_script_expr
 from pytezos.michelson.micheline import Micheline, MichelineLiteral, MichelineSequence, parse_micheline_literal
+from pytezos.michelson.persistent import PersistentSortedMap
 from pytezos.michelson.types.base import MichelsonType, Undefined
 from pytezos.michelson.types.map import EltLiteral, MapType
 
@@ -36,17 +37,26 @@ def big_map_diff_to_lazy_diff(big_map_diff: List[dict]):
 
 class BigMapType(MapType, prim='big_map', args_len=2):
 
+    __slots__ = ('ptr', '_removed', 'context')
+
     def __init__(self,
-                 items: List[Tuple[MichelsonType, MichelsonType]],
+                 items: Union[List[Tuple[MichelsonType, MichelsonType]], PersistentSortedMap],
                  ptr: Optional[int] = None,
-                 removed_keys: Optional[List[MichelsonType]] = None):
+                 removed_keys: Optional[Union[List[MichelsonType], PersistentSortedMap]] = None):
         super(BigMapType, self).__init__(items=items)
         self.ptr = ptr
-        self.removed_keys = removed_keys or []
+        if isinstance(removed_keys, PersistentSortedMap):
+            self._removed = removed_keys
+        else:
+            self._removed = PersistentSortedMap.from_items((key, True) for key in removed_keys or [])
         self.context: Optional[AbstractContext] = None
 
+    @property
+    def removed_keys(self) -> List[MichelsonType]:
+        return self._removed.keys()
+
     def __len__(self):
-        return len(self.items) + len(self.removed_keys)
+        return len(self._tree) + len(self._removed)
 
     def __iter__(self) -> Generator[Tuple[MichelsonType, Optional[MichelsonType]], None, None]:  # type: ignore
         yield from iter(self.items)
@@ -204,7 +214,9 @@ class BigMapType(MapType, prim='big_map', args_len=2):
 
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
-        val = next((v for k, v in self if k == key), Undefined)  # search in diff
+        val = self._tree.get(key, Undefined)  # search in diff
+        if val is Undefined and key in self._removed:
+            return None
         if val is Undefined:
             assert self.context, f'context is not attached'
             key_hash = forge_script_expr(key.pack(legacy=True))
@@ -216,23 +228,38 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         else:
             return val  # type: ignore
 
+    def get_many(self, keys: List[MichelsonType], concurrency: Optional[int] = None) -> List[Optional[MichelsonType]]:
+        """Get multiple values at once, keys missing in the local diff are fetched concurrently.
+
+        :param keys: list of keys
+        :param concurrency: maximum number of simultaneous RPC requests (default is `DEFAULT_CONCURRENCY`)
+        """
+        res = []
+        missing: Dict[int, str] = {}
+        for i, key in enumerate(keys):
+            self.args[0].assert_type_equal(type(key))
+            val = self._tree.get(key, Undefined)
+            if val is Undefined and key not in self._removed:
+                missing[i] = forge_script_expr(key.pack(legacy=True))
+            res.append(None if val is Undefined else val)
+        if missing:
+            assert self.context, f'context is not attached'
+            val_exprs = self.context.get_big_map_values(self.ptr, list(missing.values()), concurrency=concurrency)  # type: ignore
+            for i, val_expr in zip(missing, val_exprs):
+                if val_expr is not None:
+                    res[i] = self.args[1].from_micheline_value(val_expr)
+        return res
+
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        removed_keys = set(self.removed_keys)
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self]
-            else:  # remove
-                items = [(k, v) for k, v in self if k != key]
-                removed_keys.add(key)
-        else:
-            if val is not None:
-                items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
-                if key in removed_keys:
-                    removed_keys.remove(key)
-            else:  # do nothing
-                items = self.items  # type: ignore
-        res = type(self)(items=items, ptr=self.ptr, removed_keys=list(removed_keys))  # type: ignore
+        items, removed_keys = self._tree, self._removed
+        if val is not None:
+            items = items.set(key, val)
+            removed_keys = removed_keys.remove(key)
+        elif prev_val is not None:  # remove
+            items = items.remove(key)
+            removed_keys = removed_keys.set(key, True)
+        res = type(self)(items=items, ptr=self.ptr, removed_keys=removed_keys)
         res.context = self.context
         return prev_val, res
 
@@ -241,9 +268,10 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         return forge_script_expr(key.pack(legacy=True))
 
     def duplicate(self):
-        res = type(self)(items=deepcopy(self.items),
+        # NOTE: ptr and context can be changed by `attach_context`, so the wrapper is copied; the diff itself is shared
+        res = type(self)(items=self._tree,
                          ptr=self.ptr,
-                         removed_keys=deepcopy(self.removed_keys))
+                         removed_keys=self._removed)
         res.context = self.context
         return res
 
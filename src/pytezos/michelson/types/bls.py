@@ -11,6 +11,8 @@ from pytezos.michelson.types.core import BytesType, IntType
 
 
 class BLS12_381_FrType(IntType, prim='bls12_381_fr'):
+    __slots__ = ()
+
     modulus = 0x73EDA753299D7D483339D80809A1D80553BDA402FFFE5BFEFFFFFFFF00000001
 
     def __init__(self, value: int):
@@ -61,6 +63,8 @@ class BLS12_381_FrType(IntType, prim='bls12_381_fr'):
 
 class BLS12_381_G1Type(BytesType, prim='bls12_381_g1'):
 
+    __slots__ = ()
+
     @classmethod
     def from_value(cls, value: bytes):
         assert len(value) == 96, f'expected 98 bytes, got {len(value)}'
@@ -89,6 +93,8 @@ class BLS12_381_G1Type(BytesType, prim='bls12_381_g1'):
 
 class BLS12_381_G2Type(BytesType, prim='bls12_381_g2'):
 
+    __slots__ = ()
+
     @classmethod
     def from_value(cls, value: bytes):
         assert len(value) == 192, f'expected 98 bytes, got {len(value)}'
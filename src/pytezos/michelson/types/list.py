@@ -7,6 +7,8 @@ from pytezos.michelson.types.base import MichelsonType
 
 class ListType(MichelsonType, prim='list', args_len=1):
 
+    __slots__ = ('items',)
+
     def __init__(self, items: List[MichelsonType]):
         super(ListType, self).__init__()
         self.items = items
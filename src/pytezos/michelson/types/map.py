@@ -1,7 +1,8 @@
-from typing import Generator, List, Optional, Tuple, Type
+from typing import Generator, List, Optional, Tuple, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline, MichelineSequence, parse_micheline_value
+from pytezos.michelson.persistent import PersistentSortedMap
 from pytezos.michelson.types.base import MichelsonType
 
 
@@ -11,16 +12,22 @@ class EltLiteral(Micheline, prim='Elt', args_len=2):
 
 class MapType(MichelsonType, prim='map', args_len=2):
 
-    def __init__(self, items: List[Tuple[MichelsonType, MichelsonType]]):
+    __slots__ = ('_tree',)
+
+    def __init__(self, items: Union[List[Tuple[MichelsonType, MichelsonType]], PersistentSortedMap]):
         super(MapType, self).__init__()
-        self.items = items
+        self._tree = items if isinstance(items, PersistentSortedMap) else PersistentSortedMap.from_items(items)
+
+    @property
+    def items(self) -> List[Tuple[MichelsonType, MichelsonType]]:
+        return self._tree.items()
 
     def __repr__(self):
         elements = [f'{repr(k)}: {repr(v)}' for k, v in self.items]
         return f'{{{", ".join(elements)}}}'
 
     def __len__(self):
-        return len(self.items)
+        return len(self._tree)
 
     def __iter__(self) -> Generator[Tuple[MichelsonType, MichelsonType], None, None]:
         yield from iter(self.items)
@@ -48,9 +55,10 @@ class MapType(MichelsonType, prim='map', args_len=2):
 
     @classmethod
     def check_constraints(cls, items: List[Tuple[MichelsonType, MichelsonType]]):
-        keys = list(map(lambda x: x[0], items))
-        assert len(set(keys)) == len(keys), f'duplicate keys found'
-        assert keys == list(sorted(keys)), f'keys are unsorted'
+        for (prev, _), (key, _) in zip(items, items[1:]):
+            if not prev < key:
+                assert not prev == key, f'duplicate keys found'
+                assert False, f'keys are unsorted'
 
     @classmethod
     def generate_pydoc(cls, definitions: List[Tuple[str, str]], inferred_name=None, comparable=False):
@@ -132,23 +140,22 @@ class MapType(MichelsonType, prim='map', args_len=2):
         self.args[0].assert_type_equal(type(key))
         if dup:
             assert self.args[1].is_duplicable(), f'use GET_AND_UPDATE instead'
-        return next((v for k, v in self.items if k == key), None)
+        return self._tree.get(key)
+
+    def get_many(self, keys: List[MichelsonType]) -> List[Optional[MichelsonType]]:
+        return [self.get(key, dup=False) for key in keys]
 
     def contains(self, key: MichelsonType):
         return self.get(key, dup=False) is not None
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self.items]
-            else:  # remove
-                items = [(k, v) for k, v in self.items if k != key]
-        else:
-            if val is not None:
-                items = list(sorted(self.items + [(key, val)], key=lambda x: x[0]))
-            else:  # do nothing
-                items = self.items
+        if val is not None:
+            items = self._tree.set(key, val)
+        elif prev_val is not None:  # remove
+            items = self._tree.remove(key)
+        else:  # do nothing
+            items = self._tree
         return prev_val, type(self)(items)
 
     def __contains__(self, key_obj):
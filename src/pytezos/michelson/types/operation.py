@@ -6,6 +6,8 @@ from pytezos.michelson.types.base import MichelsonType
 
 class OperationType(MichelsonType, prim='operation'):
 
+    __slots__ = ('content', 'ty')
+
     def __init__(self, content: dict, ty: Optional[Type[MichelsonType]] = None):
         super(OperationType, self).__init__()
         self.content = content
@@ -12,6 +12,8 @@ class PairLiteral(Micheline, prim='Pair', args_len=None):
 
 class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
 
+    __slots__ = ('items',)
+
     def __init__(self, items: Tuple[MichelsonType, ...]):
         super(PairType, self).__init__()
         self.items = items
@@ -26,9 +28,11 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
 
     def __lt__(self, other: 'PairType'):  # type: ignore
         for i, item in enumerate(self.items):
-            if item > other.items[i]:
+            if item < other.items[i]:
+                return True
+            if other.items[i] < item:
                 return False
-        return True
+        return False
 
     def __hash__(self):
         return hash(self.items)
@@ -7,11 +7,13 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class SaplingTransactionType(MichelsonType, prim='sapling_transaction', args_len=1):
-    pass
+    __slots__ = ()
 
 
 class SaplingStateType(MichelsonType, prim='sapling_state', args_len=1):
 
+    __slots__ = ('ptr', 'context')
+
     def __init__(self, ptr: Optional[int] = None):
         super(SaplingStateType, self).__init__()
         self.ptr = ptr
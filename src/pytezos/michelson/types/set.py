@@ -1,25 +1,35 @@
 from copy import copy
-from typing import Generator, List, Type
+from typing import Generator, List, Type, Union
 
 from pytezos.context.abstract import AbstractContext  # type: ignore
 from pytezos.michelson.micheline import Micheline, MichelineSequence
+from pytezos.michelson.persistent import PersistentSortedMap
 from pytezos.michelson.types.base import MichelsonType
 
 
 class SetType(MichelsonType, prim='set', args_len=1):
 
-    def __init__(self, items: List[MichelsonType]):
+    __slots__ = ('_tree',)
+
+    def __init__(self, items: Union[List[MichelsonType], PersistentSortedMap]):
         super(SetType, self).__init__()
-        self.items = items
+        if isinstance(items, PersistentSortedMap):
+            self._tree = items
+        else:
+            self._tree = PersistentSortedMap.from_items((item, True) for item in items)
+
+    @property
+    def items(self) -> List[MichelsonType]:
+        return self._tree.keys()
 
     def __repr__(self):
         return f'{{{", ".join(map(repr, self.items))}}}'
 
     def __len__(self):
-        return len(self.items)
+        return len(self._tree)
 
     def __iter__(self) -> Generator[MichelsonType, None, None]:
-        yield from iter(self.items)
+        yield from iter(self._tree)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, SetType):
@@ -43,8 +53,10 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     @classmethod
     def check_constraints(cls, items: List[MichelsonType]):
-        assert len(set(items)) == len(items), f'duplicate elements found'
-        assert items == list(sorted(items)), f'set elements are not sorted'
+        for prev, item in zip(items, items[1:]):
+            if not prev < item:
+                assert not prev == item, f'duplicate elements found'
+                assert False, f'set elements are not sorted'
 
     @classmethod
     def dummy(cls, context: AbstractContext):
@@ -91,19 +103,17 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     def contains(self, item: MichelsonType) -> bool:
         self.args[0].assert_type_equal(type(item))
-        return item in self.items
+        return item in self._tree
 
     def add(self, item: MichelsonType) -> 'SetType':
         if self.contains(item):
             return copy(self)
         else:
-            items = [item] + self.items
-            return type(self)(list(sorted(items)))
+            return type(self)(self._tree.set(item, True))
 
     def remove(self, item: MichelsonType) -> 'SetType':
         if self.contains(item):
-            items = list(filter(lambda x: x != item, self.items))
-            return type(self)(items)
+            return type(self)(self._tree.remove(item))
         else:
             return copy(self)
 
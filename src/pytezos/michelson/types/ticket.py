@@ -12,6 +12,8 @@ from pytezos.michelson.types.pair import PairType
 
 class TicketType(MichelsonType, prim='ticket', args_len=1):
 
+    __slots__ = ('ticketer', 'item', 'amount')
+
     def __init__(self, ticketer: str, item: MichelsonType, amount: int):
         super(TicketType, self).__init__()
         self.ticketer = ticketer
@@ -0,0 +1,252 @@
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from attr import dataclass
+
+from pytezos.context.impl import ExecutionContext  # type: ignore
+from pytezos.context.mixin import ContextMixin  # type: ignore
+from pytezos.logging import logger
+from pytezos.operation import DEFAULT_BURN_RESERVE, DEFAULT_GAS_RESERVE, MAX_OPERATIONS_TTL
+from pytezos.operation.estimator import Estimator
+from pytezos.operation.fees import default_fee, default_gas_limit, default_storage_limit
+from pytezos.operation.forge import forge_operation
+from pytezos.operation.group import OperationGroup
+from pytezos.operation.result import OperationResult
+from pytezos.rpc.errors import RpcError
+from pytezos.rpc.search import DEFAULT_CONCURRENCY, prefetch
+
+DEFAULT_MAX_OPERATION_DATA_LENGTH = 32 * 1024
+DEFAULT_HARD_GAS_LIMIT_PER_BLOCK = 10400000
+
+
+@dataclass(kw_only=True)
+class BatchGroupResult:
+    """Status of a single operation group sent by `BatchSender`:
+    `pending` -> `failed` (simulation or injection error) | `injected` -> `applied` | `failed` (not included or backtracked)
+    """
+
+    contents: List[Dict[str, Any]]
+    status: str = 'pending'
+    opg_hash: Optional[str] = None
+    error: Optional[Exception] = None
+
+
+class BatchSender(ContextMixin):
+    """Send a large number of manager operations (e.g. payouts) split into multiple operation groups.
+
+    Groups are processed in windows of `max_pending`: chain state is fetched once per window, groups are simulated
+    concurrently, counters are reserved from the shared `CounterManager`, groups are signed in a batch and injected one by one.
+    The next window starts only when the previous one is included (back-pressure).
+    """
+
+    def __init__(
+        self,
+        context: ExecutionContext,
+        max_gas: Optional[int] = None,
+        max_size: Optional[int] = None,
+        max_contents: Optional[int] = None,
+        max_pending: int = 1,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ttl: Optional[int] = None,
+        gas_reserve: int = DEFAULT_GAS_RESERVE,
+        burn_reserve: int = DEFAULT_BURN_RESERVE,
+        estimator: Optional[Estimator] = None,
+    ) -> None:
+        """
+        :param context: execution context (shell and key)
+        :param max_gas: gas limit per group, estimated before simulation (default is `hard_gas_limit_per_block`)
+        :param max_size: size limit in bytes per group (default is `max_operation_data_length`)
+        :param max_contents: maximum number of contents per group
+        :param max_pending: number of groups injected before waiting for their inclusion (set higher only if the node \
+        accepts several pending operations from the same source)
+        :param concurrency: maximum number of simultaneous simulations
+        :param ttl: Number of blocks to wait in the mempool before removal (default is 5 for public network, 60 for sandbox)
+        :param gas_reserve: Add a safe reserve for dynamically calculated gas limit (default is 100).
+        :param burn_reserve: Add a safe reserve for dynamically calculated storage limit (default is 100).
+        :param estimator: Estimate gas/storage locally when possible instead of simulating (see `HistoryEstimator`)
+        """
+        super().__init__(context=context)
+        self.max_gas = max_gas
+        self.max_size = max_size
+        self.max_contents = max_contents
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self.ttl = ttl
+        self.gas_reserve = gas_reserve
+        self.burn_reserve = burn_reserve
+        self.estimator = estimator
+
+    def _fill_content(self, content: Dict[str, Any], counter: int) -> Dict[str, Any]:
+        source = self.key.public_key_hash()
+        content = content.copy()
+        replace_map = {
+            'pkh': source,
+            'source': source,
+            'delegate': source,
+            'public_key': lambda: self.key.public_key(),
+            'counter': lambda: str(counter),
+            'gas_limit': lambda: str(default_gas_limit(content, self.context.constants)),
+            'storage_limit': lambda: str(default_storage_limit(content, self.context.constants)),
+            'fee': lambda: str(default_fee(content, int(content['gas_limit']))),
+        }
+        for k, v in replace_map.items():
+            if content.get(k) in ['', '0']:
+                content[k] = v() if callable(v) else v
+        return content
+
+    def split(self, contents: Iterable[Union[Dict[str, Any], OperationGroup]]) -> List[List[Dict[str, Any]]]:
+        """Split contents into groups fitting gas, size, and count limits. Gas and size are estimated
+        using default (pessimistic) limits and fees.
+
+        :param contents: operation contents or operation groups (will be flattened)
+        :returns: list of content lists
+        """
+        max_gas = self.max_gas or int(self.context.constants.get('hard_gas_limit_per_block', DEFAULT_HARD_GAS_LIMIT_PER_BLOCK))
+        max_size = self.max_size or int(self.context.constants.get('max_operation_data_length', DEFAULT_MAX_OPERATION_DATA_LENGTH))
+        max_size -= 32 + 64  # branch and signature
+
+        groups: List[List[Dict[str, Any]]] = []
+        group: List[Dict[str, Any]] = []
+        group_gas, group_size = 0, 0
+        for item in contents:
+            for content in item.contents if isinstance(item, OperationGroup) else [item]:
+                filled = self._fill_content(content, counter=2 ** 32)
+                gas = int(filled['gas_limit'])
+                size = len(forge_operation(filled))
+                if gas > max_gas or size > max_size:
+                    raise ValueError(f'Operation content exceeds group limits: {content}')
+                if group and (
+                    group_gas + gas > max_gas or group_size + size > max_size or (self.max_contents and len(group) >= self.max_contents)
+                ):
+                    groups.append(group)
+                    group, group_gas, group_size = [], 0, 0
+                group.append(content)
+                group_gas += gas
+                group_size += size
+        if group:
+            groups.append(group)
+        return groups
+
+    def send(self, contents: Iterable[Union[Dict[str, Any], OperationGroup]], min_confirmations: int = 0) -> List[BatchGroupResult]:
+        """Split, simulate, sign, and inject operation contents.
+
+        :param contents: operation contents or operation groups (will be flattened)
+        :param min_confirmations: number of blocks to wait for after the last window is included \
+        (default is 0, i.e. do not wait for the last window)
+        :returns: per-group results, in order
+        """
+        ttl = self.ttl or self.context.get_operations_ttl()
+        chain_id = self.context.get_chain_id()
+        protocol = self.context.get_protocol()
+
+        results = [BatchGroupResult(contents=group) for group in self.split(contents)]
+        queue: Deque[BatchGroupResult] = deque(results)
+        while queue:
+            window = [queue.popleft() for _ in range(min(self.max_pending, len(queue)))]
+            injected, skipped = self._send_window(window, ttl=ttl, chain_id=chain_id, protocol=protocol)
+            queue.extendleft(reversed(skipped))
+            if injected and (queue or min_confirmations > 0):
+                self._wait(injected, ttl=ttl, min_confirmations=max(1, min_confirmations))
+        return results
+
+    def _send_window(
+        self,
+        window: List[BatchGroupResult],
+        ttl: int,
+        chain_id: str,
+        protocol: str,
+    ) -> Tuple[List[BatchGroupResult], List[BatchGroupResult]]:
+        branch = self.context.get_branch(MAX_OPERATIONS_TTL - ttl)
+        counter = self.context.counter_manager.get_head_counter()
+
+        # NOTE: every group is simulated as if it were the next one, counters are shifted afterwards
+        opgs = [
+            OperationGroup(
+                context=self.context,
+                contents=[self._fill_content(content, counter + i + 1) for i, content in enumerate(result.contents)],
+                protocol=protocol,
+                chain_id=chain_id,
+                branch=branch,
+            )
+            for result in window
+        ]
+
+        def simulate(opg: OperationGroup) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+            try:
+                return opg.simulate(self.estimator), None
+            except Exception as e:
+                return None, e
+
+        filled: List[Tuple[BatchGroupResult, OperationGroup]] = []
+        for result, opg, (opg_with_metadata, error) in zip(window, opgs, prefetch(simulate, opgs, self.concurrency)):
+            if error:
+                logger.info('Simulation failed: %s', error)
+                result.status, result.error = 'failed', error
+                continue
+            first_counter = self.context.counter_manager.reserve(len(opg.contents), min_counter=counter + 1)
+            opg = opg.fill_limits(
+                opg_with_metadata,  # type: ignore
+                gas_reserve=self.gas_reserve,
+                burn_reserve=self.burn_reserve,
+                counter_offset=first_counter - (counter + 1),
+            )
+            filled.append((result, opg))
+
+        signatures = self.key.sign_many([opg.signing_message() for _, opg in filled], generic=True)
+        signed = [opg._spawn(signature=signature) for (_, opg), signature in zip(filled, signatures)]
+
+        injected: List[BatchGroupResult] = []
+        for i, ((result, _), opg) in enumerate(zip(filled, signed)):
+            try:
+                result.opg_hash = opg.inject(min_confirmations=0)['hash']
+            except Exception as e:
+                logger.info('Injection failed: %s', e)
+                result.status, result.error = 'failed', e
+                for unused_opg in reversed(signed[i:]):  # inject releases the failed group on RpcError only
+                    self.context.counter_manager.release(int(unused_opg.contents[0]['counter']))
+                return injected, [x for x, _ in filled[i + 1 :]]  # counters are not valid anymore, retry in the next window
+            logger.debug('Injected %s (%d contents)', result.opg_hash, len(opg.contents))
+            result.status = 'injected'
+            injected.append(result)
+        return injected, []
+
+    def _wait(self, injected: List[BatchGroupResult], ttl: int, min_confirmations: int) -> None:
+        try:
+            operations = self.shell.wait_operations(
+                opg_hashes=[result.opg_hash for result in injected],  # type: ignore
+                ttl=ttl,
+                min_confirmations=min_confirmations,
+            )
+        except (StopIteration, RuntimeError) as e:  # not all included, or reorg (StopIteration raised in a generator)
+            logger.info('Not all operations were included: %s', e)
+            included = self._find_operations([result.opg_hash for result in injected], ttl=ttl)  # type: ignore
+            for result in injected:
+                if result.opg_hash not in included:
+                    result.status, result.error = 'failed', e
+        else:
+            included = {operation['hash']: operation for operation in operations}
+
+        for result in injected:
+            operation = included.get(result.opg_hash)  # type: ignore
+            if operation is None:
+                continue
+            if OperationResult.is_applied(operation):
+                result.status = 'applied'
+            else:
+                result.status, result.error = 'failed', RpcError.from_errors(OperationResult.errors(operation))
+                if self.estimator is not None:
+                    for content in result.contents:
+                        self.estimator.forget(content)
+
+    def _find_operations(self, opg_hashes: List[str], ttl: int) -> Dict[str, Dict[str, Any]]:
+        block_hashes = self.shell.blocks(length=ttl + 1)[0]
+        operations: Dict[str, Dict[str, Any]] = {}
+        for block_hash, operation_hashes in zip(
+            block_hashes,
+            prefetch(lambda x: self.shell.blocks[x].operation_hashes(), block_hashes, self.concurrency),
+        ):
+            for i, validation_pass in enumerate(operation_hashes):
+                for j, opg_hash in enumerate(validation_pass):
+                    if opg_hash in opg_hashes and opg_hash not in operations:
+                        operations[opg_hash] = self.shell.blocks[block_hash].operations[i][j]()
+        return operations
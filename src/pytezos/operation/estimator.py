@@ -0,0 +1,134 @@
+from collections import deque
+from math import ceil
+from threading import Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from pytezos.michelson.forge import forge_micheline
+from pytezos.operation.result import OperationResult
+
+DEFAULT_ESTIMATE_MARGIN = 0.1
+DEFAULT_MIN_SAMPLES = 3
+DEFAULT_HISTORY_SIZE = 100
+
+EstimateKey = Tuple[str, str, int]
+
+
+class Estimator:
+    """Local replacement for `run_operation` used to fill gas and storage limits (see `OperationGroup.simulate`)."""
+
+    fallback = True  # simulate operations that cannot be estimated instead of failing
+
+    def estimate(self, content: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        """Estimate resources needed by an operation content.
+
+        :param content: operation content {..., "kind": "transaction", ... }
+        :returns: (consumed gas, storage size incl. allocations) or None if unknown
+        """
+        raise NotImplementedError
+
+    def learn(self, content: Dict[str, Any]) -> None:
+        """Take into account an actual result.
+
+        :param content: operation content with metadata (simulated or applied)
+        """
+        raise NotImplementedError
+
+    def forget(self, content: Dict[str, Any]) -> None:
+        """Drop what was learned for similar operations (e.g. after the operation failed on chain).
+
+        :param content: operation content {..., "kind": "transaction", ... }
+        """
+
+    def estimate_group(self, contents: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Estimate all contents of an operation group.
+
+        :param contents: operation contents
+        :returns: `run_operation`-like response with estimated results or None if any of contents is unknown
+        """
+        res = []
+        for content in contents:
+            estimate = self.estimate(content)
+            if estimate is None:
+                return None
+            gas, storage = estimate
+            operation_result = {'status': 'applied', 'consumed_gas': str(gas), 'paid_storage_size_diff': str(storage)}
+            res.append({**content, 'metadata': {'operation_result': operation_result}})
+        return {'contents': res}
+
+
+class HistoryEstimator(Estimator):
+    """Learns gas and storage consumption per (contract, entrypoint, parameter size bucket) from past results
+    and estimates new operations as the maximum over the recent history plus a safety margin.
+    Only transactions are estimated, anything else (or too short history) falls back to simulation.
+    """
+
+    def __init__(
+        self,
+        margin: float = DEFAULT_ESTIMATE_MARGIN,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        simulate_every: Optional[int] = None,
+        fallback: bool = True,
+    ) -> None:
+        """
+        :param margin: relative safety margin added to the observed maximum (default is 10%)
+        :param min_samples: number of results required before estimating
+        :param history_size: number of recent results kept per key
+        :param simulate_every: still simulate every N-th operation per key in order to keep learning (never by default)
+        :param fallback: simulate operations that cannot be estimated, raise `ValueError` otherwise
+        """
+        self.margin = margin
+        self.min_samples = min_samples
+        self.history_size = history_size
+        self.simulate_every = simulate_every
+        self.fallback = fallback
+        self._history: Dict[EstimateKey, Deque[Tuple[int, int]]] = {}
+        self._hits: Dict[EstimateKey, int] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(content: Dict[str, Any]) -> Optional[EstimateKey]:
+        """Get history key for an operation content, None if not supported.
+
+        :param content: operation content {..., "kind": "transaction", ... }
+        """
+        if content['kind'] != 'transaction':
+            return None
+        parameters = content.get('parameters')
+        if parameters:
+            entrypoint = parameters.get('entrypoint', 'default')
+            size = len(forge_micheline(parameters['value']))
+        else:
+            entrypoint, size = 'default', 0
+        return content['destination'], entrypoint, size.bit_length()
+
+    def learn(self, content: Dict[str, Any]) -> None:
+        key = self.get_key(content)
+        if key is None or not OperationResult.is_applied(content):
+            return
+        gas = OperationResult.consumed_gas(content)
+        storage = OperationResult.paid_storage_size_diff(content) + OperationResult.burned(content)
+        with self._lock:
+            history = self._history.setdefault(key, deque(maxlen=self.history_size))
+            history.append((gas, storage))
+
+    def forget(self, content: Dict[str, Any]) -> None:
+        key = self.get_key(content)
+        with self._lock:
+            self._history.pop(key, None)  # type: ignore
+            self._hits.pop(key, None)  # type: ignore
+
+    def estimate(self, content: Dict[str, Any]) -> Optional[Tuple[int, int]]:
+        key = self.get_key(content)
+        if key is None:
+            return None
+        with self._lock:
+            history = self._history.get(key)
+            if not history or len(history) < self.min_samples:
+                return None
+            hits = self._hits[key] = self._hits.get(key, 0) + 1
+            if self.simulate_every and hits % self.simulate_every == 0:
+                return None
+            gas = max(x for x, _ in history)
+            storage = max(x for _, x in history)
+        return ceil(gas * (1 + self.margin)), ceil(storage * (1 + self.margin))
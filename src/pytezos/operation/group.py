@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from deprecation import deprecated  # type: ignore
 
+from pytezos.context.counter import CounterManager
 from pytezos.context.impl import ExecutionContext  # type: ignore
 from pytezos.context.mixin import ContextMixin  # type: ignore
 from pytezos.crypto.encoding import base58_decode, base58_encode, is_bh
@@ -12,6 +13,7 @@ from pytezos.logging import logger
 from pytezos.michelson.forge import forge_base58
 from pytezos.operation import DEFAULT_BURN_RESERVE, DEFAULT_GAS_RESERVE, MAX_OPERATIONS_TTL
 from pytezos.operation.content import ContentMixin
+from pytezos.operation.estimator import Estimator
 from pytezos.operation.fees import calculate_fee, default_fee, default_gas_limit, default_storage_limit
 from pytezos.operation.forge import forge_operation_group
 from pytezos.operation.result import OperationResult
@@ -43,6 +45,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         self.signature = signature
         self.opg_hash = opg_hash
         self.opg_result = opg_result
+        self._counter_owner = object()  # shared by spawned groups, so that re-filling replaces the reserved counters
 
     def __repr__(self) -> str:
         res = [
@@ -55,7 +58,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         return '\n'.join(res)
 
     def _spawn(self, **kwargs) -> 'OperationGroup':
-        return OperationGroup(
+        opg = OperationGroup(
             context=self.context,
             contents=kwargs.get('contents', self.contents.copy()),
             protocol=kwargs.get('protocol', self.protocol),
@@ -65,6 +68,8 @@ class OperationGroup(ContextMixin, ContentMixin):
             opg_hash=kwargs.get('opg_hash', self.opg_hash),
             opg_result=kwargs.get('opg_result', self.opg_result),
         )
+        opg._counter_owner = self._counter_owner
+        return opg
 
     def json_payload(self) -> Dict[str, Any]:
         """Get JSON payload used for the injection."""
@@ -122,7 +127,7 @@ class OperationGroup(ContextMixin, ContentMixin):
 
         chain_id = self.chain_id or self.context.get_chain_id()
         protocol = self.protocol or self.context.get_protocol()
-        branch = self.branch or self.shell.blocks[f'head~{MAX_OPERATIONS_TTL - ttl}'].hash()
+        branch = self.branch or self.context.get_branch(MAX_OPERATIONS_TTL - ttl)
         source = self.key.public_key_hash()
 
         if counter is not None:
@@ -174,6 +179,29 @@ class OperationGroup(ContextMixin, ContentMixin):
             }
         )
 
+    def simulate(self, estimator: Optional[Estimator] = None) -> Dict[str, Any]:
+        """Get consumed gas and paid storage for all contents: estimate locally if possible, otherwise run the operation
+        (and let the estimator learn from the result).
+
+        :param estimator: local estimator, if not set the operation is always simulated
+        :returns: RPC response from `run_operation` (or a locally estimated one)
+        """
+        if estimator is not None:
+            estimated = estimator.estimate_group(self.contents)
+            if estimated is not None:
+                logger.debug('estimated locally: %s', estimated)
+                return estimated
+            if not estimator.fallback:
+                raise ValueError('Cannot estimate operation group locally')
+
+        opg_with_metadata = self.run()
+        if not OperationResult.is_applied(opg_with_metadata):
+            raise RpcError.from_errors(OperationResult.errors(opg_with_metadata))
+        if estimator is not None:
+            for content in opg_with_metadata['contents']:
+                estimator.learn(content)
+        return opg_with_metadata
+
     def forge(self, validate=False) -> str:
         """Convert json representation of the operation group into bytes.
 
@@ -214,6 +242,8 @@ class OperationGroup(ContextMixin, ContentMixin):
         fee: Optional[int] = None,
         gas_limit: Optional[int] = None,
         storage_limit: Optional[int] = None,
+        estimator: Optional[Estimator] = None,
+        reserve_counter: bool = False,
         **kwargs,
     ) -> 'OperationGroup':
         """Fill the gaps and then simulate the operation in order to calculate fee, gas/storage limits.
@@ -227,6 +257,9 @@ class OperationGroup(ContextMixin, ContentMixin):
             operation dry-run.
         :param storage_limit: Explicitly set storage limit for operation. If not set storage limit will be calculated depending on
             results of operation dry-run.
+        :param estimator: Estimate gas/storage locally when possible instead of operation dry-run (see `HistoryEstimator`)
+        :param reserve_counter: Take counters from the shared `CounterManager` instead of the head counter plus pending operations, \
+        so that groups sent concurrently with the same key do not collide (reservation is kept until injection or timeout)
         :rtype: OperationGroup
         """
         if kwargs.get('branch_offset') is not None:
@@ -234,13 +267,58 @@ class OperationGroup(ContextMixin, ContentMixin):
             ttl = MAX_OPERATIONS_TTL - kwargs['branch_offset']
 
         opg = self.fill(counter=counter, ttl=ttl)
-        opg_with_metadata = opg.run()
-        if not OperationResult.is_applied(opg_with_metadata):
-            raise RpcError.from_errors(OperationResult.errors(opg_with_metadata))
+        opg_with_metadata = opg.simulate(estimator)
+
+        counter_offset = 0
+        manager_contents = [content for content in opg.contents if validation_passes[content['kind']] == 3]
+        if manager_contents:
+            if counter is None and reserve_counter:
+                # NOTE: simulated as the next operation (head counter + 1), then moved to atomically reserved counters
+                next_counter = int(manager_contents[0]['counter'])
+                first_counter = self.context.counter_manager.reserve(
+                    len(manager_contents),
+                    min_counter=next_counter,
+                    owner=self._counter_owner,
+                )
+                counter_offset = first_counter - next_counter
+            else:
+                counter_offset = self.context.get_counter_offset()
+
+        return opg.fill_limits(
+            opg_with_metadata,
+            gas_reserve=gas_reserve,
+            burn_reserve=burn_reserve,
+            counter_offset=counter_offset,
+            fee=fee,
+            gas_limit=gas_limit,
+            storage_limit=storage_limit,
+        )
+
+    def fill_limits(
+        self,
+        opg_with_metadata: Dict[str, Any],
+        gas_reserve: int = DEFAULT_GAS_RESERVE,
+        burn_reserve: int = DEFAULT_BURN_RESERVE,
+        counter_offset: int = 0,
+        fee: Optional[int] = None,
+        gas_limit: Optional[int] = None,
+        storage_limit: Optional[int] = None,
+    ) -> 'OperationGroup':
+        """Set fee, gas/storage limits (and shift counters) using the simulation results.
 
-        extra_size = (32 + 64) // len(opg.contents) + 1  # size of serialized branch and signature
+        :param opg_with_metadata: RPC response from `run_operation` for this operation group
+        :param gas_reserve: Add a safe reserve for dynamically calculated gas limit (default is 100).
+        :param burn_reserve: Add a safe reserve for dynamically calculated storage limit (default is 100).
+        :param counter_offset: Number to add to the simulated counters (e.g. pending operations in mempool)
+        :param fee: Explicitly set fee for operation
+        :param gas_limit: Explicitly set gas limit for operation
+        :param storage_limit: Explicitly set storage limit for operation
+        :rtype: OperationGroup
+        """
+        extra_size = (32 + 64) // len(self.contents) + 1  # size of serialized branch and signature
 
         def fill_content(content: Dict[str, Any]) -> Dict[str, Any]:
+            content = content.copy()
             if validation_passes[content['kind']] == 3:
                 _gas_limit, _storage_limit, _fee = gas_limit, storage_limit, fee
 
@@ -264,21 +342,28 @@ class OperationGroup(ContextMixin, ContentMixin):
                     gas_limit=str(_gas_limit),
                     storage_limit=str(_storage_limit),
                     fee=str(_fee),
-                    counter=str(current_counter + self.context.get_counter_offset()),
+                    counter=str(current_counter + counter_offset),
                 )
 
             content.pop('metadata')
             logger.debug("autofilled transaction content: %s" % content)
             return content
 
-        opg.contents = list(map(fill_content, opg_with_metadata['contents']))
-        return opg
+        return self._spawn(contents=list(map(fill_content, opg_with_metadata['contents'])))
 
     def sign(self) -> 'OperationGroup':
         """Sign the operation group with the key specified by `using`.
 
         :rtype: OperationGroup
         """
+        signature = self.key.sign(message=self.signing_message(), generic=True)
+        return self._spawn(signature=signature)
+
+    def signing_message(self) -> bytes:
+        """Get watermarked forged operation group to be signed.
+
+        :returns: Message bytes
+        """
         validation_pass = validation_passes[self.contents[0]['kind']]
         if any(map(lambda x: validation_passes[x['kind']] != validation_pass, self.contents)):
             raise ValueError('Mixed validation passes')
@@ -290,10 +375,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         else:
             watermark = b'\x03'
 
-        message = watermark + bytes.fromhex(self.forge())
-        signature = self.key.sign(message=message, generic=True)
-
-        return self._spawn(signature=signature)
+        return watermark + bytes.fromhex(self.forge())
 
     def hash(self) -> str:
         """Calculate the Base58 encoded operation group hash."""
@@ -325,6 +407,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         burn_reserve: int = DEFAULT_BURN_RESERVE,
         min_confirmations: int = 0,
         ttl: Optional[int] = None,
+        estimator: Optional[Estimator] = None,
     ) -> 'OperationGroup':
         """
 
@@ -332,12 +415,13 @@ class OperationGroup(ContextMixin, ContentMixin):
         :param burn_reserve: Add a safe reserve for dynamically calculated storage limit (default is 100).
         :param min_confirmations: number of block injections to wait for before returning (default is 0, i.e. async mode)
         :param ttl: Number of blocks to wait in the mempool before removal (default is 5 for public network, 60 for sandbox)
+        :param estimator: Estimate gas/storage locally when possible instead of operation dry-run (see `HistoryEstimator`)
         :return: OperationGroup with hash filled
         """
         if ttl is None:
             ttl = self.context.get_operations_ttl()
 
-        opg = self.autofill(gas_reserve=gas_reserve, burn_reserve=burn_reserve, ttl=ttl).sign()
+        opg = self.autofill(gas_reserve=gas_reserve, burn_reserve=burn_reserve, ttl=ttl, estimator=estimator).sign()
         res = opg.inject(min_confirmations=min_confirmations, num_blocks_wait=ttl)
         return opg._spawn(opg_hash=res['hash'], opg_result=res)
 
@@ -369,6 +453,14 @@ class OperationGroup(ContextMixin, ContentMixin):
         res = opg.inject(prevalidate=False)
         return opg._spawn(opg_hash=res['hash'])
 
+    def _get_counter_manager(self) -> Optional[CounterManager]:
+        if self.context.key is None or self.context.shell is None:
+            return None  # e.g. signed externally
+        sources = {content['source'] for content in self.contents if 'source' in content}
+        if sources != {self.context.key.public_key_hash()}:
+            return None
+        return self.context.counter_manager
+
     def inject(
         self,
         check_result: bool = True,
@@ -391,10 +483,19 @@ class OperationGroup(ContextMixin, ContentMixin):
         """
         self.context.reset()  # reset counter
 
-        opg_hash = self.shell.injection.operation.post(
-            operation=self.binary_payload(),
-            _async=not prevalidate,
-        )
+        counter_manager = self._get_counter_manager()
+        first_counter = next((int(content['counter']) for content in self.contents if 'counter' in content), None)
+        try:
+            opg_hash = self.shell.injection.operation.post(
+                operation=self.binary_payload(),
+                _async=not prevalidate,
+            )
+        except RpcError:
+            if counter_manager and first_counter is not None:
+                counter_manager.release(first_counter)
+            raise
+        if counter_manager and first_counter is not None:
+            counter_manager.confirm(first_counter)
 
         if min_confirmations == 0:
             return {
@@ -1,3 +1,4 @@
+from pytezos.rpc.aio import AsyncRpcNode, AsyncShellQuery
 from pytezos.rpc.helpers import *
 from pytezos.rpc.node import RpcMultiNode, RpcNode
 from pytezos.rpc.protocol import *
@@ -0,0 +1,852 @@
+import asyncio
+from binascii import hexlify
+from collections import deque
+from datetime import datetime
+from itertools import count as count_from
+from itertools import islice
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import bson  # type: ignore
+import simplejson as json
+from deprecation import deprecated  # type: ignore
+from simplejson import JSONDecodeError
+
+from pytezos.crypto.encoding import base58_decode, is_bh, is_ogh
+from pytezos.logging import logger
+from pytezos.rpc.kind import validation_passes
+from pytezos.rpc.node import RpcError, _LazyDump, _urljoin
+from pytezos.rpc.protocol import (
+    BlockQuery,
+    BlocksQuery,
+    ContractQuery,
+    OperationListListQuery,
+    OperationQuery,
+    ProposalQuery,
+    ProposalsQuery,
+    find_operation_index,
+    is_ballot,
+    is_origination,
+    is_upvote,
+)
+from pytezos.rpc.query import RpcQuery
+from pytezos.rpc.search import DEFAULT_CONCURRENCY, CyclesQuery, PeriodQuery, VotingPeriodsQuery
+from pytezos.rpc.shell import (
+    MAX_BLOCK_TIMEOUT,
+    MONITOR_RECONNECT_DELAY,
+    ChainQuery,
+    MonitorQuery,
+    NetworkLogQuery,
+    PendingOperationsQuery,
+    ShellQuery,
+)
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = None  # type: ignore
+
+DEFAULT_MAX_CONCURRENCY = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Mimic `requests` query string encoding: skip None values, expand lists, stringify the rest."""
+    res = []
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        for item in value if isinstance(value, (list, tuple)) else [value]:
+            res.append((key, str(item)))
+    return res
+
+
+async def _prefetch(fn: Callable[[Any], Awaitable], items: Iterable, concurrency: int = DEFAULT_CONCURRENCY) -> AsyncGenerator:
+    """Asyncio twin of `prefetch`: lazily map coroutine function over items keeping up to `concurrency` calls in flight,
+    results are yielded in order.
+    """
+    items = iter(items)
+    pending = deque(asyncio.ensure_future(fn(item)) for item in islice(items, max(1, concurrency)))
+    try:
+        while pending:
+            task = pending.popleft()
+            for item in islice(items, 1):
+                pending.append(asyncio.ensure_future(fn(item)))
+            yield await task
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncRpcNode:
+    """Asyncio request proxy for a single Tezos node.
+
+    The number of requests in flight is bounded by the connection pool size, requests above the limit are queued.
+    Requires `aiohttp`, install with `pip install pytezos[aio]`.
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """
+        :param uri: node address (or a list of addresses)
+        :param max_concurrency: maximum number of simultaneous requests
+        :param limit_per_host: maximum number of simultaneous requests to the same host, 0 means no limit
+        :param keepalive_timeout: time to keep idle connections open (seconds)
+        """
+        if aiohttp is None:
+            raise ImportError('Please, install `aiohttp` package (`pip install pytezos[aio]`) in order to use asyncio RPC client')
+        if not uri:
+            raise RuntimeError()
+        if not isinstance(uri, list):
+            uri = [uri]
+        self.uri = uri
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nNode address',
+            self.uri[0],
+        ]
+        return '\n'.join(res)
+
+    async def __aenter__(self) -> 'AsyncRpcNode':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        """HTTP session, created on first use inside the running event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'content-type': 'application/json',
+                    'user-agent': 'PyTezos',
+                },
+                json_serialize=json.dumps,
+            )
+            self._session = session
+            return session
+        return self._session
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, path: str, params=None, timeout=None, **kwargs) -> 'aiohttp.ClientResponse':
+        """Perform HTTP request to node.
+
+        Response body is not read here, use `get`/`post`/`put`/`delete` for JSON endpoints.
+
+        :param method: one of GET/POST/PUT/DELETE
+        :param path: path to endpoint
+        :param params: query string arguments
+        :param timeout: total request timeout (seconds)
+        :param kwargs: aiohttp.ClientSession.request arguments
+        :raises RpcError: node has returned an error
+        :returns: node response
+        """
+        logger.debug('>>>>> %s %s\n%s', method, path, _LazyDump(dict(params=params, timeout=timeout, **kwargs)))
+        if timeout is not None:
+            kwargs.update(timeout=aiohttp.ClientTimeout(total=timeout))
+        res = await self.session.request(
+            method=method,
+            url=_urljoin(self.uri[0], path),
+            params=_encode_params(params),
+            **kwargs,
+        )
+        if res.status == 404:
+            text = await res.text()
+            logger.debug('<<<<< %s\n%s', res.status, text)
+            raise RpcError(f'Not found: {path}')
+        if res.status != 200:
+            text = await res.text()
+            logger.debug('<<<<< %s\n%s', res.status, text)
+            if res.content_type == 'application/json':
+                raise RpcError.from_errors(json.loads(text))
+            raise RpcError(text)
+
+        return res
+
+    @staticmethod
+    async def _decode(res: 'aiohttp.ClientResponse') -> Any:
+        data = json.loads((await res.read()).decode())
+        logger.debug('<<<<< %s\n%s', res.status, _LazyDump(data))
+        return data
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        return await self._decode(await self.request('GET', path, params=params, timeout=timeout))
+
+    async def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Any:
+        response = await self.request('POST', path, params=params, json=json)
+        try:
+            return await self._decode(response)
+        except JSONDecodeError:
+            return await response.text()
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._decode(await self.request('DELETE', path, params=params))
+
+    async def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return await self._decode(await self.request('PUT', path, params=params))
+
+
+class AsyncResponseGenerator:
+    """Asynchronous iterator over a streamed (chunked JSON) response, the request is sent on first iteration."""
+
+    def __init__(self, request: Callable):
+        self._request = request
+
+    async def __aiter__(self):
+        res = await self._request()
+        try:
+            async for line in res.content:
+                if line.strip():
+                    yield json.loads(line.decode())
+        finally:
+            res.release()
+
+
+class AsyncRpcQuery(RpcQuery):
+    """Asyncio twin of `RpcQuery`: same attribute/[] navigation, but calls return awaitables.
+
+    Child queries are resolved via the shared `RpcQuery.__extensions__` registry and then mapped to their async twins:
+    either explicitly declared with `twin=` or derived on the fly for endpoints without composite helpers.
+    """
+
+    __twins__ = {}  # type: ignore
+
+    @classmethod
+    def __init_subclass__(cls, twin: Optional[type] = None, **kwargs):
+        super().__init_subclass__(**kwargs)  # type: ignore
+        if twin is not None:
+            cls.__twins__[twin] = cls
+
+    @classmethod
+    def get_twin(cls, query_class: type) -> type:
+        """Get async counterpart of a synchronous query class.
+
+        :param query_class: RpcQuery subclass
+        """
+        twin = cls.__twins__.get(query_class)
+        if twin is None:
+            twin = type(f'Async{query_class.__name__}', (AsyncRpcQuery, query_class), {})
+            twin = cls.__twins__.setdefault(query_class, twin)
+        return twin
+
+    def _spawn_query(self, wild_path, params):
+        child_class = self.get_twin(self.__extensions__.get(wild_path, RpcQuery))
+        return child_class(
+            path=wild_path,
+            node=self.node,
+            params=params,
+        )
+
+
+AsyncRpcQuery.__twins__[RpcQuery] = AsyncRpcQuery
+
+
+class AsyncShellQuery(AsyncRpcQuery, ShellQuery, twin=ShellQuery):
+    """Asyncio entry point, e.g. `await AsyncShellQuery(AsyncRpcNode(uri)).blocks[123].operations()`"""
+
+    @property
+    def block(self):
+        """Head block pinned by its hash (awaitable)."""
+
+        async def pin_head():
+            return self.blocks[await self.head.hash()]
+
+        return pin_head()
+
+    @property
+    def cycles(self):
+        """Operate on cycles rather than blocks."""
+        return AsyncCyclesQuery(node=self.node, path=self._wild_path + '/chains/{}/blocks', params=self._params + ['main'])
+
+    @property
+    def voting_periods(self):
+        """Operate on voting periods rather than blocks."""
+        return AsyncVotingPeriodsQuery(node=self.node, path=self._wild_path + '/chains/{}/blocks', params=self._params + ['main'])
+
+    async def wait_blocks(  # type: ignore
+        self,
+        current_block_hash: str,
+        max_blocks: int = 1,
+        max_priority: int = 2,
+        yield_current=False,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+        stream: bool = False,
+    ) -> AsyncGenerator[str, None]:
+        """Iterates over future blocks (asynchronous generator of block hashes), every intermediate block is yielded
+        even if the head has advanced by several levels at once.
+
+        :param current_block_hash: hash of the current block (head)
+        :param max_blocks: number of blocks to iterate (not including the current one)
+        :param max_priority: wait for blocks with lower priority (increased timeout)
+        :param yield_current: yield current block hash at the very beginning
+        :param time_between_blocks: override protocol constant
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param stream: subscribe to new heads (`/monitor/heads`) instead of polling
+        """
+        if time_between_blocks is None:
+            constants = await self.blocks[current_block_hash].context.constants()
+            time_between_blocks = int(constants.get('minimal_block_delay', constants['time_between_blocks'][0]))
+
+        if block_timeout is None:
+            block_timeout = MAX_BLOCK_TIMEOUT
+
+        if yield_current:
+            yield current_block_hash
+
+        if max_blocks <= 0:
+            return
+
+        current_level = (await self.blocks[current_block_hash].header())['level']
+        if stream:
+            heads = self._stream_heads(timeout=time_between_blocks + block_timeout)
+        else:
+            heads = self._poll_heads(current_block_hash, time_between_blocks, block_timeout)
+
+        try:
+            async for head in heads:
+                if head['hash'] == current_block_hash or head['level'] < current_level:
+                    continue
+                if head['level'] > current_level + 1:
+                    # NOTE: several blocks were baked in between, fill the gap
+                    chain = (await self.blocks(length=head['level'] - current_level + 1, head=head['hash']))[0]
+                    block_hashes, predecessor = chain[-2::-1], chain[-1]
+                else:
+                    block_hashes, predecessor = [head['hash']], head['predecessor']
+                if predecessor != current_block_hash:
+                    raise StopIteration('Reorg detected, expected predecessor %s instead of %s', current_block_hash, predecessor)
+
+                for block_hash in block_hashes[:max_blocks]:
+                    logger.info('Found new block %s', block_hash)
+                    yield block_hash
+                max_blocks -= len(block_hashes)
+                if max_blocks <= 0:
+                    return
+                current_block_hash, current_level = head['hash'], head['level']
+        finally:
+            await heads.aclose()
+
+    async def _poll_heads(self, current_block_hash: str, time_between_blocks: int, block_timeout: int) -> AsyncGenerator[dict, None]:
+        while True:
+            header = await self.blocks[current_block_hash].header()
+            prev_block_dt = datetime.strptime(header['timestamp'], '%Y-%m-%dT%H:%M:%SZ')
+            elapsed_sec = (datetime.utcnow() - prev_block_dt).seconds
+            sleep_sec = 1 if elapsed_sec > time_between_blocks else (time_between_blocks - elapsed_sec + 1)
+
+            logger.info('Sleep %d seconds until block %s is superseded', sleep_sec, current_block_hash)
+            await asyncio.sleep(sleep_sec)
+
+            for delay in range(block_timeout):
+                head = await self.head.header()
+                if head['hash'] != current_block_hash:
+                    logger.info('Found new head %s (%d sec delay)', head['hash'], delay)
+                    break
+                await asyncio.sleep(1)
+            else:
+                raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', block_timeout)
+
+            yield head
+            current_block_hash = head['hash']
+
+    async def _stream_heads(self, timeout: float) -> AsyncGenerator[dict, None]:
+        while True:
+            heads = self.monitor.heads.main().__aiter__()
+            try:
+                while True:
+                    yield await asyncio.wait_for(heads.__anext__(), timeout)
+            except StopAsyncIteration:
+                logger.info('Heads stream has ended, reconnecting in %d sec', MONITOR_RECONNECT_DELAY)
+            except asyncio.TimeoutError as e:
+                raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', timeout) from e
+            finally:
+                await heads.aclose()
+            await asyncio.sleep(MONITOR_RECONNECT_DELAY)
+
+    async def wait_operations(  # type: ignore
+        self,
+        opg_hashes: List[str],
+        ttl: int,
+        min_confirmations: int,
+        current_block_hash: Optional[str] = None,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+        stream: bool = False,
+    ) -> List[dict]:
+        """Wait for one or many operations gain enough confirmations
+
+        :param opg_hashes: list of operation hashes
+        :param ttl: max time-to-live value (in mempool)
+        :param min_confirmations: minimum number of blocks after inclusion to wait for
+        :param current_block_hash: current block hash (head)
+        :param time_between_blocks: override protocol constant
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param stream: subscribe to new heads (`/monitor/heads`) instead of polling
+        :return: list of operation contents with metadata
+        """
+        confirmations: Dict[str, int] = dict()
+        pending = set(opg_hashes)
+        operations = list()
+        block_hash = current_block_hash
+
+        if block_hash is None:
+            block_hash = await self.head.hash()
+
+        blocks = self.wait_blocks(
+            current_block_hash=block_hash,
+            max_blocks=ttl,
+            yield_current=True,
+            time_between_blocks=time_between_blocks,
+            block_timeout=block_timeout,
+            stream=stream,
+        )
+        try:
+            async for block_hash in blocks:
+                if len(pending) > 0:
+                    mempool = set(map(lambda x: x['hash'], await self.mempool.pending_operations.flatten()))
+                    for opg_hash in opg_hashes:
+                        if opg_hash in pending:
+                            if opg_hash in mempool:
+                                logger.info('Operation %s is still in mempool', opg_hash)
+                            else:
+                                logger.info('Operation %s has left mempool', opg_hash)
+                                pending.remove(opg_hash)
+
+                if len(pending) < len(opg_hashes):
+                    included = await self.blocks[block_hash].operation_hashes()
+                    for i, vp in enumerate(included):
+                        for j, opg_hash in enumerate(vp):
+                            if opg_hash in opg_hashes and opg_hash not in confirmations:
+                                logger.info('Operation %s has been included to block %s', opg_hash, block_hash)
+                                confirmations[opg_hash] = 0  # initialize
+                                operations.append(await self.blocks[block_hash].operations[i][j]())
+
+                for opg_hash in confirmations:
+                    confirmations[opg_hash] += 1
+                    logger.info('Operation %s has %d/%d confirmations', opg_hash, confirmations[opg_hash], min_confirmations)
+
+                if len(operations) == len(opg_hashes):
+                    break
+        finally:
+            await blocks.aclose()
+
+        if len(operations) < len(opg_hashes):
+            raise StopIteration('Only %d of %d operations were included, stopping', len(operations), len(opg_hashes))
+
+        async for _ in self.wait_blocks(
+            block_hash,
+            max_blocks=min_confirmations - 1,
+            time_between_blocks=time_between_blocks,
+            block_timeout=block_timeout,
+            stream=stream,
+        ):
+            for opg_hash in opg_hashes:
+                confirmations[opg_hash] += 1
+                logger.info('Operation %s has %d/%d confirmations', opg_hash, confirmations[opg_hash], min_confirmations)
+
+        return operations
+
+    @deprecated(deprecated_in='3.2.2', removed_in='4.0.0', details=f'Use wait_blocks() instead')
+    async def wait_next_block(
+        self,
+        delay_sec=1,
+        prev_hash=None,
+        time_between_blocks: Optional[int] = None,
+        max_iterations: Optional[int] = None,
+    ):
+        """Wait until next block is finalized.
+
+        :param prev_hash: Current block hash (optional). If not set, current head is used.
+        :param time_between_blocks: override the corresponding parameter from constants
+        :param max_iterations: Manually set the number of iterations
+        :param delay_sec: Sleep delay
+        """
+        if time_between_blocks is None:
+            time_between_blocks = int((await self.head.context.constants())['time_between_blocks'][0])
+
+        if time_between_blocks > 0:
+            if prev_hash is None:
+                header = await self.head.header()
+                prev_hash = header['hash']
+                prev_block_dt = datetime.strptime(header['timestamp'], '%Y-%m-%dT%H:%M:%SZ')
+                elapsed_sec = (datetime.utcnow() - prev_block_dt).seconds
+                sleep_sec = 0 if elapsed_sec > time_between_blocks else time_between_blocks - elapsed_sec
+            else:
+                sleep_sec = time_between_blocks
+            logger.info('Wait %s seconds until block %s is finalized', sleep_sec, prev_hash)
+            await asyncio.sleep(sleep_sec)
+
+        if max_iterations is None:
+            max_iterations = max(1, time_between_blocks)
+
+        for _ in range(max_iterations):
+            current_block_hash = await self.head.hash()
+            if current_block_hash == prev_hash:
+                await asyncio.sleep(delay_sec)
+            else:
+                return current_block_hash
+        raise StopIteration("Timeout")
+
+    async def get_confirmations(self, opg_hash, kind, branch, head) -> int:  # type: ignore
+        start = (await self.blocks[head].header())['level']
+        stop = (await self.blocks[branch].header())['level']
+        for level in range(start, stop, -1):
+            vp = validation_passes[kind]
+            hashes = await self.blocks[level].operation_hashes[vp]()
+            if opg_hash in hashes:
+                logger.info('Operation %s was included in block %s', opg_hash, level)
+                return start - level + 1
+        return 0
+
+
+class AsyncChainQuery(AsyncRpcQuery, ChainQuery, twin=ChainQuery):
+    async def watermark(self):
+        """Chain watermark, hex encoded."""
+        data = await self.chain_id()
+        return hexlify(base58_decode(data.encode())).decode()
+
+
+class AsyncPendingOperationsQuery(AsyncRpcQuery, PendingOperationsQuery, twin=PendingOperationsQuery):
+    def __getitem__(self, item: str):
+        """Search for operation in node's mempool by hash (awaitable).
+
+        :param item: operation group hash (base58)
+        """
+
+        async def find():
+            return self.find_operation(await self(), item)
+
+        return find()
+
+    async def flatten(self) -> List[Dict[str, Any]]:  # type: ignore
+        return self.flatten_operations(await self())
+
+
+class AsyncMonitorQuery(AsyncRpcQuery, MonitorQuery, twin=MonitorQuery):
+    def __call__(self, *args, **kwargs):
+        return AsyncResponseGenerator(lambda: self.node.request(method='GET', path=self.path, params=kwargs))
+
+
+class AsyncNetworkLogQuery(AsyncRpcQuery, NetworkLogQuery, twin=NetworkLogQuery):
+    def __call__(self, monitor=False):
+        if monitor:
+            return AsyncResponseGenerator(lambda: self.node.request(method='GET', path=self.path))
+        return self._get()
+
+
+class AsyncBlocksQuery(AsyncRpcQuery, BlocksQuery, twin=BlocksQuery):
+    async def __call__(self, length=1, head=None, min_date=None):  # type: ignore
+        if isinstance(head, str) and not is_bh(head):
+            head = await self._get_block(head).hash()
+        return await super().__call__(length=length, head=head, min_date=min_date)
+
+    def __getitem__(self, block_id):
+        """Construct block query or get a block range.
+
+        :param block_id: Block level, negative offset from the head, block hash, `head`, `head~N`, etc. \
+        or slice [:] (start can be a level or any Block ID, stop can be any Block ID or empty)
+        :rtype: AsyncBlockQuery or AsyncBlockSliceQuery
+        """
+        if isinstance(block_id, slice):
+            return AsyncBlockSliceQuery(
+                start=block_id.start,
+                stop=block_id.stop,
+                node=self.node,
+                path=self._wild_path,
+                params=self._params,
+            )
+        if isinstance(block_id, int) and block_id < 0:
+            block_id = f'head~{-block_id}'
+        return self._get_block(block_id)
+
+    async def _get_current_range(self, position_key: str) -> 'AsyncBlockSliceQuery':
+        level_info = (await self.head.metadata())['level_info']
+        return AsyncBlockSliceQuery(
+            start=level_info['level'] - level_info[position_key],
+            stop='head',
+            node=self.node,
+            path=self._wild_path,
+            params=self._params,
+        )
+
+    @property
+    def current_voting_period(self):
+        """Get block range for the current voting period (awaitable).
+
+        :rtype: AsyncBlockSliceQuery
+        """
+        return self._get_current_range('voting_period_position')
+
+    @property
+    def current_cycle(self):
+        """Get block range for the current cycle (awaitable).
+
+        :rtype: AsyncBlockSliceQuery
+        """
+        return self._get_current_range('cycle_position')
+
+
+class AsyncBlockSliceQuery(AsyncRpcQuery):
+    """Asyncio counterpart of `BlockSliceQuery`: block hashes, levels and blocks of a range.
+    Bisection helpers (`find_upvotes`, `find_ballots`, etc.) are only available in the synchronous client.
+    """
+
+    def __init__(self, start: Union[int, str], stop=None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._start = start
+        self._stop = stop or 'head'
+
+    async def _get_level(self, block_id) -> int:
+        if isinstance(block_id, int):
+            if block_id < 0:
+                return max(0, await self.head.level() + block_id)
+            return max(1, block_id)
+        return (await self._getitem(block_id).header())['level']
+
+    def __getitem__(self, item):
+        """Get block by index (awaitable).
+
+        :param item: Index inside given block range
+        :rtype: AsyncBlockQuery
+        """
+
+        async def get_block():
+            start, stop = await self.get_range()
+            return self._getitem(start + item if item >= 0 else stop + item + 1)
+
+        return get_block()
+
+    async def __call__(self) -> List[List[str]]:  # type: ignore
+        """Get block hashes (base58) for this interval."""
+        header = await self._getitem(self._stop).header()
+        start = self._start
+        if isinstance(start, str):
+            start = await self._get_level(start)
+        length = abs(start) if start < 0 else header['level'] - start + 1
+        return await super().__call__(length=min(header['level'], length), head=header['hash'])
+
+    async def get_range(self) -> Tuple[int, int]:
+        """Get block level range."""
+        return await self._get_level(self._start), await self._get_level(self._stop)
+
+    async def _get_field(self, level: int, field: str):
+        query = self._getitem(level)
+        for part in filter(None, field.split('/')):
+            query = query[int(part)] if part.isdigit() else getattr(query, part)
+        return await query()
+
+    async def _iter_levels(self, levels: Sequence[int], fields: Optional[List[str]], concurrency: int) -> AsyncGenerator:
+        if not fields:
+            async for block in _prefetch(lambda x: self._getitem(x)(), levels, concurrency):
+                yield block
+            return
+
+        responses = _prefetch(lambda x: self._get_field(*x), ((level, field) for level in levels for field in fields), concurrency)
+        try:
+            for level in levels:
+                block = dict(level=level)
+                for field in fields:
+                    block[field] = await responses.__anext__()
+                yield block
+        finally:
+            await responses.aclose()
+
+    async def iter(self, fields: Optional[List[str]] = None, concurrency: int = DEFAULT_CONCURRENCY, reverse=False) -> AsyncGenerator:
+        """Iterate over blocks in this interval, fetching them concurrently but yielding in order (asynchronous generator).
+
+        :param fields: block sub-resources to fetch, e.g. `['header', 'operations']` or `['operations/3']`, \
+            whole blocks are fetched if omitted
+        :param concurrency: maximum number of requests in flight
+        :param reverse: iterate from the last block to the first one
+        """
+        start, stop = await self.get_range()
+        levels = range(stop, start - 1, -1) if reverse else range(start, stop + 1)
+        async for block in self._iter_levels(levels, fields, concurrency):
+            yield block
+
+    async def find_operation(self, operation_group_hash, concurrency=DEFAULT_CONCURRENCY) -> dict:
+        """Find operation by hash.
+
+        :param operation_group_hash: base58
+        :param concurrency: maximum number of requests in flight
+        :raises: StopIteration if not found
+        """
+        last, head = await self.get_range()
+        if isinstance(self._start, int) and self._start < 0:
+            levels = range(head, max(1, last - 1), -1)
+        else:
+            levels = range(last, head + 1, 1)
+
+        blocks = self._iter_levels(levels, ['operation_hashes'], concurrency)
+        try:
+            async for block in blocks:
+                logger.debug('Looking for operation %s in block %s...', operation_group_hash, block['level'])
+                try:
+                    i, j = find_operation_index(block['operation_hashes'], operation_group_hash)
+                except StopIteration:
+                    continue
+                return await self._getitem(block['level']).operations[i][j]()
+        finally:
+            await blocks.aclose()
+
+        raise StopIteration(operation_group_hash)
+
+
+class AsyncPeriodQuery(AsyncRpcQuery, PeriodQuery):
+    def _get_item(self, item):
+        async def get_block_slice():
+            start, stop = self._get_level_range((await self.head.metadata())['level_info'], item)
+            return AsyncBlockSliceQuery(
+                start=start,
+                stop=stop,
+                node=self.node,
+                path=self._wild_path,
+                params=self._params,
+            )
+
+        return get_block_slice()
+
+
+class AsyncCyclesQuery(AsyncPeriodQuery, CyclesQuery, twin=CyclesQuery):
+    """Cycles of the chain, `await shell.cycles()` is the current cycle, `await shell.cycles[N]` is a block range (awaitable)."""
+
+
+class AsyncVotingPeriodsQuery(AsyncPeriodQuery, VotingPeriodsQuery, twin=VotingPeriodsQuery):
+    """Voting periods, `await shell.voting_periods()` is the current one, `await shell.voting_periods[N]` is a block range (awaitable)."""
+
+
+class AsyncBlockQuery(AsyncRpcQuery, BlockQuery, twin=BlockQuery):
+    @property
+    def predecessor(self):
+        """Query previous block (awaitable).
+
+        :rtype: AsyncBlockQuery
+        """
+
+        async def get_predecessor():
+            return self._parent[(await self.header())['predecessor']]
+
+        return get_predecessor()
+
+    @property
+    def baker(self):
+        """Query block producer (awaitable).
+
+        :rtype: AsyncContractQuery
+        """
+
+        async def get_baker():
+            return self.context.contracts[(await self.metadata())['baker']]
+
+        return get_baker()
+
+    async def voting_period(self) -> int:  # type: ignore
+        return (await self.metadata())['level_info']['voting_period']
+
+    async def level(self) -> int:  # type: ignore
+        return (await self.header())['level']
+
+    async def cycle(self) -> int:  # type: ignore
+        return (await self.metadata())['level_info']['cycle']
+
+    async def protocol_parameters(self):
+        pp = (await self.header()).get('content', {}).get('protocol_parameters')
+        if pp:
+            return bson.loads(bytes.fromhex(pp)[4:])
+
+
+class AsyncContractQuery(AsyncRpcQuery, ContractQuery, twin=ContractQuery):
+    async def public_key(self) -> str:  # type: ignore
+        pkh = self._params[-1]
+        if pkh.startswith('KT'):
+            pkh = (await self.manager_key()).get('manager')
+
+        pk = (await self._parent[pkh].manager_key()).get('key')
+        if not pk:
+            raise ValueError('Public key is not revealed.')
+
+        return pk
+
+    async def count(self) -> Iterator:  # type: ignore
+        return count_from(start=int(await self.counter()) + 1, step=1)
+
+    async def code(self):
+        return (await self()).get('script', {}).get('code')
+
+
+class AsyncOperationByHashQuery:
+    """Deferred operation query: its position is looked up in `operation_hashes` on call."""
+
+    def __init__(self, operations: 'AsyncOperationListListQuery', operation_group_hash: str) -> None:
+        self.operations = operations
+        self.operation_group_hash = operation_group_hash
+
+    async def resolve(self) -> 'AsyncOperationQuery':
+        """Find operation position and return the actual query."""
+        operation_hashes = await self.operations._parent.operation_hashes()
+        return self.operations[find_operation_index(operation_hashes, self.operation_group_hash)]
+
+    async def __call__(self, **params):
+        return await (await self.resolve())(**params)
+
+
+class AsyncOperationListListQuery(AsyncRpcQuery, OperationListListQuery, twin=OperationListListQuery):
+    def __getitem__(self, item):
+        if isinstance(item, str) and is_ogh(item):
+            return AsyncOperationByHashQuery(self, item)
+        return super().__getitem__(item)
+
+    async def find_upvotes(self, proposal_id) -> list:  # type: ignore
+        return list(filter(lambda op: is_upvote(op, proposal_id), await self.votes()))
+
+    async def find_ballots(self, proposal_id=None) -> list:  # type: ignore
+        return list(filter(lambda op: is_ballot(op, proposal_id), await self.votes()))
+
+    async def find_origination(self, contract_id):
+        return next(filter(lambda op: is_origination(op, contract_id), await self.managers()))
+
+
+class AsyncOperationQuery(AsyncRpcQuery, OperationQuery, twin=OperationQuery):
+    async def unsigned(self) -> dict:  # type: ignore
+        data = await self()
+        return {
+            'branch': data['branch'],
+            'contents': [{k: v for k, v in content.items() if k != 'metadata'} for content in data['contents']],
+        }
+
+
+class AsyncProposalQuery(AsyncRpcQuery, ProposalQuery, twin=ProposalQuery):
+    async def __call__(self) -> int:  # type: ignore
+        proposals = await self._parent()
+        proposal_id = self._params[-1]
+        return next((x[1] for x in proposals if x[0] == proposal_id), 0)
+
+
+class AsyncProposalsQuery(AsyncRpcQuery, ProposalsQuery, twin=ProposalsQuery):
+    def __getitem__(self, proposal_id):
+        return AsyncProposalQuery(
+            path=self._wild_path + '/{}',
+            params=self._params + [proposal_id],
+            node=self.node,
+        )
@@ -0,0 +1,226 @@
+import re
+import sqlite3
+from collections import OrderedDict
+from os.path import expanduser
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from pytezos.crypto.encoding import is_bh
+
+DEFAULT_MAXSIZE = 4096
+DEFAULT_FINALITY_DEPTH = 60
+DEFAULT_HEAD_TTL = 30
+
+_block_path_re = re.compile(r'^/?chains/([^/]+)/blocks/([^/?]+)')
+
+
+def parse_block_path(path: str) -> Optional[Tuple[str, str]]:
+    """Extract chain and block ID from a block-scoped RPC path.
+
+    :param path: RPC path, e.g. `chains/main/blocks/head/header`
+    :returns: tuple (chain, block_id) or None if the path is not block-scoped
+    """
+    match = _block_path_re.match(path)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+class LRUCache:
+    """Bounded in-memory storage evicting least recently used entries."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._items: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+
+class SqliteCache:
+    """Persistent storage backed by SQLite database, oldest entries are evicted first if `maxsize` is set."""
+
+    def __init__(self, path: str, maxsize: Optional[int] = None) -> None:
+        self.path = expanduser(path)
+        self.maxsize = maxsize
+        self._lock = Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute('SELECT value FROM responses WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)', (key, value))
+            if self.maxsize is not None:
+                self._db.execute(
+                    'DELETE FROM responses WHERE rowid IN '
+                    '(SELECT rowid FROM responses ORDER BY rowid DESC LIMIT -1 OFFSET ?)',
+                    (self.maxsize,),
+                )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RpcCache:
+    """Response cache for RPC endpoints bound to an immutable block.
+
+    A block is considered immutable if it is referenced by hash, or by level not greater than the last finalized
+    level (head level minus `finality_depth`). Relative IDs like `head` or `head~N` are never cached.
+    Responses are stored as raw JSON text in the in-memory LRU and, optionally, on disk.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        path: Optional[str] = None,
+        disk_maxsize: Optional[int] = None,
+        finality_depth: int = DEFAULT_FINALITY_DEPTH,
+        head_ttl: float = DEFAULT_HEAD_TTL,
+    ) -> None:
+        """
+        :param maxsize: maximum number of responses kept in memory
+        :param path: path to SQLite database file, leave None to disable on-disk storage
+        :param disk_maxsize: maximum number of responses kept on disk, None means unbounded
+        :param finality_depth: number of blocks after which a block is considered final
+        :param head_ttl: how long (seconds) the known head level stays valid before it has to be refreshed
+        """
+        self.memory = LRUCache(maxsize=maxsize)
+        self.disk = SqliteCache(path, maxsize=disk_maxsize) if path else None
+        self.finality_depth = finality_depth
+        self.head_ttl = head_ttl
+        self.finalized_levels: Dict[str, int] = {}
+        self._head_updated_at: Dict[str, float] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nStats',
+            *[f'.{k}\t{v}' for k, v in self.stats.items()],
+        ]
+        return '\n'.join(res)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters."""
+        total = self.hits + self.disk_hits + self.misses
+        return dict(
+            hits=self.hits,
+            disk_hits=self.disk_hits,
+            misses=self.misses,
+            hit_rate=(self.hits + self.disk_hits) / total if total else 0.0,
+            size=len(self.memory),
+        )
+
+    def set_head_level(self, level: int, chain: str = 'main') -> None:
+        """Update the last finalized level using the current head level.
+
+        :param level: head level
+        :param chain: chain ID or alias
+        """
+        with self._lock:
+            self.finalized_levels[chain] = max(level - self.finality_depth, self.finalized_levels.get(chain, -1))
+            self._head_updated_at[chain] = monotonic()
+
+    def head_expired(self, chain: str = 'main') -> bool:
+        """Check whether the head level has to be refreshed before resolving level-based block IDs."""
+        updated_at = self._head_updated_at.get(chain)
+        return updated_at is None or monotonic() - updated_at > self.head_ttl
+
+    def get_key(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Get cache key for the request, or None if the response can change over time.
+
+        :param path: RPC path
+        :param params: query string arguments
+        """
+        block_path = parse_block_path(path)
+        if block_path is None:
+            return None
+
+        chain, block_id = block_path
+        if not is_bh(block_id):
+            if not block_id.isdigit():
+                return None
+            finalized_level = self.finalized_levels.get(chain)
+            if finalized_level is None or int(block_id) > finalized_level:
+                return None
+
+        key = path.strip('/')
+        query = urlencode(sorted((k, v) for k, v in (params or {}).items() if v is not None), doseq=True)
+        return f'{key}?{query}' if query else key
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count('hits')
+            return value
+
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+                self._count('disk_hits')
+                return value
+
+        self._count('misses')
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        """Drop all cached responses (both in memory and on disk)."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.disk_hits = 0
+            self.misses = 0
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
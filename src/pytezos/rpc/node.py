@@ -1,12 +1,25 @@
 import json
 from pprint import pformat
+from threading import Lock
+from time import monotonic
 from typing import Any, Dict, List, Optional, Union
 
 import requests
 import requests.exceptions
+from requests.adapters import HTTPAdapter
 from simplejson import JSONDecodeError
 
 from pytezos.logging import logger
+from pytezos.rpc.cache import RpcCache, parse_block_path
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_EJECT_TIMEOUT = 30
+DEFAULT_LAG_CHECK_INTERVAL = 30
+LATENCY_EWMA = 0.3
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+NODE_UNAVAILABLE_CODES = {502, 503, 504}
 
 
 def _urljoin(*args: str) -> str:
@@ -23,6 +36,30 @@ def _gen_error_variants(error_id: str) -> List[str]:
     return variants
 
 
+class _LazyDump:
+    """Postpone JSON serialization of logged data until the log record is actually emitted."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __str__(self) -> str:
+        return json.dumps(self.data, indent=4, default=str)
+
+
+class _LazyPrettyText:
+    """Postpone pretty-printing of logged response text until the log record is actually emitted."""
+
+    __slots__ = ('res',)
+
+    def __init__(self, res: requests.Response) -> None:
+        self.res = res
+
+    def __str__(self) -> str:
+        return pformat(self.res.text, indent=4)
+
+
 class RpcError(Exception):
     __handlers__ = {}  # type: ignore
 
@@ -63,15 +100,144 @@ class RpcError(Exception):
         return pformat(self.args)
 
 
+class RpcNodeUnavailableError(RpcError, error_id=[]):
+    """Node (or a proxy in front of it) is temporarily unable to serve requests."""
+
+
+class RpcTransport(HTTPAdapter):
+    """Keep-alive HTTP adapter counting connection pool hits and misses.
+
+    A hit is a request served by an already established connection, a miss is a request that had to open
+    (and handshake) a new one.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> None:
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: self._make_pool_class(pool_class) for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _make_pool_class(self, pool_class):
+        transport = self
+
+        class TrackedConnectionPool(pool_class):
+            def _get_conn(self, *args, **kwargs):
+                conn = super()._get_conn(*args, **kwargs)
+                transport._count(reused=getattr(conn, 'sock', None) is not None)
+                return conn
+
+        TrackedConnectionPool.__name__ = pool_class.__name__
+        return TrackedConnectionPool
+
+    def _count(self, reused: bool) -> None:
+        with self._lock:
+            if reused:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Connection pool hit/miss counters."""
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+def make_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """Create HTTP session backed by a connection pool.
+
+    :param pool_connections: number of per-host pools to keep
+    :param pool_maxsize: maximum number of connections kept open per host
+    :param pool_block: block when all connections to a host are busy instead of opening extra ones
+    :param keep_alive: reuse connections between requests, set False to close each one after response
+    """
+    session = requests.Session()
+    transport = RpcTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount('http://', transport)
+    session.mount('https://', transport)
+    session.headers.update(
+        {
+            'content-type': 'application/json',
+            'user-agent': 'PyTezos',
+            'connection': 'keep-alive' if keep_alive else 'close',
+        }
+    )
+    return session
+
+
 class RpcNode:
-    """Request proxy for a single Tezos node."""
+    """Request proxy for a single Tezos node.
+
+    All requests go through a pooled keep-alive HTTP session, shared by every query spawned from the node.
+    """
 
-    def __init__(self, uri: Union[str, List[str]]) -> None:
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[RpcCache] = None,
+    ) -> None:
+        """
+        :param uri: node address (or a list of addresses)
+        :param session: reuse existing HTTP session (e.g. to share a connection pool between nodes)
+        :param pool_connections: number of per-host pools to keep
+        :param pool_maxsize: maximum number of connections kept open per host
+        :param pool_block: block when all connections to a host are busy instead of opening extra ones
+        :param keep_alive: reuse connections between requests
+        :param cache: response cache for endpoints bound to immutable blocks (disabled by default)
+        """
         if not uri:
             raise RuntimeError()
         if not isinstance(uri, list):
             uri = [uri]
         self.uri = uri
+        self.session = session or make_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self.cache = cache
+
+    @property
+    def pool_stats(self) -> Dict[str, int]:
+        """Connection pool hit/miss counters."""
+        hits, misses = 0, 0
+        for transport in {id(a): a for a in self.session.adapters.values()}.values():
+            if isinstance(transport, RpcTransport):
+                stats = transport.stats
+                hits += stats['hits']
+                misses += stats['misses']
+        return dict(hits=hits, misses=misses)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
 
     def __repr__(self) -> str:
         res = [
@@ -84,67 +250,251 @@ class RpcNode:
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Perform HTTP request to node.
 
+        Response body is neither decoded nor logged here, use `get`/`post`/`put`/`delete` for JSON endpoints.
+
         :param method: one of GET/POST/PUT/DELETE
         :param path: path to endpoint
         :param kwargs: requests.request arguments
         :raises RpcError: node has returned an error
         :returns: node response
         """
-        logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
-        res = requests.request(
+        logger.debug('>>>>> %s %s\n%s', method, path, _LazyDump(kwargs))
+        res = self.session.request(
             method=method,
             url=_urljoin(self.uri[0], path),
-            headers={
-                'content-type': 'application/json',
-                'user-agent': 'PyTezos',
-            },
             **kwargs,
         )
         if res.status_code == 404:
             logger.debug('<<<<< %s\n%s', res.status_code, res.text)
             raise RpcError(f'Not found: {path}')
+        if res.status_code in NODE_UNAVAILABLE_CODES:
+            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+            raise RpcNodeUnavailableError(f'Node is unavailable ({res.status_code}): {path}')
         if res.status_code != 200:
-            logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
+            logger.debug('<<<<< %s\n%s', res.status_code, _LazyPrettyText(res))
             raise RpcError.from_response(res)
 
-        logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
         return res
 
+    @staticmethod
+    def _decode(res: requests.Response) -> Any:
+        data = res.json()
+        logger.debug('<<<<< %s\n%s', res.status_code, _LazyDump(data))
+        return data
+
+    def _get_cache_key(self, path: str, params: Optional[Dict[str, Any]]) -> Optional[str]:
+        assert self.cache is not None
+        block_path = parse_block_path(path)
+        if block_path is None:
+            return None
+        chain, block_id = block_path
+        if block_id.isdigit() and self.cache.head_expired(chain):
+            header = self.request('GET', f'chains/{chain}/blocks/head/header/shell').json()
+            self.cache.set_head_level(header['level'], chain)
+        return self.cache.get_key(path, params)
+
     def get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> requests.Response:
-        return self.request('GET', path, params=params, timeout=timeout).json()
+        if self.cache is not None:
+            key = self._get_cache_key(path, params)
+            if key is not None:
+                text = self.cache.get(key)
+                if text is None:
+                    text = self.request('GET', path, params=params, timeout=timeout).content.decode()
+                    self.cache.set(key, text)
+                data = json.loads(text)
+                logger.debug('<<<<< cached\n%s', _LazyDump(data))
+                return data
+        return self._decode(self.request('GET', path, params=params, timeout=timeout))
 
     def post(self, path: str, params: Optional[Dict[str, Any]] = None, json=None) -> Union[requests.Response, str]:
         response = self.request('POST', path, params=params, json=json)
         try:
-            return response.json()
+            return self._decode(response)
         except JSONDecodeError:
+            logger.debug('<<<<< %s\n%s', response.status_code, response.text)
             return response.text
 
     def delete(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        return self.request('DELETE', path, params=params).json()
+        return self._decode(self.request('DELETE', path, params=params))
 
     def put(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
-        return self.request('PUT', path, params=params).json()
+        return self._decode(self.request('PUT', path, params=params))
+
+
+class NodeHealth:
+    """Health state of a single node within a pool."""
+
+    def __init__(self, node: RpcNode) -> None:
+        self.node = node
+        self.latency = 0.0
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+        self.head_level: Optional[int] = None
+        self.lagging = False
+
+    def __repr__(self) -> str:
+        return f'{self.node.uri[0]}\t{self.latency * 1000:.0f}ms\t{self.outstanding} pending\t{self.failures} failures'
+
+    def is_available(self, now: float) -> bool:
+        return self.ejected_until <= now and not self.lagging
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            uri=self.node.uri[0],
+            latency=self.latency,
+            outstanding=self.outstanding,
+            failures=self.failures,
+            ejected=self.ejected_until > monotonic(),
+            head_level=self.head_level,
+            lagging=self.lagging,
+        )
 
 
 class RpcMultiNode(RpcNode):
-    """Request proxy for multiple nodes chosen for each request in round-robin order."""
+    """Request proxy for multiple nodes with health-aware load balancing and failover.
+
+    Nodes failing `max_failures` times in a row (connection errors, timeouts, 502/503/504 responses) are ejected
+    for `eject_timeout` seconds and then probed again with live traffic. If `max_lag` is set, nodes whose head is
+    more than `max_lag` blocks behind the best known head are skipped. Idempotent requests (GET) are retried on
+    another node.
+    """
+
+    strategies = ('round_robin', 'latency', 'least_requests')
 
-    def __init__(self, uri: Union[str, List[str]]) -> None:
-        super().__init__(uri)
-        self.nodes = list(map(RpcNode, self.uri))
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        strategy: str = 'round_robin',
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        eject_timeout: float = DEFAULT_EJECT_TIMEOUT,
+        max_lag: Optional[int] = None,
+        lag_check_interval: float = DEFAULT_LAG_CHECK_INTERVAL,
+        max_retries: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param uri: list of node addresses
+        :param strategy: node selection strategy: `round_robin`, `latency` (lowest latency weighted by pending \
+            requests), or `least_requests` (least pending requests)
+        :param max_failures: number of consecutive failures after which the node is ejected
+        :param eject_timeout: time (seconds) before an ejected node gets probed again
+        :param max_lag: maximum allowed lag (in blocks) behind the best known head, None disables the check
+        :param lag_check_interval: how often (seconds) head levels are compared
+        :param max_retries: number of extra attempts on other nodes for idempotent requests (all nodes by default)
+        :param kwargs: RpcNode arguments (pool settings, cache)
+        """
+        super().__init__(uri, **kwargs)
+        if strategy not in self.strategies:
+            raise ValueError(f'Unknown strategy `{strategy}`, expected one of {self.strategies}')
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.eject_timeout = eject_timeout
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.max_retries = len(self.uri) - 1 if max_retries is None else max_retries
+        self.nodes = [RpcNode(node_uri, session=self.session) for node_uri in self.uri]
+        self.health = [NodeHealth(node) for node in self.nodes]
+        self._lock = Lock()
+        self._lag_lock = Lock()
         self._next_i = 0
+        self._lag_checked_at = 0.0
 
     def __repr__(self) -> str:
         res = [
             super().__repr__(),
             '\nNode addresses',
-            *self.uri,
+            *map(repr, self.health),
         ]
         return '\n'.join(res)
 
+    @property
+    def node_stats(self) -> List[Dict[str, Any]]:
+        """Latency, pending requests, failures and lag status for every node."""
+        with self._lock:
+            return [health.to_dict() for health in self.health]
+
+    def _select(self, exclude: List[NodeHealth]) -> NodeHealth:
+        with self._lock:
+            now = monotonic()
+            candidates = [h for h in self.health if h not in exclude and h.is_available(now)]
+            if not candidates:
+                candidates = [h for h in self.health if h not in exclude and h.ejected_until <= now]
+            if not candidates:
+                candidates = [h for h in self.health if h not in exclude] or self.health
+
+            if self.strategy == 'latency':
+                selected = min(candidates, key=lambda h: h.latency * (h.outstanding + 1))
+            elif self.strategy == 'least_requests':
+                selected = min(candidates, key=lambda h: (h.outstanding, h.latency))
+            else:
+                selected = candidates[self._next_i % len(candidates)]
+                self._next_i = (self._next_i + 1) % len(self.health)
+
+            selected.outstanding += 1
+            return selected
+
+    def _release(self, health: NodeHealth, elapsed: Optional[float]) -> None:
+        with self._lock:
+            health.outstanding -= 1
+            if elapsed is None:
+                health.failures += 1
+                if health.failures >= self.max_failures:
+                    logger.warning('Node %s is ejected for %d sec', health.node.uri[0], self.eject_timeout)
+                    health.ejected_until = monotonic() + self.eject_timeout
+            else:
+                health.failures = 0
+                health.latency = elapsed if health.latency == 0 else LATENCY_EWMA * elapsed + (1 - LATENCY_EWMA) * health.latency
+
+    def check_lag(self) -> None:
+        """Fetch head levels of all available nodes and mark those lagging behind."""
+        self._lag_checked_at = monotonic()
+        for health in self.health:
+            if health.ejected_until > monotonic():
+                continue
+            try:
+                health.head_level = health.node.request('GET', 'chains/main/blocks/head/header/shell').json()['level']
+            except (RpcError, requests.exceptions.RequestException) as e:
+                logger.debug('Failed to get head level from %s: %s', health.node.uri[0], e)
+                health.head_level = None
+
+        levels = [h.head_level for h in self.health if h.head_level is not None]
+        best_level = max(levels) if levels else None
+        max_lag = self.max_lag or 0
+        with self._lock:
+            for health in self.health:
+                lagging = best_level is not None and (health.head_level is None or best_level - health.head_level > max_lag)
+                if lagging and not health.lagging:
+                    logger.warning('Node %s is lagging behind (%s < %s)', health.node.uri[0], health.head_level, best_level)
+                health.lagging = lagging
+
+    def _maybe_check_lag(self) -> None:
+        if self.max_lag is None or monotonic() - self._lag_checked_at < self.lag_check_interval:
+            return
+        if self._lag_lock.acquire(blocking=False):
+            try:
+                self.check_lag()
+            finally:
+                self._lag_lock.release()
+
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
-        assert self._next_i < len(self.nodes)
-        res = self.nodes[self._next_i].request(method, path, **kwargs)
-        self._next_i = (self._next_i + 1) % len(self.nodes)
-        return res
+        self._maybe_check_lag()
+        max_attempts = 1 + (self.max_retries if method.upper() in IDEMPOTENT_METHODS else 0)
+        tried: List[NodeHealth] = []
+        while True:
+            health = self._select(exclude=tried)
+            tried.append(health)
+            started_at = monotonic()
+            try:
+                res = health.node.request(method, path, **kwargs)
+            except (RpcNodeUnavailableError, requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._release(health, None)
+                if len(tried) >= min(max_attempts, len(self.nodes)):
+                    raise
+                logger.info('Node %s failed (%s), retrying %s %s on another node', health.node.uri[0], e, method, path)
+            except Exception:
+                self._release(health, monotonic() - started_at)
+                raise
+            else:
+                self._release(health, monotonic() - started_at)
+                return res
@@ -9,7 +9,7 @@ from pendulum.parsing.exceptions import ParserError
 from pytezos.crypto.encoding import is_bh, is_ogh
 from pytezos.jupyter import get_attr_docstring
 from pytezos.rpc.query import RpcQuery
-from pytezos.rpc.search import BlockSliceQuery
+from pytezos.rpc.search import BlockSliceQuery, find_operation_index
 
 
 def to_timestamp(v):
@@ -22,6 +22,33 @@ def to_timestamp(v):
     return v
 
 
+def is_upvote(op, proposal_id) -> bool:
+    return any(
+        map(
+            lambda x: x['kind'] == 'proposals' and proposal_id in x.get('proposals', []),
+            op['contents'],
+        )
+    )
+
+
+def is_ballot(op, proposal_id=None) -> bool:
+    return any(
+        map(
+            lambda x: x['kind'] == 'ballot' and (proposal_id is None or proposal_id == x.get('proposal')),
+            op['contents'],
+        )
+    )
+
+
+def is_origination(op, contract_id) -> bool:
+    return any(
+        map(
+            lambda x: x['kind'] == 'origination' and contract_id in x['metadata']['operation_result']['originated_contracts'],
+            op['contents'],
+        )
+    )
+
+
 class BlocksQuery(RpcQuery, path='/chains/{}/blocks'):
     def __call__(self, length=1, head=None, min_date=None):
         """List known heads of the blockchain sorted with decreasing fitness.
@@ -250,16 +277,7 @@ class OperationListListQuery(RpcQuery, path=['/chains/{}/blocks/{}/operations'])
             return self[item[0]][item[1]]
 
         if isinstance(item, str) and is_ogh(item):
-            operation_hashes = self._parent.operation_hashes()
-
-            def find_index():
-                for i, validation_pass in enumerate(operation_hashes):
-                    for j, og_hash in enumerate(validation_pass):
-                        if og_hash == item:
-                            return i, j
-                raise StopIteration('Operation group hash not found')
-
-            return self[find_index()]
+            return self[find_operation_index(self._parent.operation_hashes(), item)]
 
         return super(OperationListListQuery, self).__getitem__(item)
 
@@ -302,16 +320,7 @@ class OperationListListQuery(RpcQuery, path=['/chains/{}/blocks/{}/operations'])
         :param proposal_id: Proposal hash (base58)
         :returns: list of operation contents
         """
-
-        def is_upvote(op):
-            return any(
-                map(
-                    lambda x: x['kind'] == 'proposals' and proposal_id in x.get('proposals', []),
-                    op['contents'],
-                )
-            )
-
-        return list(filter(is_upvote, self.votes()))
+        return list(filter(lambda op: is_upvote(op, proposal_id), self.votes()))
 
     def find_ballots(self, proposal_id=None) -> list:
         """Find operations of kind `ballot`.
@@ -319,16 +328,7 @@ class OperationListListQuery(RpcQuery, path=['/chains/{}/blocks/{}/operations'])
         :param proposal_id: Proposal hash (optional)
         :returns: list of operation contents
         """
-
-        def is_ballot(op):
-            return any(
-                map(
-                    lambda x: x['kind'] == 'ballot' and (proposal_id is None or proposal_id == x.get('proposal')),
-                    op['contents'],
-                )
-            )
-
-        return list(filter(is_ballot, self.votes()))
+        return list(filter(lambda op: is_ballot(op, proposal_id), self.votes()))
 
     def find_origination(self, contract_id):
         """Find origination of the contract.
@@ -336,19 +336,7 @@ class OperationListListQuery(RpcQuery, path=['/chains/{}/blocks/{}/operations'])
         :param contract_id: Contract ID (KT-address)
         :returns: operation content
         """
-
-        def is_origination(op):
-            def is_it(x):
-                return x['kind'] == 'origination' and contract_id in x['metadata']['operation_result']['originated_contracts']
-
-            return any(
-                map(
-                    is_it,
-                    op['contents'],
-                )
-            )
-
-        return next(filter(is_origination, self.managers()))
+        return next(filter(lambda op: is_origination(op, contract_id), self.managers()))
 
 
 class OperationQuery(RpcQuery, path=['/chains/{}/blocks/{}/operations/{}/{}']):
@@ -1,4 +1,5 @@
 from os.path import dirname
+from typing import List, Optional, Union
 
 from pytezos.jupyter import InlineDocstring, get_attr_docstring, get_class_docstring
 from pytezos.rpc.docs import rpc_docs
@@ -58,8 +59,10 @@ class RpcQuery(metaclass=InlineDocstring):
     __extensions__ = dict()  # type: ignore
 
     @classmethod
-    def __init_subclass__(cls, path: str = '', **kwargs):
+    def __init_subclass__(cls, path: Optional[Union[str, List[str]]] = None, **kwargs):
         super().__init_subclass__(**kwargs)  # type: ignore
+        if path is None:
+            return
         if isinstance(path, list):
             for sub_path in path:
                 cls.__extensions__[sub_path] = cls
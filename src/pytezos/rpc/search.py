@@ -1,4 +1,7 @@
-from typing import Any, Callable, Generator, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, List, Optional, Sequence, Tuple
 
 from pytezos.crypto.encoding import is_bh
 from pytezos.jupyter import get_attr_docstring
@@ -7,13 +10,50 @@ from pytezos.rpc.node import RpcError
 from pytezos.rpc.query import RpcQuery
 
 
+DEFAULT_CONCURRENCY = 8
+
+
+def prefetch(fn: Callable, items: Iterable, concurrency: int = DEFAULT_CONCURRENCY) -> Generator:
+    """ Lazily map function over items keeping up to `concurrency` calls in flight, results are yielded in order.
+
+    :param fn: function to apply (typically an RPC call)
+    :param items: input values
+    :param concurrency: maximum number of simultaneous calls, 1 means sequential execution
+    """
+    if concurrency <= 1:
+        for item in items:
+            yield fn(item)
+        return
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque(executor.submit(fn, item) for item in islice(items, concurrency))
+        try:
+            while pending:
+                future = pending.popleft()
+                for item in islice(items, 1):
+                    pending.append(executor.submit(fn, item))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def find_operation_index(operation_hashes: list, operation_group_hash: str) -> Tuple[int, int]:
+    for i, validation_pass in enumerate(operation_hashes):
+        for j, og_hash in enumerate(validation_pass):
+            if og_hash == operation_group_hash:
+                return i, j
+    raise StopIteration('Operation group hash not found')
+
+
 def find_state_change_intervals(head: int, last: int, get: Callable, equals: Callable,
-                                step=60) -> Generator:
+                                step=60, concurrency=1) -> Generator:
     succ_value = get(head)
     logger.debug('%s at head %s' % succ_value, head)
 
-    for level in range(head - step, last, -step):
-        value = get(level)
+    levels = range(head - step, last, -step)
+    for level, value in zip(levels, prefetch(get, levels, concurrency)):
         logger.debug('%s at level %s' % value, level)
 
         if not equals(value, succ_value):
@@ -51,8 +91,8 @@ def walk_state_change_interval(head: int, last: int, get: Callable, equals: Call
 
 
 def find_state_changes(head: int, last: int, get: Callable, equals: Callable,
-                       step=60) -> Generator:
-    state_change_intervals = find_state_change_intervals(head, last, get, equals, step)
+                       step=60, concurrency=1) -> Generator:
+    state_change_intervals = find_state_change_intervals(head, last, get, equals, step, concurrency)
     for int_head, int_head_value, int_tail, int_last_value in state_change_intervals:
         for change in walk_state_change_interval(int_head, int_tail, get, equals,
                                                  head_value=int_head_value,
@@ -119,6 +159,37 @@ class BlockSliceQuery(RpcQuery):
 
         return get_level(self._start), get_level(self._stop)
 
+    def _get_field(self, level: int, field: str):
+        query = self._getitem(level)
+        for part in filter(None, field.split('/')):
+            query = query[int(part)] if part.isdigit() else getattr(query, part)
+        return query()
+
+    def _iter_levels(self, levels: Sequence[int], fields: Optional[List[str]], concurrency: int) -> Generator:
+        if not fields:
+            yield from prefetch(lambda x: self._getitem(x)(), levels, concurrency)
+            return
+
+        requests = ((level, field) for level in levels for field in fields)
+        responses = prefetch(lambda x: self._get_field(*x), requests, concurrency)
+        for level in levels:
+            block = dict(level=level)
+            block.update(zip(fields, islice(responses, len(fields))))
+            yield block
+
+    def iter(self, fields: Optional[List[str]] = None, concurrency: int = DEFAULT_CONCURRENCY, reverse=False) -> Generator:
+        """ Iterate over blocks in this interval, fetching them concurrently but yielding in order.
+
+        :param fields: block sub-resources to fetch, e.g. `['header', 'operations']` or `['operations/3']`, \
+            whole blocks are fetched if omitted
+        :param concurrency: maximum number of requests in flight
+        :param reverse: iterate from the last block to the first one
+        :returns: Generator of whole blocks, or dicts with `level` and requested fields
+        """
+        start, stop = self.get_range()
+        levels = range(stop, start - 1, -1) if reverse else range(start, stop + 1)
+        return self._iter_levels(levels, fields, concurrency)
+
     def find_proposal_injection(self, proposal_id):
         """ Find proposal injection.
 
@@ -136,10 +207,11 @@ class BlockSliceQuery(RpcQuery):
         assert len(votes) == 1
         return votes
 
-    def find_upvotes(self, proposal_id) -> Generator:
+    def find_upvotes(self, proposal_id, concurrency=DEFAULT_CONCURRENCY) -> Generator:
         """ Find upvoting operations for the given proposal.
 
         :param proposal_id: Proposal hash (base58)
+        :param concurrency: maximum number of requests in flight
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -147,15 +219,17 @@ class BlockSliceQuery(RpcQuery):
             head=head - 1,  # proposals are empty at the last block
             last=last,
             get=lambda x: self._getitem(x).votes.proposals[proposal_id](),
-            equals=lambda x, y: x == y
+            equals=lambda x, y: x == y,
+            concurrency=concurrency,
         )
         for level, _ in state_changes:
             for upvote in self._getitem(level).operations.find_upvotes(proposal_id):
                 yield upvote
 
-    def find_ballots(self) -> Generator:
+    def find_ballots(self, concurrency=DEFAULT_CONCURRENCY) -> Generator:
         """ Find ballot operations for the current period.
 
+        :param concurrency: maximum number of requests in flight
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -163,7 +237,8 @@ class BlockSliceQuery(RpcQuery):
                 head=head - 1,  # ballots are empty at the last block
                 last=last,
                 get=lambda x: self._getitem(x).votes.ballots(),
-                equals=lambda x, y: x == y
+                equals=lambda x, y: x == y,
+                concurrency=concurrency,
         )
         for level, _ in state_changes:
             for ballot in self._getitem(level).operations.find_ballots():
@@ -189,10 +264,11 @@ class BlockSliceQuery(RpcQuery):
         )
         return self._getitem(level).operations.find_origination(contract_id)
 
-    def find_operation(self, operation_group_hash) -> dict:
+    def find_operation(self, operation_group_hash, concurrency=DEFAULT_CONCURRENCY) -> dict:
         """ Find operation by hash.
 
         :param operation_group_hash: base58
+        :param concurrency: maximum number of requests in flight
         :raises: StopIteration if not found
         """
         last, head = self.get_range()
@@ -201,12 +277,13 @@ class BlockSliceQuery(RpcQuery):
         else:
             levels = range(last, head + 1, 1)
 
-        for block_level in levels:
-            logger.debug(f'Looking for operation %s in block %s...' % (operation_group_hash, block_level))
+        for block in self._iter_levels(levels, ['operation_hashes'], concurrency):
+            logger.debug('Looking for operation %s in block %s...', operation_group_hash, block['level'])
             try:
-                return self._getitem(block_level).operations[operation_group_hash]()
+                i, j = find_operation_index(block['operation_hashes'], operation_group_hash)
             except StopIteration:
                 continue
+            return self._getitem(block['level']).operations[i][j]()
 
         raise StopIteration(operation_group_hash)
 
@@ -215,8 +292,7 @@ class PeriodQuery(RpcQuery):
     __pos_key__ = ''
     __val_key__ = ''
 
-    def _get_item(self, item) -> BlockSliceQuery:
-        lvl = self.head.metadata()['level_info']
+    def _get_level_range(self, lvl: dict, item) -> Tuple[int, Optional[int]]:
         blocks_per_period = int((lvl['level'] - lvl[self.__pos_key__] - 1) / lvl[self.__val_key__])
 
         def get_range(x):
@@ -239,6 +315,10 @@ class PeriodQuery(RpcQuery):
         else:
             raise NotImplementedError(item)
 
+        return start, stop
+
+    def _get_item(self, item) -> BlockSliceQuery:
+        start, stop = self._get_level_range(self.head.metadata()['level_info'], item)
         return BlockSliceQuery(
             start=start,
             stop=stop,
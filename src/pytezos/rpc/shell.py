@@ -1,8 +1,11 @@
 from binascii import hexlify
+from contextlib import contextmanager
 from datetime import datetime
 from functools import lru_cache
+from threading import Condition, Lock, Thread
 from time import sleep
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional
+from weakref import WeakKeyDictionary, ref
 
 import requests
 import simplejson as json
@@ -12,11 +15,19 @@ from pytezos.crypto.encoding import base58_decode
 from pytezos.jupyter import get_attr_docstring
 from pytezos.logging import logger
 from pytezos.rpc.kind import validation_passes
+from pytezos.rpc.node import RpcError, RpcNode, RpcNodeUnavailableError
 from pytezos.rpc.protocol import BlockQuery, BlocksQuery
 from pytezos.rpc.query import RpcQuery
 from pytezos.rpc.search import CyclesQuery, VotingPeriodsQuery
 
 MAX_BLOCK_TIMEOUT = 86400
+MONITOR_CONNECT_TIMEOUT = 10
+MONITOR_STALL_TIMEOUT = 300
+MONITOR_RECONNECT_DELAY = 1
+MONITOR_MAX_RECONNECT_DELAY = 30
+MEMPOOL_STATUSES = ['applied', 'branch_delayed', 'branch_refused', 'refused', 'outdated']
+
+_filtering_supported = WeakKeyDictionary()  # type: ignore
 
 
 def make_operation_result(**kwargs):
@@ -70,8 +81,10 @@ class ShellQuery(RpcQuery, path=''):
         yield_current=False,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        stream: bool = False,
     ) -> Generator[str, None, None]:
-        """Iterates over future blocks (waits and yields block hash)
+        """Iterates over future blocks (waits and yields block hash), every intermediate block is yielded
+        even if the head has advanced by several levels at once.
 
         :param current_block_hash: hash of the current block (head)
         :param max_blocks: number of blocks to iterate (not including the current one)
@@ -79,6 +92,7 @@ class ShellQuery(RpcQuery, path=''):
         :param yield_current: yield current block hash at the very beginning
         :param time_between_blocks: override protocol constant
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param stream: subscribe to new heads (shared `/monitor/heads` stream) instead of polling
         :return: block hashes
         """
         prev_block_hash: Optional[str] = None
@@ -93,6 +107,10 @@ class ShellQuery(RpcQuery, path=''):
         if yield_current:
             yield current_block_hash
 
+        if stream:
+            yield from self._stream_blocks(current_block_hash, max_blocks, timeout=time_between_blocks + block_timeout)
+            return
+
         for _ in range(max_blocks):
             header = self.blocks[current_block_hash].header()
             if prev_block_hash and prev_block_hash != header['predecessor']:
@@ -123,6 +141,30 @@ class ShellQuery(RpcQuery, path=''):
             else:
                 raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', block_timeout)
 
+    def _stream_blocks(self, current_block_hash: str, max_blocks: int, timeout: float) -> Generator[str, None, None]:
+        monitor = HeadMonitor.get(self.node)
+        with monitor.subscription():
+            current_level = self.blocks[current_block_hash].header()['level']
+            while max_blocks > 0:
+                head = monitor.wait_for(
+                    predicate=lambda x: x['hash'] != current_block_hash and x['level'] >= current_level,
+                    timeout=timeout,
+                )
+                if head['level'] > current_level + 1:
+                    # NOTE: several blocks were baked in between, fill the gap
+                    chain = self.blocks(length=head['level'] - current_level + 1, head=head['hash'])[0]
+                    block_hashes, predecessor = chain[-2::-1], chain[-1]
+                else:
+                    block_hashes, predecessor = [head['hash']], head['predecessor']
+                if predecessor != current_block_hash:
+                    raise StopIteration('Reorg detected, expected predecessor %s instead of %s', current_block_hash, predecessor)
+
+                for block_hash in block_hashes[:max_blocks]:
+                    logger.info('Found new block %s', block_hash)
+                    yield block_hash
+                max_blocks -= len(block_hashes)
+                current_block_hash, current_level = head['hash'], head['level']
+
     def wait_operations(
         self,
         opg_hashes: List[str],
@@ -131,6 +173,7 @@ class ShellQuery(RpcQuery, path=''):
         current_block_hash: Optional[str] = None,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        stream: bool = False,
     ) -> List[dict]:
         """Wait for one or many operations gain enough confirmations
 
@@ -140,6 +183,7 @@ class ShellQuery(RpcQuery, path=''):
         :param current_block_hash: current block hash (head)
         :param time_between_blocks: override protocol constant
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param stream: subscribe to new heads (shared `/monitor/heads` stream) instead of polling
         :return: list of operation contents with metadata
         """
 
@@ -157,6 +201,7 @@ class ShellQuery(RpcQuery, path=''):
             yield_current=True,
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
+            stream=stream,
         ):
             if len(pending) > 0:
                 mempool = set(map(lambda x: x['hash'], self.mempool.pending_operations.flatten()))
@@ -187,7 +232,13 @@ class ShellQuery(RpcQuery, path=''):
         if len(operations) < len(opg_hashes):
             raise StopIteration('Only %d of %d operations were included, stopping', len(operations), len(opg_hashes))
 
-        for _ in self.wait_blocks(block_hash, max_blocks=min_confirmations - 1, time_between_blocks=time_between_blocks):
+        for _ in self.wait_blocks(
+            block_hash,
+            max_blocks=min_confirmations - 1,
+            time_between_blocks=time_between_blocks,
+            block_timeout=block_timeout,
+            stream=stream,
+        ):
             for opg_hash in opg_hashes:
                 confirmations[opg_hash] += 1
                 logger.info('Operation %s has %d/%d confirmations', opg_hash, confirmations[opg_hash], min_confirmations)
@@ -285,29 +336,48 @@ class PendingOperationsQuery(RpcQuery, path='/chains/{}/mempool/pending_operatio
 
         :param item: operation group hash (base58)
         """
-        operations_dict = self()
-        for status, operations in operations_dict.items():
-            for operation in operations:
-                if isinstance(operation, dict):
-                    if operation['hash'] == item:
-                        return {
-                            **make_operation_result(status=status),
-                            **operation,
-                        }
-                elif isinstance(operation, list):
-                    if operation[0] == item:
-                        errors = operation[1].pop1('error', default=[])
-                        return {
-                            **make_operation_result(status=status, errors=errors),
-                            **operation[1],
-                            'hash': operation[0],
-                        }
-                else:
-                    raise Exception('Unknown operation type', operation)
-        raise StopIteration
+        return self.find_operation(self(), item)
 
     def flatten(self) -> List[Dict[str, Any]]:
-        operations_dict = self()
+        return self.flatten_operations(self())
+
+    def by_source(self, source: str, statuses: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get operations of a single source as a flat list (see `flatten`).
+
+        The node is asked to filter by source and status; if it does not support these query arguments,
+        the full mempool is fetched and filtered on the client side (and the node is remembered).
+
+        :param source: public key hash
+        :param statuses: include only these statuses (`applied`, `branch_delayed`, `branch_refused`, `refused`, `outdated`), \
+        all by default
+        """
+        params: Dict[str, str] = {}
+        if _filtering_supported.get(self.node, True):
+            params['source'] = source
+            if statuses is not None:
+                params.update({status: 'true' if status in statuses else 'false' for status in MEMPOOL_STATUSES})
+            try:
+                operations_dict = self(**params)
+            except RpcNodeUnavailableError:
+                raise
+            except RpcError as e:
+                logger.debug('Mempool filtering is not supported by %s: %s', self.node, e)
+                _filtering_supported[self.node] = False
+                params.clear()
+        if not params:
+            operations_dict = self()
+
+        if statuses is not None:
+            operations_dict = {k: v for k, v in operations_dict.items() if k in statuses}
+        return [
+            operation
+            for operation in self.flatten_operations(operations_dict)
+            if any(content.get('source') == source for content in operation.get('contents', []))
+        ]
+
+    @staticmethod
+    def flatten_operations(operations_dict: Dict[str, list]) -> List[Dict[str, Any]]:
+        """Convert mempool response to a flat list of operations, status and errors are moved to metadata."""
         operations_list = list()
         for status, operations in operations_dict.items():
             for operation in operations:
@@ -331,6 +401,18 @@ class PendingOperationsQuery(RpcQuery, path='/chains/{}/mempool/pending_operatio
                     raise Exception('Unknown operation type', operation)
         return operations_list
 
+    @classmethod
+    def find_operation(cls, operations_dict: Dict[str, list], item: str) -> Dict[str, Any]:
+        """Find operation in mempool response by hash.
+
+        :param operations_dict: mempool response
+        :param item: operation group hash (base58)
+        """
+        for operation in cls.flatten_operations(operations_dict):
+            if operation['hash'] == item:
+                return operation
+        raise StopIteration
+
     def __repr__(self):
         res = [
             super(PendingOperationsQuery, self).__repr__(),
@@ -459,6 +541,135 @@ class ResponseGenerator:
             yield json.loads(line.decode())
 
 
+class HeadMonitor:
+    """Shared subscription to new heads of a chain.
+
+    A single `/monitor/heads/<chain>` stream per node is consumed in a background thread while there is at least one
+    subscriber; waiters block on a condition variable instead of polling. Dropped or stalled connections are
+    re-established with exponential backoff.
+    """
+
+    _instances = WeakKeyDictionary()  # type: ignore
+    _instances_lock = Lock()
+
+    def __init__(
+        self,
+        node: RpcNode,
+        chain: str = 'main',
+        stall_timeout: float = MONITOR_STALL_TIMEOUT,
+        reconnect_delay: float = MONITOR_RECONNECT_DELAY,
+        max_reconnect_delay: float = MONITOR_MAX_RECONNECT_DELAY,
+    ) -> None:
+        """
+        :param node: RPC node to subscribe to
+        :param chain: chain ID or alias
+        :param stall_timeout: reconnect if nothing was received for that long (seconds)
+        :param reconnect_delay: initial delay between reconnection attempts (seconds)
+        :param max_reconnect_delay: maximum delay between reconnection attempts (seconds)
+        """
+        self._node = ref(node)
+        self.chain = chain
+        self.stall_timeout = stall_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._cond = Condition()
+        self._head: Optional[Dict[str, Any]] = None
+        self._subscribers = 0
+        self._thread: Optional[Thread] = None
+        self._response: Optional[requests.Response] = None
+
+    @classmethod
+    def get(cls, node: RpcNode, chain: str = 'main') -> 'HeadMonitor':
+        """Get monitor shared by all waiters using the same node.
+
+        :param node: RPC node
+        :param chain: chain ID or alias
+        """
+        with cls._instances_lock:
+            monitors = cls._instances.setdefault(node, {})
+            if chain not in monitors:
+                monitors[chain] = cls(node, chain=chain)
+            return monitors[chain]
+
+    @property
+    def head(self) -> Optional[Dict[str, Any]]:
+        """Last received head (shell header with hash)."""
+        return self._head
+
+    def subscribe(self) -> None:
+        with self._cond:
+            self._subscribers += 1
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=f'HeadMonitor-{self.chain}', daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self) -> None:
+        with self._cond:
+            self._subscribers -= 1
+            if self._subscribers == 0 and self._response is not None:
+                self._response.close()
+
+    @contextmanager
+    def subscription(self):
+        self.subscribe()
+        try:
+            yield self
+        finally:
+            self.unsubscribe()
+
+    def wait_for(self, predicate: Callable[[Dict[str, Any]], bool], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Block until the last received head satisfies the condition.
+
+        :param predicate: condition on head (shell header with hash)
+        :param timeout: maximum waiting time (seconds)
+        :raises TimeoutError: no matching head received in time
+        :returns: head
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._head is not None and predicate(self._head), timeout=timeout):
+                raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', timeout)
+            assert self._head is not None
+            return self._head
+
+    def _set_head(self, head: Dict[str, Any]) -> None:
+        with self._cond:
+            self._head = head
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            with self._cond:
+                node = self._node()
+                if self._subscribers == 0 or node is None:
+                    self._thread = None
+                    return
+            try:
+                self._response = node.request(
+                    method='GET',
+                    path=f'monitor/heads/{self.chain}',
+                    stream=True,
+                    timeout=(MONITOR_CONNECT_TIMEOUT, self.stall_timeout),
+                )
+                for head in ResponseGenerator(self._response):
+                    logger.debug('New head %s at level %s', head['hash'], head['level'])
+                    self._set_head(head)
+                    delay = self.reconnect_delay
+            except (RpcError, requests.exceptions.RequestException, ValueError, AttributeError) as e:
+                if self._subscribers > 0:
+                    logger.warning('Head monitor connection lost: %s', e)
+            finally:
+                if self._response is not None:
+                    self._response.close()
+                    self._response = None
+                del node
+
+            if self._subscribers > 0:
+                logger.info('Reconnecting to head monitor in %d sec', delay)
+                sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+
 class MonitorQuery(
     RpcQuery,
     path=[
@@ -1,9 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 from pytezos.rpc.shell import ShellQuery
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from parameterized import parameterized
 
+from pytezos.context.chain_state import ChainState
+from pytezos.context.counter import CounterManager
 from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.types import BigMapType, NatType
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.query import RpcQuery
 
 
 class TestContext(TestCase):
@@ -33,3 +41,162 @@ class TestContext(TestCase):
         # Assert
         self.assertFalse(public_result)
         self.assertTrue(sandboxed_result)
+
+
+class TestBigMapValues(TestCase):
+
+    def setUp(self) -> None:
+        self.key_hashes = {i: forge_script_expr(NatType.from_value(i).pack(legacy=True)) for i in range(5)}
+        self.storage = {self.key_hashes[i]: {'int': str(i * 10)} for i in range(3)}
+        self.calls = []
+
+    def fake_call(self, query, **params):
+        self.calls.append(query.path)
+        key_hash = query.path.split('/')[-1]
+        if key_hash not in self.storage:
+            raise RpcError()
+        return self.storage[key_hash]
+
+    def test_get_many(self) -> None:
+        context = ExecutionContext(shell=ShellQuery(None))
+        big_map = BigMapType.create_type(args=[NatType, NatType]).from_python_object(42)
+        big_map.attach_context(context)
+        keys = [NatType.from_value(i) for i in range(5)]
+        with patch.object(RpcQuery, '__call__', autospec=True, side_effect=self.fake_call):
+            _, big_map = big_map.update(keys[0], NatType.from_value(1))
+            _, big_map = big_map.update(keys[1], None)
+            self.calls.clear()
+            values = big_map.get_many(keys, concurrency=4)
+        self.assertEqual([1, None, 20, None, None], [None if v is None else int(v) for v in values])
+        self.assertEqual(3, len(self.calls))
+        self.assertTrue(all('/big_maps/42/' in path for path in self.calls))
+
+    def test_prefetch(self) -> None:
+        context = ExecutionContext(shell=ShellQuery(None))
+        with patch.object(RpcQuery, '__call__', autospec=True, side_effect=self.fake_call):
+            context.prefetch_big_map_values(42, list(self.key_hashes.values()))
+        self.assertEqual(5, len(self.calls))
+
+        context.register_big_map(42)
+        with patch.object(RpcQuery, '__call__', side_effect=AssertionError):
+            self.assertEqual({'int': '20'}, context.get_big_map_value(42, self.key_hashes[2]))
+            self.assertIsNone(context.get_big_map_value(42, self.key_hashes[4]))
+
+
+class TestCounterManager(TestCase):
+
+    def setUp(self) -> None:
+        self.shell = MagicMock()
+        self.shell.contracts.__getitem__.return_value.return_value = {'counter': '10'}
+        self.shell.mempool.pending_operations.by_source.return_value = []
+        self.manager = CounterManager(self.shell, 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm')
+
+    def test_concurrent_reservations(self) -> None:
+        with ThreadPoolExecutor(8) as executor:
+            firsts = list(executor.map(lambda _: self.manager.reserve(2), range(100)))
+        self.assertEqual(list(range(11, 211, 2)), sorted(firsts))
+        self.assertEqual(1, self.shell.contracts.__getitem__.return_value.call_count)
+
+    def test_release(self) -> None:
+        first = self.manager.reserve(2)
+        self.manager.release(first)
+        self.assertEqual(first, self.manager.reserve(1))
+
+    def test_gap(self) -> None:
+        refused, injected = self.manager.reserve(), self.manager.reserve()
+        self.manager.confirm(injected)
+        self.shell.mempool.pending_operations.by_source.return_value = [
+            {'hash': 'oo', 'contents': [{'kind': 'transaction', 'source': self.manager.pkh, 'counter': str(injected)}]}
+        ]
+        self.manager.release(refused)
+        self.assertEqual(refused, self.manager.reserve())
+        self.assertEqual(injected + 1, self.manager.reserve())
+
+    def test_dropped_operation(self) -> None:
+        first = self.manager.reserve(min_counter=11)
+        self.manager.confirm(first)
+        self.assertEqual(12, self.manager.reserve(min_counter=11))  # operation 11 is dropped from the mempool
+        self.manager.release(12)  # refused as counter in the future
+        self.assertEqual(11, self.manager.reserve(min_counter=11))
+
+    def test_outside_use(self) -> None:
+        self.manager.confirm(self.manager.reserve(min_counter=11))
+        self.shell.contracts.__getitem__.return_value.return_value = {'counter': '20'}
+        self.assertEqual(21, self.manager.reserve(min_counter=21))
+
+    def test_owner(self) -> None:
+        owner = object()
+        first = self.manager.reserve(2, owner=owner)
+        self.assertEqual(first, self.manager.reserve(2, owner=owner))
+        self.assertEqual(first + 2, self.manager.reserve(1))
+
+    def test_expired_reservation(self) -> None:
+        self.manager.reservation_timeout = 0
+        first = self.manager.reserve()
+        sleep(0.01)
+        self.assertEqual(first, self.manager.reserve())
+
+
+class TestPendingOperations(TestCase):
+
+    def test_by_source_fallback(self) -> None:
+        mempool = {
+            'applied': [{'hash': 'oo1', 'contents': [{'source': 'tz1a', 'counter': '1'}]}],
+            'refused': [['oo2', {'contents': [{'source': 'tz1a', 'counter': '2'}], 'error': []}]],
+            'branch_delayed': [{'hash': 'oo3', 'contents': [{'source': 'tz1b', 'counter': '1'}]}],
+        }
+
+        def get(path, params):
+            if params:
+                raise RpcError('Unexpected query parameter')
+            return mempool
+
+        node = MagicMock()
+        node.get.side_effect = get
+        query = ShellQuery(node).mempool.pending_operations
+        self.assertEqual(['oo1'], [op['hash'] for op in query.by_source('tz1a', statuses=['applied'])])
+        self.assertEqual(['oo1', 'oo2'], [op['hash'] for op in query.by_source('tz1a')])
+        self.assertEqual(3, node.get.call_count)  # filtering is not retried
+
+
+class TestChainState(TestCase):
+
+    def setUp(self) -> None:
+        self.shell = MagicMock()
+        self.shell.head.header.return_value = self.make_header(100, proto=1)
+        self.shell.blocks.side_effect = lambda length, head: [[f'B{100 - i}' for i in range(length)]]
+        self.shell.blocks.__getitem__.return_value.context.constants.return_value = {'proto': 1}
+        self.state = ChainState(self.shell)
+
+    @staticmethod
+    def make_header(level, proto):
+        return {'hash': f'B{level}', 'predecessor': f'B{level - 1}', 'level': level, 'proto': proto,
+                'protocol': f'P{proto}', 'chain_id': 'NetXxkAx4woPLyu'}
+
+    def test_cached(self) -> None:
+        for _ in range(3):
+            self.assertEqual('B45', self.state.get_branch(55))
+            self.assertEqual('P1', self.state.get_protocol())
+            self.assertEqual('NetXxkAx4woPLyu', self.state.get_chain_id())
+            self.assertEqual({'proto': 1}, self.state.get_constants())
+        self.assertEqual(1, self.shell.head.header.call_count)
+        self.assertEqual(1, self.shell.blocks.call_count)
+        self.assertEqual(1, self.shell.blocks.__getitem__.return_value.context.constants.call_count)
+
+    def test_new_head(self) -> None:
+        self.state.ttl = 0
+        self.state.get_branch(55)
+        self.state.get_constants()
+        self.shell.head.header.return_value = self.make_header(101, proto=1)
+        self.assertEqual('B46', self.state.get_branch(55))  # known from the previous head
+        self.state.get_constants()
+        self.assertEqual(1, self.shell.blocks.call_count)
+        self.assertEqual(1, self.shell.blocks.__getitem__.return_value.context.constants.call_count)
+
+    def test_protocol_change(self) -> None:
+        self.state.get_constants()
+        self.state._monitor = MagicMock(head=self.make_header(101, proto=2))
+        self.shell.blocks.__getitem__.return_value.context.constants.return_value = {'proto': 2}
+        self.assertEqual({'proto': 2}, self.state.get_constants())
+        self.assertEqual('P2', self.state.get_protocol())
+        self.assertEqual(1, self.shell.head.header.call_count)  # head is taken from the monitor
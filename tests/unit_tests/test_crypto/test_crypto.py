@@ -82,6 +82,27 @@ class TestCrypto(TestCase):
         key.verify(sig, msg)
         self.assertRaises(ValueError, key.verify, sig, b'fake')
 
+    @parameterized.expand([
+        ('edsk3nM41ygNfSxVU4w1uAW3G9EnTQEB5rjojeZedLTGmiGRcierVv', 1),
+        ('edsk3nM41ygNfSxVU4w1uAW3G9EnTQEB5rjojeZedLTGmiGRcierVv', 3),
+        ('spsk1zkqrmst1yg2c4xi3crWcZPqgdc9KtPtb9SAZWYHAdiQzdHy7j', 3),
+        ('p2sk3PM77YMR99AvD3fSSxeLChMdiQ6kkEzqoPuSwQqhPsh29irGLC', 3),
+    ])
+    def test_sign_many(self, sk, max_workers):
+        key = Key.from_encoded_key(sk)
+        messages = [f'0x{i:08x}' for i in range(10)]
+        signatures = key.sign_many(messages, generic=True, max_workers=max_workers)
+        self.assertEqual(len(messages), len(signatures))
+        for message, signature in zip(messages, signatures):
+            self.assertTrue(signature.startswith('sig'))
+            key.verify(signature, message)
+
+    @patch('pytezos.crypto.key.PROCESS_POOL_THRESHOLD', 4)
+    def test_sign_many_processes(self):
+        key = Key.from_encoded_key('spsk1zkqrmst1yg2c4xi3crWcZPqgdc9KtPtb9SAZWYHAdiQzdHy7j')
+        messages = [f'0x{i:08x}' for i in range(10)]
+        self.assertEqual([key.sign(message) for message in messages], key.sign_many(messages, max_workers=3))
+
     @parameterized.expand([
         ('edsk3nM41ygNfSxVU4w1uAW3G9EnTQEB5rjojeZedLTGmiGRcierVv', b'test',
          'edsigtzLBGCyadERX1QsYHKpwnxSxEYQeGLnJGsSkHEsyY8vB5GcNdnvzUZDdFevJK7YZQ2ujwVjvQZn62ahCEcy74AwtbA8HuN'),
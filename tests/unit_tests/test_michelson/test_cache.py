@@ -0,0 +1,49 @@
+import json
+from os.path import dirname, join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pytezos.michelson.cache import TypeCache
+from pytezos.michelson.micheline import MichelineSequence
+from pytezos.michelson.sections.parameter import ParameterSection
+from pytezos.michelson.sections.storage import StorageSection
+
+script_path = join(dirname(__file__), '..', '..', 'contract_tests', 'KT1RJpnMc83ybukSC8E9MKxKzH2wyxabMGnj', '__script__.json')
+
+
+class TestTypeCache(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        with open(script_path) as f:
+            cls.code = json.load(f)['code']
+
+    def test_match_cached(self):
+        cache = TypeCache()
+        expr = {'prim': 'parameter', 'args': [{'prim': 'nat', 'annots': ['%default']}]}
+        ty = cache.match(ParameterSection, expr)
+        self.assertIs(ty, cache.match(ParameterSection, expr))
+        self.assertEqual(dict(hits=1, misses=1, hit_rate=0.5, size=1), cache.stats)
+
+    def test_lru_eviction(self):
+        cache = TypeCache(maxsize=2)
+        for prim in ['nat', 'int', 'nat', 'string']:
+            cache.match(StorageSection, {'prim': 'storage', 'args': [{'prim': prim}]})
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.stats['hits'])
+        cache.match(StorageSection, {'prim': 'storage', 'args': [{'prim': 'nat'}]})
+        self.assertEqual(2, cache.stats['hits'])
+
+    def test_save_load(self):
+        cache = TypeCache()
+        ty = cache.match(MichelineSequence, self.code)
+        with TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, 'types.pickle')
+            cache.save(path)
+            warm_cache = TypeCache()
+            warm_cache.load(path)
+
+        loaded_ty = warm_cache.match(MichelineSequence, self.code)
+        self.assertEqual(1, warm_cache.stats['hits'])
+        self.assertEqual(self.code, loaded_ty.as_micheline_expr())
+        loaded_ty.assert_type_equal(ty)
@@ -3,7 +3,7 @@ from parameterized import parameterized
 
 from pytezos.michelson.micheline import blind_unpack
 from pytezos.michelson.types.base import MichelsonType
-from pytezos.michelson.forge import forge_script_expr, forge_micheline, unforge_micheline
+from pytezos.michelson.forge import forge_script_expr, forge_micheline, iter_unforge_micheline, unforge_micheline
 from pytezos.operation.forge import forge_operation_group
 
 unknown_data = [
@@ -124,3 +124,84 @@ class TestPacking(TestCase):
     def test_forge_combs(self):
         expr = {'prim': 'Pair', 'args': [{'int': '1'}, {'int': '2'}, {'int': '3'}, {'int': '4'}]}
         self.assertEqual(expr, unforge_micheline(forge_micheline(expr)))
+
+    def test_forge_annotated_comb(self):
+        expr = {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'int'}, {'prim': 'unit'}], 'annots': ['%x']}
+        self.assertEqual(expr, unforge_micheline(forge_micheline(expr)))
+
+    def test_unforge_memoryview(self):
+        expr = [{'prim': 'Elt', 'args': [{'string': 'ꜩ'}, {'bytes': '00ff'}]}, {'int': '-100500'}]
+        data = forge_micheline(expr)
+        self.assertEqual(expr, unforge_micheline(memoryview(b'\x05' + data)[1:]))
+
+    def test_iter_unforge_packed(self):
+        exprs = [{'int': str(i)} for i in range(10)] + [{'prim': 'Pair', 'args': [{'string': 'a'}, []]}]
+        data = b''.join(b'\x05' + forge_micheline(expr) for expr in exprs)
+        self.assertEqual(exprs, list(iter_unforge_micheline(data, packed=True)))
+        self.assertEqual(exprs[:2], list(iter_unforge_micheline(data[1:3] + data[4:6])))
+
+
+class TestTypeInterning(TestCase):
+
+    def test_same_type_same_class(self):
+        expr = {'prim': 'pair', 'args': [{'prim': 'nat', 'annots': ['%a']}, {'prim': 'map', 'args': [{'prim': 'string'}, {'prim': 'int'}]}]}
+        self.assertIs(MichelsonType.match(expr), MichelsonType.match(expr))
+
+    def test_annotations_distinguish(self):
+        self.assertIsNot(MichelsonType.match({'prim': 'nat', 'annots': ['%a']}), MichelsonType.match({'prim': 'nat', 'annots': ['%b']}))
+        self.assertIsNot(MichelsonType.match({'prim': 'nat', 'annots': [':a']}), MichelsonType.match({'prim': 'nat'}))
+
+    def test_literals(self):
+        self.assertIsNot(MichelsonType.match({'prim': 'sapling_state', 'args': [{'int': '8'}]}),
+                         MichelsonType.match({'prim': 'sapling_state', 'args': [{'int': '16'}]}))
+
+
+class TestCompactValues(TestCase):
+
+    @parameterized.expand([
+        ({'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'string'}, {'prim': 'bytes'}]}, (1, 'a', b'\x00')),
+        ({'prim': 'map', 'args': [{'prim': 'address'}, {'prim': 'option', 'args': [{'prim': 'mutez'}]}]},
+         {'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm': 1}),
+        ({'prim': 'or', 'args': [{'prim': 'set', 'args': [{'prim': 'int'}], 'annots': ['%a']}, {'prim': 'bool', 'annots': ['%b']}]},
+         {'a': [1, 2]}),
+        ({'prim': 'list', 'args': [{'prim': 'timestamp'}]}, [0]),
+    ])
+    def test_no_instance_dict(self, type_expr, py_obj):
+        def walk(value):
+            if not isinstance(value, MichelsonType):
+                return  # e.g. Undefined branch of `or`
+            self.assertFalse(hasattr(value, '__dict__'), type(value).__name__)
+            for attr in ['items', 'item']:
+                children = getattr(value, attr, None)
+                if isinstance(children, (list, tuple)):
+                    for child in children:
+                        for x in child if isinstance(child, tuple) else [child]:
+                            walk(x)
+                elif isinstance(children, MichelsonType):
+                    walk(children)
+
+        walk(MichelsonType.match(type_expr).from_python_object(py_obj))
+
+
+class TestTypeLayout(TestCase):
+
+    def setUp(self):
+        self.ty = MichelsonType.match({'prim': 'pair', 'args': [
+            {'prim': 'nat', 'annots': ['%a']},
+            {'prim': 'pair', 'args': [
+                {'prim': 'string', 'annots': ['%b']},
+                {'prim': 'or', 'args': [{'prim': 'int', 'annots': ['%c']}, {'prim': 'unit', 'annots': ['%d']}], 'annots': ['%e']},
+            ]},
+        ]})
+
+    def test_layout_cached(self):
+        self.assertIs(self.ty.get_type_layout(), self.ty.get_type_layout())
+        self.assertEqual({'a': '0', 'b': '10', 'e': '11'}, self.ty.get_type_layout()[1])
+
+    def test_get_value(self):
+        value = self.ty.from_python_object({'a': 1, 'b': 'x', 'e': {'c': 2}})
+        self.assertEqual('x', value['b'].to_python_object())
+        self.assertEqual('x', value[1].to_python_object())
+        self.assertEqual(2, value['e']['c'].to_python_object())
+        with self.assertRaisesRegex(AssertionError, 'not set'):
+            value['e']['d']
@@ -1,7 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 from pytezos.michelson.types import TimestampType
-from pytezos.michelson.parse import MichelsonParser
+from pytezos.michelson.parse import MichelsonParser, get_parser, michelson_to_micheline
 
 
 class TestParsing(TestCase):
@@ -17,3 +18,14 @@ class TestParsing(TestCase):
     def test_timestamp_with_millis(self):
         res = TimestampType.from_micheline_value({'string': '2021-01-06T14:57:27.821Z'})
         self.assertEqual(1609945047, int(res))
+
+    def test_shared_parser(self):
+        self.assertIs(get_parser(), get_parser())
+        self.assertEqual({'prim': 'Pair', 'args': [{'int': '1'}, {'int': '2'}]}, michelson_to_micheline('(Pair 1 2)'))
+
+    def test_parse_concurrently(self):
+        sources = [f'{{ PUSH nat {i} ; DROP }}' for i in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(michelson_to_micheline, sources))
+        for i, res in enumerate(results):
+            self.assertEqual(str(i), res[0]['args'][1]['int'])
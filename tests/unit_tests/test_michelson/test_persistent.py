@@ -0,0 +1,108 @@
+from random import Random
+from unittest import TestCase
+
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.persistent import PersistentSortedMap
+from pytezos.michelson.types import BigMapType, MapType, NatType, PairType, SetType, StringType, TicketType
+
+
+class TestPersistentSortedMap(TestCase):
+
+    def test_random_updates(self):
+        rnd = Random(42)
+        tree, expected = PersistentSortedMap(), {}
+        versions = []
+        for _ in range(2000):
+            key = rnd.randrange(300)
+            if rnd.random() < 0.3:
+                tree = tree.remove(key)
+                expected.pop(key, None)
+            else:
+                tree = tree.set(key, -key)
+                expected[key] = -key
+            versions.append((tree, dict(expected)))
+
+        for tree, expected in versions[::100]:
+            self.assertEqual(sorted(expected.items()), tree.items())
+            self.assertEqual(len(expected), len(tree))
+            for key in range(300):
+                self.assertEqual(expected.get(key), tree.get(key))
+
+    def test_from_unsorted_items(self):
+        tree = PersistentSortedMap.from_items([(3, 'c'), (1, 'a'), (2, 'b'), (1, 'x')])
+        self.assertEqual([(1, 'x'), (2, 'b'), (3, 'c')], tree.items())
+        self.assertEqual(3, len(tree))
+        self.assertNotIn(4, tree)
+
+    def test_remove_missing(self):
+        tree = PersistentSortedMap.from_items([(1, 'a')])
+        self.assertIs(tree, tree.remove(2))
+
+
+class TestSortedContainers(TestCase):
+
+    def test_map_update(self):
+        ty = MapType.create_type(args=[StringType, NatType])
+        src = ty.from_python_object({'b': 2, 'a': 1})
+        prev, res = src.update(StringType.from_value('c'), NatType.from_value(3))
+        self.assertIsNone(prev)
+        self.assertEqual({'a': 1, 'b': 2}, src.to_python_object())
+        self.assertEqual({'a': 1, 'b': 2, 'c': 3}, res.to_python_object())
+        prev, res = res.update(StringType.from_value('a'), None)
+        self.assertEqual(1, int(prev))
+        self.assertEqual(['b', 'c'], [str(k) for k, _ in res.items])
+
+    def test_map_check_constraints(self):
+        ty = MapType.create_type(args=[NatType, NatType])
+        elt = lambda k: {'prim': 'Elt', 'args': [{'int': str(k)}, {'int': '0'}]}  # noqa: E731
+        with self.assertRaisesRegex(MichelsonRuntimeError, 'unsorted'):
+            ty.from_micheline_value([elt(2), elt(1)])
+        with self.assertRaisesRegex(MichelsonRuntimeError, 'duplicate'):
+            ty.from_micheline_value([elt(1), elt(1)])
+
+    def test_set_add_remove(self):
+        ty = SetType.create_type(args=[NatType])
+        src = ty.from_python_object([3, 1])
+        res = src.add(NatType.from_value(2))
+        self.assertEqual([1, 3], src.to_python_object())
+        self.assertEqual([1, 2, 3], res.to_python_object())
+        self.assertTrue(res.contains(NatType.from_value(2)))
+        self.assertEqual([1, 3], res.remove(NatType.from_value(2)).to_python_object())
+
+    def test_pair_keys_order(self):
+        ty = MapType.create_type(args=[PairType.create_type(args=[NatType, NatType]), NatType])
+        src = ty.from_python_object({(1, 5): 0, (2, 3): 1, (1, 2): 2})
+        self.assertEqual([(1, 2), (1, 5), (2, 3)], [k.to_python_object() for k, _ in src.items])
+        self.assertEqual(1, int(src.get(PairType.from_comb([NatType.from_value(2), NatType.from_value(3)]))))
+
+    def test_big_map_removed_keys(self):
+        ty = BigMapType.create_type(args=[NatType, NatType])
+        src = ty.from_python_object({1: 10, 2: 20})
+        _, res = src.update(NatType.from_value(1), None)
+        self.assertIsNone(res.get(NatType.from_value(1), dup=False))
+        self.assertEqual({1: None, 2: 20}, res.to_python_object(lazy_diff=True))
+        _, res = res.update(NatType.from_value(1), NatType.from_value(11))
+        self.assertEqual({1: 11, 2: 20}, res.to_python_object(lazy_diff=True))
+        self.assertEqual(2, len(res))
+
+
+class TestDuplicate(TestCase):
+
+    def test_shared(self):
+        ty = MapType.create_type(args=[NatType, NatType])
+        src = ty.from_python_object({i: i for i in range(100)})
+        self.assertIs(src, src.duplicate())
+        _, res = src.update(NatType.from_value(0), None)
+        self.assertEqual(100, len(src))
+        self.assertEqual(99, len(res))
+
+    def test_big_map(self):
+        src = BigMapType.create_type(args=[NatType, NatType]).from_python_object({1: 1})
+        dup = src.duplicate()
+        self.assertIsNot(src, dup)
+        self.assertEqual(src.items, dup.items)
+
+    def test_ticket(self):
+        ticket = TicketType.create('KT1V4jijVy1HfVWde6HBVD1cCygZDtFJK4Xz', NatType.from_value(1), 10)
+        with self.assertRaisesRegex(MichelsonRuntimeError, 'not duplicable'):
+            ticket.duplicate()
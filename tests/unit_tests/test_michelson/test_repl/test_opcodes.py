@@ -1,4 +1,6 @@
+from functools import partial
 from unittest import TestCase
+from unittest.mock import patch
 from os.path import dirname, join
 from parameterized import parameterized
 
@@ -1564,3 +1566,56 @@ class OpcodesTestCase(TestCase):
             script=michelson_to_micheline(script)
         )
         self.assertIsNotNone(error)
+
+    @parameterized.expand([
+        ('map_map.tz', '{ Elt "bar" 2 ; Elt "foo" 1 }', '10', '{ Elt "bar" 12 ; Elt "foo" 11 }'),
+        ('dig_eq.tz', 'Unit', '(Pair 17 16 15 14 13 12 11 10 9 8 7 6 5 4 3 2 1)', 'Unit'),
+        ('dipn.tz', '0', '(Pair (Pair (Pair (Pair 1 2) 3) 4) 5)', '6'),
+    ])
+    def test_opcodes_without_trace(self, filename, storage, parameter, result):
+        with open(join(dirname(__file__), 'opcodes', filename)) as f:
+            script = f.read()
+
+        _, storage, _, stdout, error = Interpreter.run_code(
+            parameter=michelson_to_micheline(parameter),
+            storage=michelson_to_micheline(storage),
+            script=michelson_to_micheline(script),
+            trace=False,
+        )
+        self.assertIsNone(error)
+        self.assertEqual([], stdout)
+        self.assertEqual(michelson_to_micheline(result), storage)
+
+    def test_failed_opcode_without_trace(self):
+        with open(join(dirname(__file__), 'opcodes', 'check_signature.tz')) as f:
+            script = f.read()
+
+        _, _, _, stdout, error = Interpreter.run_code(
+            parameter=michelson_to_micheline('"edpkuBknW28nW72KG6RoHtYW7p12T6GKc7nAbwYX5m8Wd9sDVC9yav"'),
+            storage=michelson_to_micheline(f'(Pair "{SIGNATURE}" "abcd")'),
+            script=michelson_to_micheline(script),
+            trace=False,
+        )
+        self.assertIsNotNone(error)
+        self.assertEqual(1, len(stdout))
+
+    def test_error_path(self):
+        script = michelson_to_micheline("""
+            parameter nat; storage unit;
+            code { CAR ; DIP { PUSH bool True ; IF { PUSH (list int) { 1 } ; ITER { PUSH string "a" ; ADD } } {} } ; DROP ; UNIT ; NIL operation ; PAIR }
+        """)
+        errors = [
+            Interpreter.run_code(parameter={'int': '1'}, storage={'prim': 'Unit'}, script=script, trace=trace)[-1]
+            for trace in [True, False]
+        ]
+        self.assertEqual(('DIP', 'IF', 'ITER', 'ADD'), errors[0].args[:4])
+        self.assertEqual(errors[0].args, errors[1].args)
+
+
+class CompiledOpcodesTestCase(OpcodesTestCase):
+    """Run the whole corpus through compiled code (i.e. with tracing disabled)"""
+
+    def setUp(self):
+        patcher = patch.object(Interpreter, 'run_code', partial(Interpreter.run_code, trace=False))
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import NatType
+
+
+def nats(*values):
+    return [NatType(x) for x in values]
+
+
+class TestMichelsonStack(TestCase):
+
+    def test_items_order(self):
+        stack = MichelsonStack.from_items(nats(1, 2))
+        stack.push(NatType(0))
+        self.assertEqual(nats(0, 1, 2), stack.items)
+        self.assertEqual(nats(0, 1), stack.dump(2))
+        self.assertEqual(NatType(0), stack.peek())
+
+    def test_protect_restore(self):
+        stack = MichelsonStack.from_items(nats(0, 1, 2, 3, 4))
+        stack.protect(2)
+        stack.protect(1)
+        self.assertEqual(NatType(3), stack.pop1())
+        stack.push(NatType(7))
+        self.assertEqual(nats(0, 1, 2, 7, 4), stack.items)
+        self.assertEqual(5, len(stack))
+        stack.restore(2)
+        self.assertEqual(1, stack.protected)
+        self.assertEqual(nats(1, 2), stack.pop(2))
+        stack.restore(1)
+        self.assertEqual(nats(0, 7, 4), stack.items)
+
+    def test_pop_protected(self):
+        stack = MichelsonStack.from_items(nats(0, 1))
+        stack.protect(1)
+        stack.pop1()
+        with self.assertRaises(Exception):
+            stack.pop1()
+        with self.assertRaises(Exception):
+            stack.restore(2)
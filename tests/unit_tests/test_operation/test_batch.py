@@ -0,0 +1,113 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from pytezos.context.counter import CounterManager
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.batch import BatchSender
+from pytezos.operation.content import ContentMixin
+from pytezos.operation.fees import DEFAULT_CONSTANTS
+
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+DESTINATION = 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'
+
+
+class TestBatchSender(TestCase):
+
+    def setUp(self) -> None:
+        self.shell = MagicMock()
+        self.shell.head.header.return_value = {'hash': BRANCH, 'level': 100, 'proto': 1, 'predecessor': BRANCH}
+        self.shell.blocks.return_value = [[BRANCH] * 61]
+        self.shell.blocks.__getitem__.return_value.context.constants.return_value = DEFAULT_CONSTANTS
+        self.shell.mempool.pending_operations.by_source.return_value = []
+        self.shell.blocks.__getitem__.return_value.helpers.scripts.run_operation.post.side_effect = self.run_operation
+        self.shell.injection.operation.post.side_effect = self.inject
+        self.shell.wait_operations.side_effect = self.wait_operations
+
+        self.context = ExecutionContext(
+            shell=self.shell,
+            key=Key.generate(export=False),
+            chain_id='NetXxkAx4woPLyu',
+            protocol='PsFLorenaUUuikDWvMDr6fGBRG8kt3e3D3fHoXK1j1BFRxeSH4i',
+        )
+        self.context._sandboxed = False
+        self.simulated = []
+        self.injected = []
+        self.failing_amounts = set()
+
+    def run_operation(self, payload):
+        contents = payload['operation']['contents']
+        self.simulated.append(contents)
+        status = 'failed' if any(c['amount'] in self.failing_amounts for c in contents) else 'applied'
+        return {
+            'contents': [
+                {**content, 'metadata': {'operation_result': {'status': status, 'consumed_gas': '1427'}}}
+                for content in contents
+            ]
+        }
+
+    def inject(self, operation, _async):
+        self.injected.append(operation)
+        return f'oo{len(self.injected)}'
+
+    def wait_operations(self, opg_hashes, ttl, min_confirmations):
+        return [{'hash': opg_hash, 'contents': []} for opg_hash in opg_hashes]
+
+    def make_contents(self, count):
+        return [ContentMixin().transaction(destination=DESTINATION, amount=i + 1) for i in range(count)]
+
+    def test_split(self):
+        sender = BatchSender(self.context, max_contents=2)
+        self.assertEqual([2, 2, 1], [len(group) for group in sender.split(self.make_contents(5))])
+
+        sender = BatchSender(self.context, max_size=32 + 64 + 200)
+        groups = sender.split(self.make_contents(5))
+        self.assertGreater(len(groups), 1)
+        self.assertEqual(5, sum(map(len, groups)))
+
+    def test_send(self):
+        self.shell.contracts.__getitem__.return_value.side_effect = [{'counter': '10'}, {'counter': '10'}, {'counter': '14'}]
+        sender = BatchSender(self.context, max_contents=2, max_pending=2)
+        results = sender.send(self.make_contents(5))
+
+        self.assertEqual(['applied', 'applied', 'injected'], [result.status for result in results])
+        self.assertEqual(['oo1', 'oo2', 'oo3'], [result.opg_hash for result in results])
+        self.assertEqual(3, len(self.injected))
+        self.assertEqual(1, self.shell.wait_operations.call_count)
+        # every group is simulated as the next one
+        self.assertEqual([['11', '12'], ['11', '12'], ['15']], [[c['counter'] for c in contents] for contents in self.simulated])
+
+    def test_partial_inclusion(self):
+        self.shell.contracts.__getitem__.return_value.return_value = {'counter': '10'}
+        self.shell.wait_operations.side_effect = RuntimeError('generator raised StopIteration')
+        self.shell.blocks.__getitem__.return_value.operation_hashes.return_value = [[], [], [], ['oo2']]
+        self.shell.blocks.__getitem__.return_value.operations.__getitem__.return_value.__getitem__.return_value.return_value = {
+            'hash': 'oo2', 'contents': [],
+        }
+        sender = BatchSender(self.context, max_contents=2, max_pending=2)
+        results = sender.send(self.make_contents(4), min_confirmations=1)
+
+        self.assertEqual(['failed', 'applied'], [result.status for result in results])
+        self.assertIsInstance(results[0].error, RuntimeError)
+
+    def test_simulation_failure(self):
+        self.shell.contracts.__getitem__.return_value.return_value = {'counter': '10'}
+        self.failing_amounts = {'3'}
+        sender = BatchSender(self.context, max_contents=2, max_pending=3)
+        results = sender.send(self.make_contents(6))
+
+        self.assertEqual(['injected', 'failed', 'injected'], [result.status for result in results])
+        self.assertIsNotNone(results[1].error)
+        self.assertEqual(2, len(self.injected))
+        self.assertEqual(0, self.shell.wait_operations.call_count)
+
+    def test_injection_error(self):
+        self.shell.contracts.__getitem__.return_value.return_value = {'counter': '10'}
+        self.shell.injection.operation.post.side_effect = [ConnectionError('Connection reset by peer'), 'oo1']
+        sender = BatchSender(self.context, max_contents=2, max_pending=2)
+        with patch.object(CounterManager, 'confirm', autospec=True) as confirm:
+            results = sender.send(self.make_contents(4))
+
+        self.assertEqual(['failed', 'injected'], [result.status for result in results])
+        self.assertIsInstance(results[0].error, ConnectionError)
+        self.assertEqual([11], [call[0][1] for call in confirm.call_args_list])  # counter of the failed group is reused
@@ -0,0 +1,112 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.content import ContentMixin
+from pytezos.operation.estimator import HistoryEstimator
+from pytezos.operation.group import OperationGroup
+from pytezos.rpc.errors import RpcError
+
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+CONTRACT = 'KT1VG2WtYdSWz5E7chTeAdDPZNy2MpP8pTfL'
+
+
+def make_transaction(value, entrypoint='mint', destination=CONTRACT):
+    return ContentMixin().transaction(
+        destination=destination,
+        amount=0,
+        parameters={'entrypoint': entrypoint, 'value': value},
+    )
+
+
+def with_result(content, consumed_gas, paid_storage_size_diff=0, status='applied'):
+    operation_result = {'status': status, 'consumed_gas': str(consumed_gas), 'paid_storage_size_diff': str(paid_storage_size_diff)}
+    return {**content, 'metadata': {'operation_result': operation_result}}
+
+
+class TestHistoryEstimator(TestCase):
+
+    def test_estimate(self):
+        estimator = HistoryEstimator(margin=0.1, min_samples=2)
+        content = make_transaction({'int': '1'})
+        self.assertIsNone(estimator.estimate(content))
+
+        estimator.learn(with_result(content, 1000, 60))
+        self.assertIsNone(estimator.estimate(content))
+
+        estimator.learn(with_result(make_transaction({'int': '2'}), 1200, 50))
+        estimator.learn(with_result(make_transaction({'int': '3'}), 5000, status='failed'))
+        self.assertEqual((1320, 66), estimator.estimate(content))
+
+    def test_key(self):
+        estimator = HistoryEstimator(min_samples=1)
+        estimator.learn(with_result(make_transaction({'int': '1'}), 1000))
+        self.assertIsNotNone(estimator.estimate(make_transaction({'int': '7'})))
+        self.assertIsNone(estimator.estimate(make_transaction({'int': '7'}, entrypoint='burn')))
+        self.assertIsNone(estimator.estimate(make_transaction({'int': '7'}, destination='KT1Mjjcb6tmSsLm7Cb3DSQszePjfchPM4Uxm')))
+        self.assertIsNone(estimator.estimate(make_transaction({'string': 'x' * 100})))
+        self.assertIsNone(estimator.estimate({'kind': 'reveal'}))
+
+        estimator.forget(make_transaction({'int': '7'}))
+        self.assertIsNone(estimator.estimate(make_transaction({'int': '7'})))
+
+    def test_history_size(self):
+        estimator = HistoryEstimator(margin=0, min_samples=1, history_size=2)
+        for gas in [3000, 1000, 1000]:
+            estimator.learn(with_result(make_transaction({'int': '1'}), gas))
+        self.assertEqual((1000, 0), estimator.estimate(make_transaction({'int': '1'})))
+
+    def test_simulate_every(self):
+        estimator = HistoryEstimator(min_samples=1, simulate_every=3)
+        estimator.learn(with_result(make_transaction({'int': '1'}), 1000))
+        estimates = [estimator.estimate(make_transaction({'int': '1'})) for _ in range(6)]
+        self.assertEqual([False, False, True] * 2, [x is None for x in estimates])
+
+
+class TestSimulate(TestCase):
+
+    def setUp(self) -> None:
+        self.shell = MagicMock()
+        self.run_operation = self.shell.blocks.__getitem__.return_value.helpers.scripts.run_operation.post
+        self.run_operation.side_effect = lambda payload: {
+            'contents': [with_result(content, 1000, 60) for content in payload['operation']['contents']]
+        }
+        self.context = ExecutionContext(shell=self.shell, key=Key.generate(export=False))
+
+    def make_opg(self, *contents):
+        source = self.context.key.public_key_hash()
+        contents = [{**content, 'source': source, 'counter': str(i + 1)} for i, content in enumerate(contents)]
+        return OperationGroup(context=self.context, contents=contents, branch=BRANCH, chain_id='NetXxkAx4woPLyu')
+
+    def test_simulate(self):
+        estimator = HistoryEstimator(margin=0.5, min_samples=2)
+        opg = self.make_opg(make_transaction({'int': '1'}), make_transaction({'int': '2'}))
+        opg.simulate(estimator)
+        self.assertEqual(1, self.run_operation.call_count)
+
+        res = opg.simulate(estimator)
+        self.assertEqual(1, self.run_operation.call_count)
+        filled = opg.fill_limits(res, gas_reserve=0, burn_reserve=0)
+        self.assertEqual(['1500', '1500'], [content['gas_limit'] for content in filled.contents])
+        self.assertEqual(['90', '90'], [content['storage_limit'] for content in filled.contents])
+
+        # unknown content -> whole group is simulated
+        unknown = make_transaction({'int': '1'}, destination='KT1V4jijVy1HfVWde6HBVD1cCygZDtFJK4Xz')
+        self.make_opg(make_transaction({'int': '1'}), unknown).simulate(estimator)
+        self.assertEqual(2, self.run_operation.call_count)
+
+    def test_no_fallback(self):
+        estimator = HistoryEstimator(fallback=False)
+        with self.assertRaises(ValueError):
+            self.make_opg(make_transaction({'int': '1'})).simulate(estimator)
+        self.assertEqual(0, self.run_operation.call_count)
+
+    def test_failed_simulation(self):
+        self.run_operation.side_effect = lambda payload: {
+            'contents': [with_result(content, 1000, status='failed') for content in payload['operation']['contents']]
+        }
+        estimator = HistoryEstimator(min_samples=1)
+        with self.assertRaises(RpcError):
+            self.make_opg(make_transaction({'int': '1'})).simulate(estimator)
+        self.assertIsNone(estimator.estimate(make_transaction({'int': '1'})))
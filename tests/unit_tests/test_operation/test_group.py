@@ -1,9 +1,15 @@
 from contextlib import suppress
 from pytezos.operation.fees import DEFAULT_CONSTANTS
 from pytezos.client import PyTezosClient
+from pytezos.context.impl import ExecutionContext
+from pytezos.crypto.key import Key
+from pytezos.operation.group import OperationGroup
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
+BRANCH = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+DESTINATION = 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'
+
 
 class TestOperationGroup(TestCase):
     maxDiff = None
@@ -34,3 +40,61 @@ class TestOperationGroup(TestCase):
 
                 # Assert
                 rpc_mock.assert_called_with(mock_call)
+
+    def test_inject_without_key(self):
+        shell = MagicMock()
+        shell.injection.operation.post.return_value = 'oo'
+        content = {
+            'kind': 'transaction', 'source': 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm', 'counter': '11', 'fee': '0', 'gas_limit': '0',
+            'storage_limit': '0', 'amount': '1', 'destination': 'tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm',
+        }
+        op = OperationGroup(
+            context=ExecutionContext(shell=shell),
+            contents=[content],
+            branch='BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2',
+            signature=Key.generate(export=False).sign(b'external', generic=True),
+        )
+        self.assertEqual('oo', op.inject()['hash'])
+
+    def make_shell(self, key, pending=0):
+        shell = MagicMock()
+        shell.node.uri = f'http://{self.id()}'
+        shell.head.header.return_value = {'hash': BRANCH, 'level': 100, 'proto': 1, 'predecessor': BRANCH}
+        shell.blocks.return_value = [[BRANCH] * 61]
+        shell.blocks.__getitem__.return_value.context.constants.return_value = DEFAULT_CONSTANTS
+        shell.contracts.__getitem__.return_value.return_value = {'counter': '10'}
+        shell.mempool.pending_operations.by_source.return_value = [
+            {'hash': f'oo{i}', 'contents': [{'source': key.public_key_hash(), 'counter': str(11 + i)}]} for i in range(pending)
+        ]
+        shell.blocks.__getitem__.return_value.helpers.scripts.run_operation.post.side_effect = lambda payload: {
+            'contents': [
+                {**content, 'metadata': {'operation_result': {'status': 'applied', 'consumed_gas': '1427'}}}
+                for content in payload['operation']['contents']
+            ]
+        }
+        return shell
+
+    def make_group(self, shell, key):
+        context = ExecutionContext(
+            shell=shell,
+            key=key,
+            chain_id='NetXxkAx4woPLyu',
+            protocol='PsFLorenaUUuikDWvMDr6fGBRG8kt3e3D3fHoXK1j1BFRxeSH4i',
+        )
+        context._sandboxed = False
+        return OperationGroup(context=context).transaction(destination=DESTINATION, amount=1)
+
+    def test_autofill_stateless(self):
+        key = Key.generate(export=False)
+        shell = self.make_shell(key, pending=1)
+        preview = self.make_group(shell, key).autofill()
+        opg = self.make_group(shell, key).autofill()  # e.g. previewed, then sent as a fresh group
+        self.assertEqual(['12', '12'], [preview.contents[0]['counter'], opg.contents[0]['counter']])
+
+    def test_autofill_reserve_counter(self):
+        key = Key.generate(export=False)
+        shell = self.make_shell(key)
+        first = self.make_group(shell, key).autofill(reserve_counter=True)
+        second = self.make_group(shell, key).autofill(reserve_counter=True)
+        self.assertEqual(['11', '12'], [first.contents[0]['counter'], second.contents[0]['counter']])
+        self.assertEqual('11', first.autofill(reserve_counter=True).contents[0]['counter'])  # re-filling keeps the reservation
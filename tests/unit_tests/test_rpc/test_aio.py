@@ -0,0 +1,157 @@
+import asyncio
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest import TestCase, skipIf
+
+from pytezos.crypto.encoding import base58_encode
+from pytezos.rpc.aio import AsyncBlockQuery, AsyncOperationByHashQuery, AsyncRpcNode, AsyncRpcQuery, AsyncShellQuery, aiohttp
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.protocol import ContractQuery
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+opg_hash = 'oop1fbAVi2ZwEt3vpu4uKpYGbbxumyMBSWwWf9qbByeM4JYAu92'
+chain = [base58_encode(bytes([level]) * 32, b'B').decode() for level in range(5)]  # block hashes by level
+
+responses = {
+    '/chains/main/blocks/123/header': {'level': 123, 'hash': block_hash, 'predecessor': block_hash},
+    f'/chains/main/blocks/{block_hash}/header': {'level': 122, 'hash': block_hash},
+    '/chains/main/blocks/123/operation_hashes': [[], [], [], ['oo1', opg_hash]],
+    '/chains/main/blocks/123/operations/3/1': {'hash': opg_hash, 'branch': block_hash, 'contents': []},
+    '/chains/main/blocks/head~2/header': {'level': 42},
+    '/chains/main/blocks/head/context/contracts/tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm/counter': '5',
+    '/chains/main/blocks/head/header': {'level': 130, 'hash': block_hash},
+    '/chains/main/blocks/head/metadata': {
+        'level_info': {'level': 130, 'cycle': 3, 'cycle_position': 9, 'voting_period': 1, 'voting_period_position': 9},
+    },
+    '/chains/main/blocks': [[chain[4], chain[3], chain[2]]],
+    f'/chains/main/blocks/{chain[1]}/header': {'level': 1, 'hash': chain[1]},
+    f'/chains/main/blocks/{chain[1]}/operation_hashes': [[], [], [], []],
+    f'/chains/main/blocks/{chain[2]}/operation_hashes': [[], [], [], []],
+    f'/chains/main/blocks/{chain[3]}/operation_hashes': [[], [], [], [opg_hash]],
+    f'/chains/main/blocks/{chain[3]}/operations/3/0': {'hash': opg_hash, 'branch': block_hash, 'contents': []},
+    '/chains/main/mempool/pending_operations': {'applied': [], 'refused': []},
+}
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == '/monitor/heads/main':
+            self.send_response(200)
+            self.send_header('content-type', 'application/json')
+            self.send_header('transfer-encoding', 'chunked')
+            self.end_headers()
+            for level in [1, 2, 4]:
+                chunk = json.dumps({'level': level, 'hash': chain[level], 'predecessor': chain[level - 1]}).encode() + b'\n'
+                self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+            self.wfile.write(b'0\r\n\r\n')
+            return
+        if path in responses:
+            body, status = json.dumps(responses[path]).encode(), 200
+        else:
+            body, status = b'not found', 404
+        self.send_response(status)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@skipIf(aiohttp is None, 'aiohttp is not installed')
+class TestAsyncShellQuery(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockNodeHandler)
+        cls.uri = f'http://127.0.0.1:{cls.server.server_port}'
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def run_async(self, fn):
+        async def wrapper():
+            async with AsyncRpcNode(self.uri, max_concurrency=4) as node:
+                return await fn(AsyncShellQuery(node))
+
+        return asyncio.run(wrapper())
+
+    def test_navigation(self):
+        async def fn(shell):
+            block = shell.blocks[123]
+            self.assertIsInstance(block, AsyncBlockQuery)
+            self.assertIsInstance(shell.head.context.contracts['tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'], ContractQuery)
+            self.assertIsInstance(shell.head.context.contracts['tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'], AsyncRpcQuery)
+            self.assertEqual(123, await block.level())
+            self.assertEqual(42, await shell.blocks[-2].level())
+            predecessor = await block.predecessor
+            self.assertEqual(122, await predecessor.level())
+            counter = await shell.head.context.contracts['tz1grSQDByRpnVs7sPtaprNZRp531ZKz6Jmm'].count()
+            self.assertEqual(6, next(counter))
+
+        self.run_async(fn)
+
+    def test_operation_by_hash(self):
+        async def fn(shell):
+            query = shell.blocks[123].operations[opg_hash]
+            self.assertIsInstance(query, AsyncOperationByHashQuery)
+            self.assertEqual(opg_hash, (await query())['hash'])
+            self.assertEqual({'branch': block_hash, 'contents': []}, await shell.blocks[123].operations[3][1].unsigned())
+
+        self.run_async(fn)
+
+    def test_concurrent_requests(self):
+        async def fn(shell):
+            return await asyncio.gather(*[shell.blocks[123].header() for _ in range(20)])
+
+        self.assertEqual([123] * 20, [x['level'] for x in self.run_async(fn)])
+
+    def test_not_found(self):
+        async def fn(shell):
+            with self.assertRaises(RpcError):
+                await shell.blocks[124].header()
+
+        self.run_async(fn)
+
+    def test_monitor(self):
+        async def fn(shell):
+            return [head async for head in shell.monitor.heads.main()]
+
+        self.assertEqual([1, 2, 4], [x['level'] for x in self.run_async(fn)])
+
+    def test_wait_blocks(self):
+        async def fn(shell):
+            return [block async for block in shell.wait_blocks(chain[1], max_blocks=3, time_between_blocks=1, stream=True)]
+
+        self.assertEqual(chain[2:], self.run_async(fn))  # level 3 is skipped by the stream
+
+    def test_wait_operations(self):
+        async def fn(shell):
+            return await shell.wait_operations([opg_hash], ttl=5, min_confirmations=1, current_block_hash=chain[1],
+                                               time_between_blocks=1, stream=True)
+
+        self.assertEqual([opg_hash], [x['hash'] for x in self.run_async(fn)])
+
+    def test_block_range(self):
+        async def fn(shell):
+            self.assertEqual((121, 123), await shell.blocks[121:123].get_range())
+            self.assertEqual([123], [x['level'] async for x in shell.blocks[123:123].iter(fields=['operation_hashes'])])
+            self.assertEqual(opg_hash, (await shell.blocks[123:123].find_operation(opg_hash))['hash'])
+            self.assertEqual(123, await (await shell.blocks[121:123][-1]).level())
+
+        self.run_async(fn)
+
+    def test_periods(self):
+        async def fn(shell):
+            self.assertEqual(3, await shell.cycles())
+            self.assertEqual((1, 40), await (await shell.cycles[1]).get_range())
+            self.assertEqual((121, 130), await (await shell.blocks.current_cycle).get_range())
+
+        self.run_async(fn)
@@ -0,0 +1,155 @@
+import json
+from os.path import join
+from tempfile import TemporaryDirectory
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socket import socket
+from threading import Thread
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pytezos.rpc.cache import RpcCache
+from pytezos.rpc.node import RpcError, RpcMultiNode, RpcNode
+from pytezos.rpc.shell import ShellQuery
+
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+responses = {
+    '/chains/main/blocks/head/header': {'level': 42, 'hash': block_hash},
+    '/chains/main/blocks/head/header/shell': {'level': 100},
+    f'/chains/main/blocks/{block_hash}/header': {'level': 0, 'hash': block_hash},
+    '/chains/main/blocks/10/header': {'level': 10},
+    '/chains/main/blocks/90/header': {'level': 90},
+}
+
+
+class MockNodeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests_count = 0
+
+    def do_GET(self):
+        MockNodeHandler.requests_count += 1
+        path = self.path.split('?')[0]
+        if path in responses:
+            body, status = json.dumps(responses[path]).encode(), 200
+        else:
+            body, status = b'not found', 404
+        self.send_response(status)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRpcNode(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), MockNodeHandler)
+        cls.uri = f'http://127.0.0.1:{cls.server.server_port}'
+        Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_keep_alive(self):
+        node = RpcNode(self.uri)
+        shell = ShellQuery(node)
+        for _ in range(5):
+            self.assertEqual(42, shell.head.header()['level'])
+        self.assertEqual(dict(hits=4, misses=1), node.pool_stats)
+
+    def test_no_keep_alive(self):
+        node = RpcNode(self.uri, keep_alive=False)
+        for _ in range(3):
+            node.get('chains/main/blocks/head/header')
+        self.assertEqual(0, node.pool_stats['hits'])
+        self.assertEqual(3, node.pool_stats['misses'])
+
+    def test_not_found(self):
+        node = RpcNode(self.uri)
+        with self.assertRaises(RpcError):
+            node.get('chains/main/blocks/head/unknown')
+
+    def test_multi_node_shared_session(self):
+        node = RpcMultiNode([self.uri, self.uri])
+        for _ in range(4):
+            node.get('chains/main/blocks/head/header')
+        self.assertTrue(all(n.session is node.session for n in node.nodes))
+        self.assertEqual(dict(hits=3, misses=1), node.pool_stats)
+
+    def test_debug_logging(self):
+        node = RpcNode(self.uri)
+        with self.assertLogs('pytezos', level='DEBUG') as logs:
+            node.get('chains/main/blocks/head/header')
+        self.assertEqual(2, len(logs.output))
+        self.assertIn('"level": 42', logs.output[1])
+
+    def test_cache(self):
+        cache = RpcCache(finality_depth=60)
+        shell = ShellQuery(RpcNode(self.uri, cache=cache))
+
+        def count_requests(fn):
+            before = MockNodeHandler.requests_count
+            fn()
+            return MockNodeHandler.requests_count - before
+
+        self.assertEqual(1, count_requests(lambda: shell.blocks[block_hash].header()))
+        self.assertEqual(0, count_requests(lambda: shell.blocks[block_hash].header()))
+        self.assertEqual(1, count_requests(lambda: shell.head.header()))
+        self.assertEqual(1, count_requests(lambda: shell.head.header()))
+        self.assertEqual(2, count_requests(lambda: shell.blocks[10].header()))  # head level + block
+        self.assertEqual(0, count_requests(lambda: shell.blocks[10].header()))
+        self.assertEqual(1, count_requests(lambda: shell.blocks[90].header()))  # not final yet
+        self.assertEqual(1, count_requests(lambda: shell.blocks[90].header()))
+        self.assertEqual(dict(hits=2, disk_hits=0, misses=2, hit_rate=0.5, size=2), cache.stats)
+
+    def test_disk_cache(self):
+        with TemporaryDirectory() as tmp_dir:
+            path = join(tmp_dir, 'cache.db')
+            RpcNode(self.uri, cache=RpcCache(path=path)).get(f'chains/main/blocks/{block_hash}/header')
+            cache = RpcCache(path=path)
+            data = RpcNode(self.uri, cache=cache).get(f'chains/main/blocks/{block_hash}/header')
+            self.assertEqual(block_hash, data['hash'])
+            self.assertEqual(1, cache.stats['disk_hits'])
+            cache.disk.close()
+
+    def test_multi_node_failover(self):
+        with socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            dead_uri = f'http://127.0.0.1:{sock.getsockname()[1]}'
+
+        node = RpcMultiNode([dead_uri, self.uri], max_failures=1, eject_timeout=60)
+        for _ in range(4):
+            self.assertEqual(42, node.get('chains/main/blocks/head/header')['level'])
+
+        stats = node.node_stats
+        self.assertTrue(stats[0]['ejected'])
+        self.assertEqual(1, stats[0]['failures'])
+        self.assertFalse(stats[1]['ejected'])
+        self.assertEqual(0, stats[1]['outstanding'])
+
+        with self.assertRaises(RpcError):
+            node.post('chains/main/blocks/head/header')
+
+    def test_multi_node_lag(self):
+        node = RpcMultiNode([self.uri, self.uri], max_lag=2)
+        node.health[0].node.request = Mock(return_value=Mock(json=Mock(return_value={'level': 90})))
+        node.check_lag()
+        self.assertTrue(node.health[0].lagging)
+        self.assertFalse(node.health[1].lagging)
+        for _ in range(3):
+            node.get('chains/main/blocks/head/header')
+        node.health[0].node.request.assert_called_once()
+
+    def test_multi_node_strategy(self):
+        node = RpcMultiNode([self.uri, self.uri], strategy='latency')
+        node.health[0].latency = 10.0
+        for _ in range(3):
+            node.get('chains/main/blocks/head/header')
+        self.assertEqual(10.0, node.health[0].latency)
+        with self.assertRaises(ValueError):
+            RpcMultiNode([self.uri], strategy='random')
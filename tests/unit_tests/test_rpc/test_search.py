@@ -0,0 +1,61 @@
+from threading import Lock
+from time import sleep
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pytezos.rpc.search import prefetch
+from pytezos.rpc.shell import ShellQuery
+
+opg_hash = 'oop1fbAVi2ZwEt3vpu4uKpYGbbxumyMBSWwWf9qbByeM4JYAu92'
+
+
+def mock_get(path, params=None, timeout=None):
+    chunks = path.strip('/').split('/')
+    if chunks[-1] == 'header':
+        return {'level': 100 if chunks[3] == 'head' else int(chunks[3]), 'hash': 'head'}
+    level = int(chunks[3])
+    if chunks[-1] == 'operation_hashes':
+        return [[], [], [], [opg_hash] if level == 17 else []]
+    if path.endswith('operations/3/0'):
+        return {'hash': opg_hash, 'level': level}
+    return {'level': level, 'path': path}
+
+
+class TestBlockSliceQuery(TestCase):
+    def setUp(self):
+        self.node = Mock(get=Mock(side_effect=mock_get))
+        self.shell = ShellQuery(self.node)
+
+    def test_iter(self):
+        blocks = list(self.shell.blocks[10:20].iter(fields=['header', 'operations'], concurrency=4))
+        self.assertEqual(list(range(10, 21)), [block['level'] for block in blocks])
+        self.assertEqual(10, blocks[0]['header']['level'])
+        self.assertEqual('/chains/main/blocks/20/operations', blocks[-1]['operations']['path'])
+
+    def test_iter_whole_blocks_reversed(self):
+        blocks = list(self.shell.blocks[10:12].iter(reverse=True))
+        self.assertEqual([12, 11, 10], [block['level'] for block in blocks])
+
+    def test_find_operation(self):
+        operation = self.shell.blocks[10:20].find_operation(opg_hash, concurrency=4)
+        self.assertEqual(17, operation['level'])
+        with self.assertRaises(StopIteration):
+            self.shell.blocks[18:20].find_operation(opg_hash)
+
+
+class TestPrefetch(TestCase):
+    def test_bounded_concurrency(self):
+        lock, in_flight, max_in_flight = Lock(), [0], [0]
+
+        def fn(x):
+            with lock:
+                in_flight[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+            sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return x * 2
+
+        self.assertEqual([x * 2 for x in range(20)], list(prefetch(fn, range(20), concurrency=3)))
+        self.assertLessEqual(max_in_flight[0], 3)
+        self.assertGreater(max_in_flight[0], 1)
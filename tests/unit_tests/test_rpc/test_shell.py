@@ -0,0 +1,88 @@
+import json
+from queue import Queue
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pytezos.crypto.encoding import base58_encode
+from pytezos.rpc.shell import HeadMonitor, ShellQuery
+
+chain = [base58_encode(bytes([level]) * 32, b'B').decode() for level in range(14)]  # block hashes by level
+fork = [base58_encode(bytes([level, 1]) * 16, b'B').decode() for level in range(14)]
+
+
+def make_head(level, hash_, predecessor):
+    return {'hash': hash_, 'level': level, 'predecessor': predecessor}
+
+
+class MockStream:
+    def __init__(self, heads: Queue):
+        self.heads = heads
+        self.closed = False
+
+    def iter_lines(self):
+        while not self.closed:
+            head = self.heads.get()
+            if head is None:
+                return
+            yield json.dumps(head).encode()
+
+    def close(self):
+        self.closed = True
+        self.heads.put(None)
+
+
+class TestHeadMonitor(TestCase):
+    def setUp(self):
+        self.heads: Queue = Queue()
+        self.streams = []
+
+        def request(method, path, **kwargs):
+            self.assertEqual('monitor/heads/main', path)
+            stream = MockStream(self.heads)
+            self.streams.append(stream)
+            return stream
+
+        def get(path, params=None, **kwargs):
+            if path == '/chains/main/blocks':
+                blocks = chain if params['head'] in chain else fork
+                level = blocks.index(params['head'])
+                return [blocks[level - params['length'] + 1:level + 1][::-1]]
+            return make_head(10, chain[10], chain[9])
+
+        self.node = Mock(
+            request=Mock(side_effect=request),
+            get=Mock(side_effect=get),
+        )
+        self.shell = ShellQuery(self.node)
+
+    def test_wait_blocks(self):
+        blocks = self.shell.wait_blocks(chain[10], max_blocks=3, time_between_blocks=0, block_timeout=5, stream=True)
+        self.heads.put(make_head(10, chain[10], chain[9]))
+        self.heads.put(make_head(11, chain[11], chain[10]))
+        self.assertEqual(chain[11], next(blocks))
+        self.heads.put(make_head(13, chain[13], chain[12]))
+        self.assertEqual([chain[12], chain[13]], list(blocks))  # skipped level is filled in
+        self.assertTrue(any(f'blocks/{chain[10]}/header' in str(call) for call in self.node.get.call_args_list))
+
+    def test_shared_stream(self):
+        monitor = HeadMonitor.get(self.node)
+        self.assertIs(monitor, HeadMonitor.get(self.node))
+        with monitor.subscription(), monitor.subscription():
+            self.heads.put(make_head(11, chain[11], chain[10]))
+            self.assertEqual(chain[11], monitor.wait_for(lambda x: x['level'] == 11, timeout=5)['hash'])
+        self.assertEqual(1, len(self.streams))
+        self.assertTrue(self.streams[0].closed)
+
+    def test_reorg(self):
+        self.heads.put(make_head(11, fork[11], fork[10]))
+        with self.assertRaises(RuntimeError):
+            list(self.shell.wait_blocks(chain[10], max_blocks=1, time_between_blocks=0, block_timeout=5, stream=True))
+
+    def test_reorg_level_jump(self):
+        self.heads.put(make_head(12, fork[12], fork[11]))
+        with self.assertRaises(RuntimeError):
+            list(self.shell.wait_blocks(chain[10], max_blocks=2, time_between_blocks=0, block_timeout=5, stream=True))
+
+    def test_timeout(self):
+        with self.assertRaises(TimeoutError):
+            list(self.shell.wait_blocks(chain[10], max_blocks=1, time_between_blocks=0, block_timeout=0.1, stream=True))